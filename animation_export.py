@@ -0,0 +1,203 @@
+"""
+Arama animasyonlarının ekransız (headless) dışa aktarımı
+Kullanım: python animation_export.py cikti.gif [heuristic] [süre_saniye]
+
+matplotlib kullanılmaz: kareler doğrudan GridFrameBuffer renk tamponundan
+sabit bir palet ile oluşturulur ve tek tek kodlayıcıya yazılır; hiçbir
+kare bellekte biriktirilmez.
+    .gif: Pillow'un kare kodlayıcısı ile akış halinde GIF
+    diğer uzantılar (.mp4, .webm, ...): ffmpeg'e pipe üzerinden ham RGB
+"""
+
+import math
+import shutil
+import subprocess
+import sys
+import numpy as np
+from frame_buffer import GridFrameBuffer
+
+
+# Renk adı -> palet indeksi (GridFrameBuffer değerleri doğrudan palet indeksidir)
+COLOR_VALUES = {
+    'empty': 0, 'wall': 1, 'start': 2, 'goal': 3,
+    'explored': 4, 'frontier': 5, 'current': 6,
+    'path': 7, 'considering': 8
+}
+
+# RealtimeAStarVisualizer renkleri, saydamlar beyaz üzerine karıştırılmış
+PALETTE = np.array([
+    (242, 242, 242),  # empty
+    (26, 26, 26),     # wall
+    (0, 204, 0),      # start
+    (204, 0, 0),      # goal
+    (255, 255, 77),   # explored
+    (255, 153, 51),   # frontier
+    (255, 0, 255),    # current
+    (0, 0, 255),      # path
+    (102, 255, 255),  # considering
+], dtype=np.uint8)
+
+
+class GifStreamWriter:
+    """Kareleri palet indeksli olarak tek tek yazan GIF yazıcı"""
+    
+    def __init__(self, filename, width, height, fps, palette=PALETTE):
+        from PIL import Image, GifImagePlugin
+        self._image = Image
+        self._gif = GifImagePlugin
+        self.width = width
+        self.height = height
+        # GIF gecikmesi 10 ms hassasiyetinde
+        self.duration = max(20, int(round(100 / fps)) * 10)
+        self.palette = bytes(np.asarray(palette, dtype=np.uint8).reshape(-1))
+        self.file = open(filename, 'wb')
+        self.header_written = False
+    
+    def _frame_image(self, frame):
+        image = self._image.frombuffer('P', (self.width, self.height),
+                                       np.ascontiguousarray(frame, dtype=np.uint8), 'raw', 'P', 0, 1)
+        image.putpalette(self.palette)
+        return image
+    
+    def write(self, frame):
+        """(height, width) palet indeksi dizisini bir kare olarak yaz"""
+        image = self._frame_image(frame)
+        if not self.header_written:
+            header, _ = self._gif.getheader(image, info={'loop': 0, 'optimize': False})
+            for chunk in header:
+                self.file.write(chunk)
+            self.header_written = True
+        for chunk in self._gif.getdata(image, duration=self.duration, disposal=1):
+            self.file.write(chunk)
+    
+    def close(self):
+        self.file.write(b';')  # GIF trailer
+        self.file.close()
+
+
+class FFmpegWriter:
+    """Kareleri ham RGB olarak ffmpeg sürecine pipe ile aktaran yazıcı"""
+    
+    def __init__(self, filename, width, height, fps, palette=PALETTE):
+        ffmpeg = shutil.which('ffmpeg')
+        if ffmpeg is None:
+            raise RuntimeError(f"{filename} için ffmpeg gerekli (GIF için gerekmez)")
+        self.palette = np.asarray(palette, dtype=np.uint8)
+        # yuv420p çift boyut ister; gerekirse sağ / alt kenara 1 piksel eklenir
+        self.process = subprocess.Popen(
+            [ffmpeg, '-y', '-loglevel', 'error',
+             '-f', 'rawvideo', '-pix_fmt', 'rgb24', '-s', f'{width}x{height}', '-r', str(fps),
+             '-i', '-',
+             '-vf', 'pad=ceil(iw/2)*2:ceil(ih/2)*2', '-pix_fmt', 'yuv420p',
+             filename],
+            stdin=subprocess.PIPE
+        )
+    
+    def write(self, frame):
+        """(height, width) palet indeksi dizisini bir kare olarak yaz"""
+        self.process.stdin.write(self.palette[frame].tobytes())
+    
+    def close(self):
+        self.process.stdin.close()
+        if self.process.wait() != 0:
+            raise RuntimeError(f"ffmpeg hata ile sonlandı (kod {self.process.returncode})")
+
+
+def open_writer(filename, width, height, fps):
+    """Dosya uzantısına göre kare yazıcı oluştur"""
+    if filename.lower().endswith('.gif'):
+        return GifStreamWriter(filename, width, height, fps)
+    return FFmpegWriter(filename, width, height, fps)
+
+
+def count_steps(astar):
+    """Aramayı kaydetmeden çalıştırıp adım sayısını döndür"""
+    return sum(1 for event in astar.iter_steps() if event.action != 'begin')
+
+
+def export_search_animation(astar, filename, fps=30, duration=None, frame_skip=1,
+                            cell_size=4, hold_seconds=1.0, show_considering=False):
+    """
+    astar'ın grafındaki aramayı animasyon dosyasına yaz
+    
+    Args:
+        astar: AStar (ya da alt sınıfı) nesnesi
+        filename: Çıktı dosyası (.gif ya da ffmpeg'in desteklediği bir uzantı)
+        fps: Saniyedeki kare sayısı
+        duration: Hedef süre (saniye). Verilirse frame_skip adım sayısına
+            göre hesaplanır (arama bir kez kayıtsız çalıştırılıp sayılır)
+        frame_skip: Kaç adımda bir kare yazılacağı
+        cell_size: Bir hücrenin piksel boyutu
+        hold_seconds: Son durumun (bulunan yol) ekranda kalma süresi
+        show_considering: Bakılan komşular gösterilsin mi
+    
+    Returns:
+        dict: frames, total_steps, frame_skip, path_found, stats
+    """
+    graph = astar.graph
+    if not graph.start_node or not graph.goal_node:
+        raise ValueError("Başlangıç veya hedef düğüm belirlenmemiş")
+    
+    hold_frames = max(1, int(round(hold_seconds * fps)))
+    if duration is not None:
+        step_frames = max(1, int(duration * fps) - hold_frames)
+        frame_skip = math.ceil(count_steps(astar) / step_frames)
+    frame_skip = max(1, int(frame_skip))
+    
+    frame_buffer = GridFrameBuffer(graph, COLOR_VALUES, show_considering)
+    writer = open_writer(filename, graph.width * cell_size, graph.height * cell_size, fps)
+    
+    def write_frame():
+        frame = frame_buffer.frame.astype(np.uint8)
+        if cell_size > 1:
+            frame = frame.repeat(cell_size, axis=0).repeat(cell_size, axis=1)
+        writer.write(frame)
+    
+    frames = 0
+    step = 0
+    try:
+        for event in astar.iter_steps():
+            if frame_buffer.apply(event) is None:
+                continue
+            step += 1
+            if step % frame_skip == 0:
+                write_frame()
+                frames += 1
+        
+        # Atlanan son adım da gösterilsin
+        if step % frame_skip:
+            write_frame()
+            frames += 1
+        
+        path, success, stats = astar.last_result
+        if success:
+            frame_buffer.show_path(path)
+        for _ in range(hold_frames):
+            write_frame()
+            frames += 1
+    finally:
+        writer.close()
+    
+    return {
+        'frames': frames,
+        'total_steps': step,
+        'frame_skip': frame_skip,
+        'path_found': success,
+        'stats': stats
+    }
+
+
+if __name__ == '__main__':
+    import random
+    from astar import AStar
+    from main_realtime import create_maze_graph
+    
+    output = sys.argv[1] if len(sys.argv) > 1 else 'astar_search.gif'
+    heuristic_name = sys.argv[2] if len(sys.argv) > 2 else 'octile'
+    target_duration = float(sys.argv[3]) if len(sys.argv) > 3 else 10.0
+    
+    random.seed(42)
+    result = export_search_animation(AStar(create_maze_graph(), heuristic_name), output,
+                                     duration=target_duration)
+    print(f"{output}: {result['frames']} kare, {result['total_steps']} adım, "
+          f"her {result['frame_skip']} adımda bir kare")
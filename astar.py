@@ -3,25 +3,70 @@ A* Pathfinding Algoritması
 Hazır fonksiyon kullanmadan yazılmıştır
 """
 
-import heapq
+import asyncio
+from array import array
+import numpy as np
+from graph import GridPoint, ReverseGraphView, UNTOUCHED, OPEN, CLOSED
 from heuristics import HeuristicSelector
+from open_set import OPEN_SET_TYPES, create_open_set
+from step_log import StepLog, StepEvent, BEGIN
+
+
+INFINITY = float('inf')
+
+# Bütün grid h alanı, hücre başına bir skaler heuristic çağrısının yaklaşık
+# 1/50'si kadar sürer. 'auto' modda alan, start-goal Chebyshev mesafesi d
+# için hücre sayısı <= HEURISTIC_FIELD_RATIO * d² ise kullanılır (engelli
+# haritalarda arama kabaca d² mertebesinde düğüme dokunur).
+HEURISTIC_FIELD_RATIO = 25
+
+
+def drain_steps(events, steps=None):
+    """
+    Arama olay üretecini sonuna kadar çalıştır
+    
+    Args:
+        events: _search üreteci (StepEvent üretir, sonucu return eder)
+        steps: Olayların kaydedileceği StepLog (None ise olaylar atılır)
+    
+    Returns:
+        tuple: (path, success, stats)
+    """
+    while True:
+        try:
+            event = next(events)
+        except StopIteration as stop:
+            return stop.value
+        if steps is not None:
+            steps.add(event)
 
 
 class AStar:
     """A* algoritması sınıfı"""
     
-    def __init__(self, graph, heuristic_name='euclidean'):
+    def __init__(self, graph, heuristic_name='euclidean', open_set='auto'):
         self.graph = graph
-        self.heuristic_selector = HeuristicSelector()
-        self.heuristic_func = self.heuristic_selector.get_heuristic(heuristic_name)
-        self.heuristic_name = heuristic_name
+        self.heuristic_selector = HeuristicSelector(graph)
+        self.change_heuristic(heuristic_name)
+        
+        # Open set tipi: 'auto' veya OPEN_SET_TYPES anahtarlarından biri
+        # (bkz. open_set.py). 'auto': lazy heap (bucket kuyruğu ölçülebilir
+        # bir kazanç sağlamadığı için otomatik seçilmez)
+        if open_set != 'auto' and open_set not in OPEN_SET_TYPES:
+            raise ValueError(f"Bilinmeyen open set tipi: {open_set}")
+        self.open_set_type = open_set
         
         # Algoritma istatistikleri
         self.nodes_explored = 0
         self.nodes_in_open = 0
         self.path_length = 0
-        self.algorithm_steps = []
+        self.algorithm_steps = StepLog(graph)
         self.is_path_found = False
+        self.last_result = None  # Son find_path / iter_steps sonucu
+        self.path_cache = None  # İsteğe bağlı PathCache (bkz. path_cache.py)
+        self.component_index = None  # İsteğe bağlı ComponentIndex (bkz. components.py)
+        self.use_heuristic_field = 'auto'  # True / False / 'auto' (bkz. heuristic_field)
+        self.heuristic_cache = None  # İsteğe bağlı HeuristicFieldCache (bkz. heuristic_cache.py)
         
         # Animasyon için
         self.step_by_step = False
@@ -32,7 +77,7 @@ class AStar:
         self.nodes_explored = 0
         self.nodes_in_open = 0
         self.path_length = 0
-        self.algorithm_steps = []
+        self.algorithm_steps = StepLog(self.graph)
         self.is_path_found = False
         self.current_step = 0
     
@@ -40,14 +85,15 @@ class AStar:
         """Heuristic değeri hesapla"""
         return self.heuristic_func(node, goal)
     
-    def reconstruct_path(self, goal_node):
-        """Yolu yeniden oluştur"""
-        path = []
-        current = goal_node
+    def reconstruct_path(self, parents, goal_index):
+        """Yolu parent dizisinden yeniden oluştur"""
+        graph = self.graph
         
-        while current is not None:
-            path.append(current)
-            current = current.parent
+        path = []
+        index = goal_index
+        while index != -1:
+            path.append(graph.node_at(index))
+            index = parents[index]
         
         path.reverse()
         return path
@@ -67,113 +113,218 @@ class AStar:
         
         self.step_by_step = step_by_step
         self.reset_stats()
-        self.graph.reset_all_nodes()
         
-        start = self.graph.start_node
-        goal = self.graph.goal_node
+        if self.path_cache is not None and not step_by_step:
+            path, success, stats = self.path_cache.search(self, self.graph.start_node,
+                                                          self.graph.goal_node)
+        else:
+            path, success, stats = self.search(self.graph.start_node, self.graph.goal_node,
+                                               step_by_step, self.algorithm_steps)
+        
+        self.nodes_explored = stats['nodes_explored']
+        self.nodes_in_open = stats['nodes_in_open']
+        self.path_length = stats['path_length']
+        self.is_path_found = success
+        self.last_result = (path, success, stats)
+        
+        return path, success, stats
+    
+    async def find_path_async(self, start, goal):
+        """search() fonksiyonunu ayrı bir thread'de çalıştır (asyncio için)"""
+        return await asyncio.to_thread(self.search, start, goal)
+    
+    def search(self, start, goal, step_by_step=False, steps=None):
+        """
+        start -> goal arası yol ara
+        
+        Arama durumu (g, parent, open/closed set) sadece bu çağrıya ayrılmış
+        scratch dizilerinde tutulur; graf ve AStar nesnesi değiştirilmez. Bu
+        yüzden aynı graf üzerinde birden fazla thread aynı anda arama yapabilir.
+        component_index ayarlıysa farklı bileşenlerdeki start / goal için
+        arama yapılmadan boş sonuç döner (adım kaydı istenmediğinde).
+        
+        Args:
+            start, goal: x ve y özellikleri olan nesneler (Node, GridPoint)
+            step_by_step: Adımları kaydet
+            steps: Adımların kaydedileceği StepLog (step_by_step için)
+        
+        Returns:
+            tuple: (path, success, stats)
+        """
+        if (not step_by_step and self.component_index is not None
+                and not self.component_index.connected(start, goal)):
+            return [], False, self._make_stats(0, 0, 0, False, 0)
+        if step_by_step and steps is None:
+            steps = StepLog(self.graph)
+        return drain_steps(self._iter_search(start, goal, step_by_step), steps)
+    
+    def iter_steps(self, start=None, goal=None):
+        """
+        Arama adımlarını arama ilerledikçe StepEvent olarak üret
+        
+        Adımlar saklanmaz; bellek kullanımı adım sayısından bağımsızdır.
+        Adım sözlükleri için step_log.StepTracker kullanılabilir. Üreteç
+        tükendiğinde sonuç (path, success, stats) üretecin dönüş değeridir
+        ve last_result'a yazılır. start / goal verilmezse grafın başlangıç
+        ve hedef düğümleri kullanılır.
+        """
+        if start is None:
+            start = self.graph.start_node
+        if goal is None:
+            goal = self.graph.goal_node
+        if not start or not goal:
+            self.last_result = ([], False, "Başlangıç veya hedef düğüm belirlenmemiş")
+            return self.last_result
         
-        # Open set (keşfedilecek düğümler) - Priority Queue
-        open_set = []
-        heapq.heappush(open_set, start)
+        self.last_result = yield from self._iter_search(start, goal, True)
+        return self.last_result
+    
+    def _iter_search(self, start, goal, step_by_step):
+        """Scratch dizilerini ayırıp _search üretecini çalıştır"""
+        scratch = self.graph.acquire_scratch()
+        try:
+            return (yield from self._search(scratch, start, goal, step_by_step))
+        finally:
+            self.graph.release_scratch(scratch)
+    
+    def _search(self, scratch, start, goal, step_by_step):
+        """
+        search() gövdesi - nesil damgalı scratch dizileri üzerinde çalışır
         
-        # Closed set (keşfedilmiş düğümler) - Set olarak
-        closed_set = set()
+        Üreteçtir: step_by_step ise her adımda bir StepEvent üretir, sonucu
+        (path, success, stats) return eder (bkz. drain_steps).
+        """
+        graph = self.graph
+        width = graph.width
+        heuristic = self.heuristic_func
+        neighbor_indices = graph.neighbor_indices
         
-        # Başlangıç düğümünü ayarla
-        start.g_cost = 0
-        start.h_cost = self.calculate_heuristic(start, goal)
-        start.f_cost = start.g_cost + start.h_cost
-        start.in_open_set = True
+        start_index = start.y * width + start.x
+        goal_index = goal.y * width + goal.x
+        if step_by_step:
+            yield StepEvent(-1, 0, 0, BEGIN, (), [start_index], False, None)
         
+        # Uzun aramalarda h değerleri bütün grid için bir kerede hesaplanır
+        h_field = self._search_heuristic_field(start, goal)
+        
+        # Sorguya özel arama durumu: damgası bu sorgunun nesli olmayan
+        # düğümler sıfırlanmış sayılır, tüm grid'i sıfırlamaya gerek yok
+        generation = scratch.begin()
+        stamps = scratch.stamps
+        g_costs = scratch.g_costs
+        parents = scratch.parents
+        states = scratch.states  # 0: dokunulmadı, 1: open set, 2: closed set
+        
+        stamps[start_index] = generation
+        g_costs[start_index] = 0
+        parents[start_index] = -1
+        states[start_index] = OPEN
+        
+        # Open set (keşfedilecek düğümler) - Priority Queue, (f, h, indeks)
+        start_h = h_field[start_index] if h_field is not None else heuristic(start, goal)
+        open_set = create_open_set(self.resolve_open_set_type())
+        open_set.push(start_index, start_h, start_h)
+        
+        nodes_explored = 0
+        nodes_in_open = 0
         step_count = 0
+        pushed = None
         
         while open_set:
-            step_count += 1
-            
             # En düşük f_cost'lu düğümü al
-            current = heapq.heappop(open_set)
-            current.in_open_set = False
+            f_cost, h_cost, current = open_set.pop()
             
             # Hedefe ulaştık mı?
-            if current == goal:
-                self.is_path_found = True
-                path = self.reconstruct_path(current)
-                self.path_length = len(path)
+            if current == goal_index:
+                path = self.reconstruct_path(parents, goal_index)
                 
                 # Son adımı kaydet
-                if self.step_by_step:
-                    self.algorithm_steps.append({
-                        'step': step_count,
-                        'current': current,
-                        'action': 'goal_reached',
-                        'path': path,
-                        'open_set': list(open_set),
-                        'closed_set': closed_set.copy()
-                    })
+                if step_by_step:
+                    step_count += 1
+                    yield StepEvent(current, g_costs[current], h_cost, 'goal_reached',
+                                    (), (), False, path)
                 
-                return path, True, self.get_stats()
+                stats = self._make_stats(nodes_explored, nodes_in_open, len(path), True, step_count)
+                return path, True, stats
             
             # Current'ı closed set'e ekle
-            closed_set.add(current)
-            current.visited = True
-            self.nodes_explored += 1
+            states[current] = CLOSED
+            nodes_explored += 1
+            current_g = g_costs[current]
+            if step_by_step:
+                pushed = []
             
             # Komşuları kontrol et
-            neighbors = self.graph.get_neighbors(current)
+            neighbors = neighbor_indices(current)
             
-            for neighbor in neighbors:
+            for neighbor, cost in neighbors:
+                # Bu sorguda ilk kez mi dokunuluyor?
+                if stamps[neighbor] != generation:
+                    stamps[neighbor] = generation
+                    g_costs[neighbor] = INFINITY
+                    states[neighbor] = UNTOUCHED
                 # Zaten keşfedilmiş mi?
-                if neighbor in closed_set:
+                elif states[neighbor] == CLOSED:
                     continue
                 
                 # Yeni g_cost hesapla
-                tentative_g_cost = current.g_cost + self.graph.get_distance(current, neighbor)
+                tentative_g_cost = current_g + cost
                 
                 # Bu yol daha iyi mi?
-                if tentative_g_cost < neighbor.g_cost:
+                if tentative_g_cost < g_costs[neighbor]:
                     # Yolu güncelle
-                    neighbor.parent = current
-                    neighbor.g_cost = tentative_g_cost
-                    neighbor.h_cost = self.calculate_heuristic(neighbor, goal)
-                    neighbor.f_cost = neighbor.g_cost + neighbor.h_cost
+                    parents[neighbor] = current
+                    g_costs[neighbor] = tentative_g_cost
+                    
+                    if h_field is not None:
+                        neighbor_h = h_field[neighbor]
+                    else:
+                        y, x = divmod(neighbor, width)
+                        neighbor_h = heuristic(GridPoint(x, y), goal)
                     
-                    # Open set'te değilse ekle
-                    if not neighbor.in_open_set:
-                        heapq.heappush(open_set, neighbor)
-                        neighbor.in_open_set = True
-                        self.nodes_in_open += 1
+                    # Open set'e ekle ya da önceliğini düşür (decrease-key)
+                    open_set.push(neighbor, tentative_g_cost + neighbor_h, neighbor_h)
+                    if states[neighbor] != OPEN:
+                        states[neighbor] = OPEN
+                        nodes_in_open += 1
+                    if pushed is not None:
+                        pushed.append(neighbor)
             
-            # Adım adım modda step bilgisi kaydet
-            if self.step_by_step:
-                self.algorithm_steps.append({
-                    'step': step_count,
-                    'current': current,
-                    'action': 'exploring',
-                    'neighbors': neighbors,
-                    'open_set': list(open_set),
-                    'closed_set': closed_set.copy(),
-                    'open_count': len(open_set),
-                    'closed_count': len(closed_set)
-                })
+            # Adım adım modda sadece değişiklikleri üret (bkz. step_log.py)
+            if step_by_step:
+                step_count += 1
+                yield StepEvent(current, current_g, h_cost, 'exploring',
+                                [i for i, _ in neighbors], pushed, True, None)
         
         # Yol bulunamadı
-        return [], False, self.get_stats()
+        return [], False, self._make_stats(nodes_explored, nodes_in_open, 0, False, step_count)
     
-    def get_stats(self):
-        """Algoritma istatistiklerini döndür"""
+    def resolve_open_set_type(self):
+        """Bu arama için kullanılacak open set tipini döndür"""
+        if self.open_set_type != 'auto':
+            return self.open_set_type
+        return 'lazy'
+    
+    def _make_stats(self, nodes_explored, nodes_in_open, path_length, path_found, total_steps):
+        """İstatistik sözlüğü oluştur"""
         return {
-            'nodes_explored': self.nodes_explored,
-            'nodes_in_open': self.nodes_in_open,
-            'path_length': self.path_length,
+            'nodes_explored': nodes_explored,
+            'nodes_in_open': nodes_in_open,
+            'path_length': path_length,
             'heuristic_used': self.heuristic_name,
-            'path_found': self.is_path_found,
-            'total_steps': len(self.algorithm_steps)
+            'path_found': path_found,
+            'total_steps': total_steps
         }
     
+    def get_stats(self):
+        """Algoritma istatistiklerini döndür"""
+        return self._make_stats(self.nodes_explored, self.nodes_in_open, self.path_length,
+                                self.is_path_found, len(self.algorithm_steps))
+    
     def get_step_info(self, step_index):
-        """Belirli bir adımın bilgisini döndür"""
+        """Belirli bir adımın bilgisini döndür (open / closed set replay ile oluşturulur)"""
         if 0 <= step_index < len(self.algorithm_steps):
-            return self.algorithm_steps[step_index]
+            return self.algorithm_steps.get_step_info(step_index)
         return None
     
     def get_total_steps(self):
@@ -181,9 +332,66 @@ class AStar:
         return len(self.algorithm_steps)
     
     def change_heuristic(self, heuristic_name):
-        """Heuristic fonksiyonu değiştir"""
-        self.heuristic_func = self.heuristic_selector.get_heuristic(heuristic_name)
+        """
+        Heuristic fonksiyonu değiştir
+        
+        Heuristic grafın maliyet modeline (graph.straight_cost / diagonal_cost)
+        ölçeklenir; bu modelde admissible değilse RuntimeWarning verilir.
+        """
+        costs = (self.graph.straight_cost, self.graph.diagonal_cost)
+        self.set_heuristic_functions(self.heuristic_selector.get_heuristic(heuristic_name, costs),
+                                     self.heuristic_selector.get_batch_heuristic(heuristic_name, costs))
         self.heuristic_name = heuristic_name
+        self.heuristic_weight = 1  # Bkz. AStarVariant.apply_weight
+        self.heuristic_is_integral = self.heuristic_selector.is_integral(heuristic_name, costs)
+        self.heuristic_selector.warn_if_inadmissible(heuristic_name, costs)
+    
+    def set_heuristic_functions(self, func, batch=None):
+        """
+        Heuristic'in skaler ve (varsa) toplu biçimini birlikte ayarla
+        
+        heuristic_func sonradan tek başına değiştirilirse toplu biçim ona
+        uymayacağı için h alanı kullanılmaz.
+        """
+        self.heuristic_func = func
+        self.batch_heuristic = batch
+        self._batch_pair = (func, batch)
+    
+    def heuristic_field(self, goal):
+        """
+        Bütün grid için goal'e heuristic değerleri (toplu biçimle tek seferde)
+        
+        Returns:
+            array: indeks = y * width + x (tamsayı heuristic'te 'q', değilse
+            'd'); toplu biçim yoksa None
+        """
+        if self.batch_heuristic is None or self._batch_pair != (self.heuristic_func,
+                                                                 self.batch_heuristic):
+            return None
+        xs, ys = self.graph.coordinate_arrays()
+        values = self.batch_heuristic(xs, ys, goal.x, goal.y)
+        if self.heuristic_is_integral:
+            return array('q', np.asarray(values, dtype=np.int64).tobytes())
+        return array('d', np.asarray(values, dtype=np.float64).tobytes())
+    
+    def _search_heuristic_field(self, start, goal):
+        """
+        Bu arama için h alanı ya da None
+        
+        Önbellek ayarlıysa alan hedef başına bir kez hesaplanır ve mesafeden
+        bağımsız kullanılır; değilse use_heuristic_field ve
+        HEURISTIC_FIELD_RATIO'ya göre karar verilir.
+        """
+        mode = self.use_heuristic_field
+        if not mode:
+            return None
+        if self.heuristic_cache is not None:
+            return self.heuristic_cache.field(self, goal)
+        if mode == 'auto':
+            distance = max(abs(start.x - goal.x), abs(start.y - goal.y))
+            if self.graph.width * self.graph.height > HEURISTIC_FIELD_RATIO * distance * distance:
+                return None
+        return self.heuristic_field(goal)
     
     def get_available_heuristics(self):
         """Kullanılabilir heuristic'leri döndür"""
@@ -191,7 +399,214 @@ class AStar:
     
     def compare_heuristics_at_node(self, node, goal):
         """Bir düğümde tüm heuristic'leri karşılaştır"""
-        return self.heuristic_selector.compare_heuristics(node, goal)
+        costs = (self.graph.straight_cost, self.graph.diagonal_cost)
+        return self.heuristic_selector.compare_heuristics(node, goal, costs)
+
+
+class BidirectionalAStar(AStar):
+    """
+    Bidirectional A* - NBA* (New Bidirectional A*, Pijls & Post)
+    
+    İleri arama start'tan goal'a, geri arama ReverseGraphView üzerinde
+    goal'dan start'a ilerler. Her adımda open set'i küçük olan taraf
+    genişletilir. L en iyi bulunan yol maliyeti, F diğer tarafın en küçük
+    f değeri olmak üzere g(x) + h(x) >= L ya da g(x) + F - h_diğer(x) >= L
+    olan düğümler genişletilmeden elenir. Her iki taraftan biri tükendiğinde
+    (ya da en küçük f değeri L'ye ulaştığında) L optimaldir (tutarlı
+    heuristic için).
+    
+    Not: create_maze_graph labirentlerinde ve octile ile NBA* tek yönlü
+    A*'dan daha az düğüm genişletmez (yaklaşık %5-15 fazla) ve daha
+    yavaştır; iki taraf genelde ortada değil, heuristic'in zayıf olduğu
+    bölgelerde buluşur. Kazanç sadece zayıf heuristic'lerde (örn.
+    rastgele engelli haritada euclidean, ~%10 daha az düğüm) görülür.
+    Bkz. benchmarks.run_bidirectional_benchmark.
+    """
+    
+    def __init__(self, graph, heuristic_name='euclidean', open_set='auto'):
+        super().__init__(graph, heuristic_name, open_set)
+        self.reverse_graph = ReverseGraphView(graph)
+        self.nodes_explored_forward = 0
+        self.nodes_explored_backward = 0
+    
+    def find_path(self, step_by_step=False):
+        """Bkz. AStar.find_path"""
+        result = super().find_path(step_by_step)
+        if isinstance(result[2], dict):
+            self.nodes_explored_forward = result[2].get('nodes_explored_forward', 0)
+            self.nodes_explored_backward = result[2].get('nodes_explored_backward', 0)
+        return result
+    
+    def _iter_search(self, start, goal, step_by_step):
+        """Bkz. AStar._iter_search - her yön için ayrı scratch dizileri"""
+        forward_scratch = self.graph.acquire_scratch()
+        backward_scratch = self.graph.acquire_scratch()
+        try:
+            return (yield from self._bidirectional_search(forward_scratch, backward_scratch,
+                                                          start, goal, step_by_step))
+        finally:
+            self.graph.release_scratch(backward_scratch)
+            self.graph.release_scratch(forward_scratch)
+    
+    def _bidirectional_search(self, forward_scratch, backward_scratch, start, goal,
+                              step_by_step):
+        graph = self.graph
+        width = graph.width
+        heuristic = self.heuristic_func
+        
+        start_index = start.y * width + start.x
+        goal_index = goal.y * width + goal.x
+        if step_by_step:
+            yield StepEvent(-1, 0, 0, BEGIN, (), [start_index, goal_index], False, None)
+        
+        # Her yön: (scratch dizileri, open set, hedef noktası, komşu fonksiyonu, h alanı)
+        sides = []
+        for scratch, source, target, view in ((forward_scratch, start, goal, graph),
+                                              (backward_scratch, goal, start, self.reverse_graph)):
+            origin = source.y * width + source.x
+            generation = scratch.begin()
+            scratch.stamps[origin] = generation
+            scratch.g_costs[origin] = 0
+            scratch.parents[origin] = -1
+            scratch.states[origin] = OPEN
+            
+            # h alanı AStar'daki gibi seçilir; geri tarafın hedefi start
+            h_field = self._search_heuristic_field(source, target)
+            origin_h = h_field[origin] if h_field is not None else heuristic(source, target)
+            open_set = create_open_set(self.resolve_open_set_type())
+            open_set.push(origin, origin_h, origin_h)
+            sides.append((scratch, generation, open_set, target, view.neighbor_indices, h_field))
+        
+        best_cost = INFINITY  # L
+        meeting = -1
+        explored = [0, 0]
+        nodes_in_open = 0
+        step_count = 0
+        pushed = None
+        
+        def remove(index):
+            """
+            Düğümü her iki taraf için de kapat (NBA*'daki M kümesi)
+            
+            Bir taraftaki CLOSED durumu sadece burada verildiği için "düğüm
+            elendi mi" sorusu tek tarafın durumuna bakılarak cevaplanır.
+            """
+            for scratch, generation, _, _, _, _ in sides:
+                if scratch.stamps[index] != generation:
+                    scratch.stamps[index] = generation
+                    scratch.g_costs[index] = INFINITY
+                    scratch.parents[index] = -1
+                scratch.states[index] = CLOSED
+        
+        forward_open = sides[0][2]
+        backward_open = sides[1][2]
+        while True:
+            forward_size = len(forward_open)
+            backward_size = len(backward_open)
+            if not (forward_size and backward_size):
+                break
+            side = 0 if forward_size <= backward_size else 1
+            scratch, generation, open_set, target, neighbor_indices, h_field = sides[side]
+            other_scratch, other_generation, other_open, other_target, _, other_h_field = sides[1 - side]
+            
+            # Bu taraftaki en küçük f >= L: kalan her düğüm elenecek, L optimal
+            if open_set.peek_priority() >= best_cost:
+                break
+            
+            stamps = scratch.stamps
+            states = scratch.states
+            g_costs = scratch.g_costs
+            
+            f_cost, h_cost, current = open_set.pop()
+            if states[current] == CLOSED and stamps[current] == generation:
+                continue
+            
+            current_g = g_costs[current]
+            neighbors = []
+            if step_by_step:
+                pushed = []
+            
+            # NBA* eleme koşulu (diğer tarafın heuristic'i sadece gerekirse)
+            if current_g + h_cost < best_cost:
+                if other_h_field is not None:
+                    other_h = other_h_field[current]
+                else:
+                    y, x = divmod(current, width)
+                    other_h = heuristic(GridPoint(x, y), other_target)
+                if current_g + other_open.peek_priority() - other_h < best_cost:
+                    explored[side] += 1
+                    neighbors = neighbor_indices(current)
+            
+            other_stamps = other_scratch.stamps
+            other_g_costs = other_scratch.g_costs
+            for neighbor, cost in neighbors:
+                if stamps[neighbor] != generation:
+                    stamps[neighbor] = generation
+                    g_costs[neighbor] = INFINITY
+                    states[neighbor] = UNTOUCHED
+                elif states[neighbor] == CLOSED:
+                    continue
+                
+                tentative_g_cost = current_g + cost
+                if tentative_g_cost < g_costs[neighbor]:
+                    scratch.parents[neighbor] = current
+                    g_costs[neighbor] = tentative_g_cost
+                    if h_field is not None:
+                        neighbor_h = h_field[neighbor]
+                    else:
+                        neighbor_y, neighbor_x = divmod(neighbor, width)
+                        neighbor_h = heuristic(GridPoint(neighbor_x, neighbor_y), target)
+                    open_set.push(neighbor, tentative_g_cost + neighbor_h, neighbor_h)
+                    if states[neighbor] != OPEN:
+                        states[neighbor] = OPEN
+                        nodes_in_open += 1
+                    if pushed is not None:
+                        pushed.append(neighbor)
+                    
+                    # İki arama bu düğümde buluşuyor mu?
+                    if other_stamps[neighbor] == other_generation:
+                        total = tentative_g_cost + other_g_costs[neighbor]
+                        if total < best_cost:
+                            best_cost = total
+                            meeting = neighbor
+            
+            remove(current)
+            if step_by_step:
+                step_count += 1
+                yield StepEvent(current, current_g, h_cost,
+                                'exploring_forward' if side == 0 else 'exploring_backward',
+                                [i for i, _ in neighbors], pushed, True, None)
+        
+        if start_index == goal_index:
+            best_cost, meeting = 0, start_index
+        
+        stats = self._make_stats(sum(explored), nodes_in_open, 0, False, step_count)
+        stats['nodes_explored_forward'] = explored[0]
+        stats['nodes_explored_backward'] = explored[1]
+        
+        if meeting == -1:
+            return [], False, stats
+        
+        # İleri yarı: meeting -> start, geri yarı: meeting -> goal
+        path = self.reconstruct_path(forward_scratch.parents, meeting)
+        index = backward_scratch.parents[meeting]
+        while index != -1:
+            path.append(graph.node_at(index))
+            index = backward_scratch.parents[index]
+        
+        stats['path_length'] = len(path)
+        stats['path_found'] = True
+        if step_by_step:
+            stats['total_steps'] = step_count + 1
+            yield StepEvent(goal_index, best_cost, 0, 'goal_reached', (), (), False, path)
+        return path, True, stats
+    
+    def get_stats(self):
+        """Algoritma istatistiklerini döndür (yön bazında keşif sayılarıyla)"""
+        stats = super().get_stats()
+        stats['nodes_explored_forward'] = self.nodes_explored_forward
+        stats['nodes_explored_backward'] = self.nodes_explored_backward
+        return stats
 
 
 class AStarVariant:
@@ -203,17 +618,35 @@ class AStarVariant:
         Weighted A* - Heuristic'i ağırlıklandır
         Weight > 1: Daha hızlı ama daha az optimal
         """
-        astar = AStar(graph, heuristic_name)
+        return AStarVariant.apply_weight(AStar(graph, heuristic_name), weight)
+    
+    @staticmethod
+    def apply_weight(astar, weight):
+        """
+        Var olan bir aramanın heuristic'ini weight ile çarp (yerinde)
         
-        # Orijinal heuristic fonksiyonunu sakla
+        Ağırlık astar.heuristic_weight'te tutulur (örn. paralel
+        karşılaştırmada işçi süreçte aynı varyantı kurmak için).
+        """
+        heuristic_name = astar.heuristic_name
+        
+        # Orijinal heuristic fonksiyonlarını sakla
         original_heuristic = astar.heuristic_func
+        original_batch = astar.batch_heuristic
         
         # Ağırlıklı heuristic fonksiyonu
         def weighted_heuristic(node1, node2):
             return weight * original_heuristic(node1, node2)
         
-        astar.heuristic_func = weighted_heuristic
+        def weighted_batch(xs, ys, goal_x, goal_y):
+            return weight * original_batch(xs, ys, goal_x, goal_y)
+        
+        astar.set_heuristic_functions(weighted_heuristic,
+                                      weighted_batch if original_batch is not None else None)
         astar.heuristic_name = f"weighted_{heuristic_name}_{weight}"
+        astar.heuristic_is_integral = (astar.heuristic_is_integral and
+                                       float(weight).is_integer())
+        astar.heuristic_weight *= weight
         
         return astar
     
@@ -221,11 +654,9 @@ class AStarVariant:
     def bidirectional_astar(graph, heuristic_name='euclidean'):
         """
         Bidirectional A* - Her iki yönden ara
-        (Basit implementasyon)
+        (NBA*, bkz. BidirectionalAStar)
         """
-        # Bu daha karmaşık bir algoritma, basitleştirilmiş versiyonu
-        forward_astar = AStar(graph, heuristic_name)
-        return forward_astar  # Şimdilik normal A* döndür
+        return BidirectionalAStar(graph, heuristic_name)
 
 
 # Utility fonksiyonları
@@ -278,8 +709,7 @@ def has_line_of_sight(node1, node2, graph):
     
     while True:
         # Mevcut pozisyonda duvar var mı?
-        current = graph.get_node(x, y)
-        if current and current.node_type == 'wall':
+        if graph.is_wall(x, y):
             return False
         
         if x == node2.x and y == node2.y:
@@ -0,0 +1,202 @@
+"""
+Toplu (many-to-many) yol sorguları
+
+Sorgular graf üzerindeki start / goal düğümlerini değiştirmeden, koordinat
+dizileri olarak verilir. Aynı başlangıçtan çıkan sorgular gruplanır:
+    tek hedefli grup: A* (AStar.search)
+    çok hedefli grup: başlangıçtan tek bir Dijkstra ağacı; bütün hedefler
+        kapandığında arama durur ve yollar aynı parent dizisinden çıkarılır
+Gruplar istenirse işçi süreçlere dağıtılır (bkz. parallel_compare.graph_worker_pool).
+Bileşen indeksi verilirse farklı bileşenlerdeki çiftler hiç aranmaz; bu
+özellikle çok hedefli Dijkstra ağaçlarının bütün bileşeni taramasını önler.
+"""
+
+import os
+import numpy as np
+from astar import AStar, path_cost, INFINITY
+from graph import GridPoint, WALL, UNTOUCHED, OPEN, CLOSED
+from open_set import create_open_set
+
+
+def dijkstra_tree(graph, source, targets):
+    """
+    source'tan Dijkstra ile targets'taki tüm hedeflere yol bul
+    
+    Args:
+        graph: Graf
+        source: Başlangıç hücresinin düz indeksi
+        targets: Hedef düz indeksleri
+    
+    Returns:
+        dict: hedef indeksi -> (yol indeksleri, maliyet); ulaşılamayan
+        hedefler için ([], INFINITY)
+    """
+    remaining = set(targets)
+    results = {target: ([], INFINITY) for target in remaining}
+    neighbor_indices = graph.neighbor_indices
+    
+    scratch = graph.acquire_scratch()
+    try:
+        generation = scratch.begin()
+        stamps = scratch.stamps
+        g_costs = scratch.g_costs
+        parents = scratch.parents
+        states = scratch.states
+        
+        stamps[source] = generation
+        g_costs[source] = 0
+        parents[source] = -1
+        states[source] = OPEN
+        
+        open_set = create_open_set('bucket' if graph.integer_costs else 'lazy')
+        open_set.push(source, 0, 0)
+        
+        while open_set and remaining:
+            current_g, _, current = open_set.pop()
+            states[current] = CLOSED
+            
+            if current in remaining:
+                remaining.discard(current)
+                path = []
+                index = current
+                while index != -1:
+                    path.append(index)
+                    index = parents[index]
+                path.reverse()
+                results[current] = (path, current_g)
+            
+            for neighbor, cost in neighbor_indices(current):
+                if stamps[neighbor] != generation:
+                    stamps[neighbor] = generation
+                    g_costs[neighbor] = INFINITY
+                    states[neighbor] = UNTOUCHED
+                elif states[neighbor] == CLOSED:
+                    continue
+                
+                tentative_g_cost = current_g + cost
+                if tentative_g_cost < g_costs[neighbor]:
+                    parents[neighbor] = current
+                    g_costs[neighbor] = tentative_g_cost
+                    open_set.push(neighbor, tentative_g_cost, 0)
+                    states[neighbor] = OPEN
+    finally:
+        graph.release_scratch(scratch)
+    
+    return results
+
+
+def solve_group(graph, astar, source, targets):
+    """
+    Aynı başlangıçlı sorgu grubunu çöz
+    
+    Returns:
+        dict: hedef indeksi -> (yol indeksleri, maliyet)
+    """
+    cells = graph.cells
+    width = graph.width
+    targets = set(targets)
+    if cells[source] == WALL:
+        return {target: ([], INFINITY) for target in targets}
+    
+    results = {target: ([], INFINITY) for target in targets if cells[target] == WALL}
+    open_targets = targets - results.keys()
+    
+    if len(open_targets) == 1:
+        target = open_targets.pop()
+        source_y, source_x = divmod(source, width)
+        target_y, target_x = divmod(target, width)
+        path, success, _ = astar.search(GridPoint(source_x, source_y), GridPoint(target_x, target_y))
+        if success:
+            results[target] = ([node.y * width + node.x for node in path], path_cost(path, graph))
+        else:
+            results[target] = ([], INFINITY)
+    elif open_targets:
+        results.update(dijkstra_tree(graph, source, open_targets))
+    return results
+
+
+def _solve_groups(graph, heuristic_name, open_set, groups):
+    """Grup listesini çöz: [(source, hedefler)] -> [sonuç sözlüğü]"""
+    astar = AStar(graph, heuristic_name, open_set)
+    return [solve_group(graph, astar, source, targets) for source, targets in groups]
+
+
+def _solve_groups_in_worker(heuristic_name, open_set, groups):
+    """İşçi süreçte _solve_groups (graf graph_worker_pool'dan)"""
+    from parallel_compare import worker_graph
+    return _solve_groups(worker_graph(), heuristic_name, open_set, groups)
+
+
+def find_paths(graph, starts, goals, heuristic_name='octile', open_set='auto',
+               max_workers=None, return_nodes=True, components=None):
+    """
+    Çok sayıda (start, goal) sorgusunu toplu olarak çöz
+    
+    Args:
+        graph: Graf (start_node / goal_node kullanılmaz ve değiştirilmez)
+        starts, goals: (n, 2) boyutlu (x, y) dizileri
+        heuristic_name: Tek hedefli gruplarda kullanılacak heuristic
+        open_set: AStar open set tipi
+        max_workers: İşçi süreç sayısı (None ya da 1: aynı süreçte çöz,
+            0: CPU sayısı kadar)
+        return_nodes: True ise yollar Node listeleri, False ise düz indeks listeleri
+        components: İsteğe bağlı ComponentIndex (bkz. components.py); farklı
+            bileşenlerdeki çiftler aramasız ulaşılamaz sayılır
+    
+    Returns:
+        tuple: (paths, costs) - paths[i] i. sorgunun yolu (yoksa []),
+        costs[i] maliyeti (numpy dizisi, yoksa inf)
+    """
+    starts = np.asarray(starts, dtype=np.int64).reshape(-1, 2)
+    goals = np.asarray(goals, dtype=np.int64).reshape(-1, 2)
+    if len(starts) != len(goals):
+        raise ValueError("starts ve goals aynı uzunlukta olmalı")
+    for points in (starts, goals):
+        if len(points) and ((points < 0).any() or (points[:, 0] >= graph.width).any() or
+                            (points[:, 1] >= graph.height).any()):
+            raise ValueError("Grid dışında koordinat")
+    
+    source_indices = (starts[:, 1] * graph.width + starts[:, 0]).tolist()
+    target_indices = (goals[:, 1] * graph.width + goals[:, 0]).tolist()
+    
+    if components is not None:
+        start_components = components.components_at(starts)
+        reachable = ((start_components >= 0) &
+                     (start_components == components.components_at(goals))).tolist()
+    else:
+        reachable = [True] * len(source_indices)
+    
+    # Başlangıca göre grupla (ilk görülme sırasıyla)
+    grouped = {}
+    for source, target, is_reachable in zip(source_indices, target_indices, reachable):
+        if is_reachable:
+            grouped.setdefault(source, set()).add(target)
+    groups = [(source, sorted(targets)) for source, targets in grouped.items()]
+    
+    if max_workers == 0:
+        max_workers = os.cpu_count() or 1
+    if max_workers and max_workers > 1 and len(groups) > 1:
+        from parallel_compare import graph_worker_pool
+        # Her işçiye birkaç parça düşecek şekilde böl (yük dengesi)
+        chunk_count = min(len(groups), max_workers * 4)
+        chunks = [groups[i::chunk_count] for i in range(chunk_count)]
+        with graph_worker_pool(graph, max_workers) as executor:
+            futures = [executor.submit(_solve_groups_in_worker, heuristic_name, open_set, chunk)
+                       for chunk in chunks]
+            chunk_results = [future.result() for future in futures]
+        group_results = {}
+        for chunk, results in zip(chunks, chunk_results):
+            for (source, _), result in zip(chunk, results):
+                group_results[source] = result
+    else:
+        results = _solve_groups(graph, heuristic_name, open_set, groups)
+        group_results = {source: result for (source, _), result in zip(groups, results)}
+    
+    paths = []
+    costs = np.empty(len(source_indices))
+    node_at = graph.node_at
+    for i, (source, target) in enumerate(zip(source_indices, target_indices)):
+        path, cost = group_results[source][target] if reachable[i] else ([], INFINITY)
+        paths.append([node_at(index) for index in path] if return_nodes else path)
+        costs[i] = cost
+    return paths, costs
@@ -0,0 +1,374 @@
+"""
+A* Performans Karşılaştırmaları (benchmark)
+Kullanım: python benchmarks.py
+"""
+
+import random
+import time
+import warnings
+import numpy as np
+from graph import Graph, WALL
+from astar import AStar, BidirectionalAStar, path_cost
+from jps import JumpPointSearch
+from dstar_lite import DStarLite
+from hpa import HierarchicalPathfinder
+from components import ComponentIndex
+from landmarks import LandmarkHeuristic
+from heuristics import HeuristicSelector, REGISTERED_HEURISTICS
+from heuristic_cache import HeuristicFieldCache
+from flow_field import FlowField
+from open_set import OPEN_SET_TYPES
+from main_realtime import create_large_graph, create_maze_graph
+
+
+def time_search(astar, repeats=3):
+    """find_path'i birkaç kez çalıştır, en iyi süreyi ve sonucu döndür"""
+    best_time = float('inf')
+    result = None
+    for _ in range(repeats):
+        start_time = time.perf_counter()
+        result = astar.find_path()
+        best_time = min(best_time, time.perf_counter() - start_time)
+    return best_time, result
+
+
+def benchmark_maps(seed=42):
+    """Benchmark haritaları (create_large_graph ve create_maze_graph)"""
+    random.seed(seed)
+    return [
+        ('large 50x25', create_large_graph(50, 25)),
+        ('large 200x150', create_large_graph(200, 150)),
+        ('maze 40x30', create_maze_graph(40, 30)),
+        ('maze 160x120', create_maze_graph(160, 120)),
+    ]
+
+
+def run_open_set_benchmark(heuristic_name='octile', repeats=3, seed=42):
+    """Open set yapılarını eski (legacy) davranışla karşılaştır"""
+    maps = benchmark_maps(seed)
+    
+    print("\n" + "="*80)
+    print(f"OPEN SET KARŞILAŞTIRMASI (heuristic: {heuristic_name})")
+    print("="*80)
+    print(f"{'Harita':<16} {'Open set':<10} {'Süre (ms)':<12} {'Keşfedilen':<12} {'Yol maliyeti':<14}")
+    print("-"*80)
+    
+    for map_name, graph in maps:
+        for open_set in OPEN_SET_TYPES:
+            astar = AStar(graph, heuristic_name, open_set=open_set)
+            elapsed, (path, success, stats) = time_search(astar, repeats)
+            cost = path_cost(path, graph) if success else '-'
+            print(f"{map_name:<16} {open_set:<10} {elapsed * 1000:<12.2f} "
+                  f"{stats['nodes_explored']:<12} {cost:<14}")
+        print("-"*80)
+
+
+def run_jps_benchmark(repeats=3, seed=42):
+    """A*, JPS ve JPS+ karşılaştırması (duvar oranı düşük ve yüksek haritalar)"""
+    random.seed(seed)
+    open_graph = Graph(300, 300)
+    open_graph.create_random_walls(wall_percentage=0.05)
+    open_graph.remove_wall(2, 2)
+    open_graph.remove_wall(297, 297)
+    open_graph.set_start(2, 2)
+    open_graph.set_goal(297, 297)
+    
+    maps = [('large 200x150', create_large_graph(200, 150)),
+            ('open 300x300', open_graph)]
+    
+    searchers = [
+        ('A*', lambda graph: AStar(graph, 'octile')),
+        ('JPS', lambda graph: JumpPointSearch(graph, use_jump_table=False)),
+        ('JPS+', lambda graph: JumpPointSearch(graph, use_jump_table=True)),
+    ]
+    
+    print("\n" + "="*80)
+    print("A* / JPS / JPS+ KARŞILAŞTIRMASI")
+    print("="*80)
+    print(f"{'Harita':<16} {'Arama':<10} {'Süre (ms)':<12} {'Keşfedilen':<12} {'Yol maliyeti':<14}")
+    print("-"*80)
+    
+    for map_name, graph in maps:
+        for search_name, factory in searchers:
+            elapsed, (path, success, stats) = time_search(factory(graph), repeats)
+            cost = path_cost(path, graph) if success else '-'
+            print(f"{map_name:<16} {search_name:<10} {elapsed * 1000:<12.2f} "
+                  f"{stats['nodes_explored']:<12} {cost:<14}")
+        print("-"*80)
+
+
+def run_bidirectional_benchmark(repeats=3, seed=42):
+    """
+    Tek yönlü A* ile NBA* karşılaştırması (create_maze_graph haritaları)
+    
+    Labirentlerde NBA* A*'dan daha az düğüm genişletmez ve daha yavaştır
+    (bkz. BidirectionalAStar); tablo bu farkı görmek içindir.
+    """
+    random.seed(seed)
+    maps = [('maze 40x30', create_maze_graph(40, 30)),
+            ('maze 160x120', create_maze_graph(160, 120))]
+    
+    print("\n" + "="*80)
+    print("A* / BIDIRECTIONAL A* (NBA*) KARŞILAŞTIRMASI")
+    print("="*80)
+    print(f"{'Harita':<16} {'Heuristic':<11} {'Arama':<8} {'Süre (ms)':<12} {'Keşfedilen':<12} {'Yol maliyeti':<14}")
+    print("-"*80)
+    
+    for map_name, graph in maps:
+        for heuristic_name in ('euclidean', 'octile'):
+            for search_name, search_class in (('A*', AStar), ('NBA*', BidirectionalAStar)):
+                elapsed, (path, success, stats) = time_search(search_class(graph, heuristic_name), repeats)
+                cost = path_cost(path, graph) if success else '-'
+                print(f"{map_name:<16} {heuristic_name:<11} {search_name:<8} {elapsed * 1000:<12.2f} "
+                      f"{stats['nodes_explored']:<12} {cost:<14}")
+        print("-"*80)
+
+
+def run_replanning_benchmark(edits=50, seed=42):
+    """Yol üzerine duvar eklendikten sonra tam A* ile D* Lite onarımı"""
+    random.seed(seed)
+    maps = [('large 200x150', create_large_graph(200, 150)),
+            ('maze 160x120', create_maze_graph(160, 120))]
+    
+    print("\n" + "="*80)
+    print("YENİDEN PLANLAMA: A* (baştan) / D* LITE (artımlı)")
+    print("="*80)
+    print(f"{'Harita':<16} {'Arama':<10} {'Süre (ms)':<12} {'Keşfedilen':<12}")
+    print("-"*80)
+    
+    for map_name, graph in maps:
+        astar = AStar(graph, 'octile')
+        planner = DStarLite(graph, 'octile')
+        path, success, _ = planner.find_path()
+        
+        totals = {'A*': [0.0, 0], 'D* Lite': [0.0, 0]}
+        for _ in range(edits):
+            if not success or len(path) < 3:
+                break
+            node = random.choice(path[1:-1])
+            graph.set_wall(node.x, node.y)
+            
+            for search_name, search in (('A*', astar), ('D* Lite', planner)):
+                start_time = time.perf_counter()
+                path, success, stats = search.find_path()
+                totals[search_name][0] += time.perf_counter() - start_time
+                totals[search_name][1] += stats['nodes_explored']
+        
+        for search_name, (elapsed, explored) in totals.items():
+            print(f"{map_name:<16} {search_name:<10} {elapsed * 1000 / edits:<12.2f} "
+                  f"{explored // edits:<12}")
+        print("-"*80)
+        planner.detach()
+
+
+def run_hpa_benchmark(cluster_size=16, repeats=3):
+    """Uzun sorgularda A* ile HPA* (önişleme süresi ve yol maliyeti oranı)"""
+    random.seed(42)
+    graph = create_large_graph(400, 300)
+    
+    print("\n" + "="*80)
+    print(f"HİYERARŞİK ARAMA: A* / HPA* (küme boyutu {cluster_size})")
+    print("="*80)
+    
+    planner = HierarchicalPathfinder(graph, cluster_size, 'octile')
+    start_time = time.perf_counter()
+    planner.update()
+    print(f"Önişleme: {(time.perf_counter() - start_time) * 1000:.0f} ms")
+    
+    astar_time, (astar_path, _, astar_stats) = time_search(AStar(graph, 'octile'), repeats)
+    hpa_time, (hpa_path, _, hpa_stats) = time_search(planner, repeats)
+    print(f"{'Arama':<10} {'Süre (ms)':<12} {'Keşfedilen':<12} {'Maliyet':<10}")
+    print("-"*80)
+    print(f"{'A*':<10} {astar_time * 1000:<12.2f} {astar_stats['nodes_explored']:<12} "
+          f"{path_cost(astar_path, graph):<10}")
+    print(f"{'HPA*':<10} {hpa_time * 1000:<12.2f} {hpa_stats['nodes_explored']:<12} "
+          f"{path_cost(hpa_path, graph):<10}")
+    
+    # Tek duvar değişikliği sonrası sadece etkilenen kümeler yeniden hesaplanır
+    node = hpa_path[len(hpa_path) // 2]
+    graph.set_wall(node.x, node.y)
+    start_time = time.perf_counter()
+    rebuilt = planner.update()
+    print(f"Duvar ekleme sonrası {rebuilt} küme yeniden hesaplandı: "
+          f"{(time.perf_counter() - start_time) * 1000:.1f} ms")
+    planner.detach()
+
+
+def run_unreachable_benchmark(repeats=3):
+    """Hedef duvarlarla çevriliyken bileşen indeksi olmadan / ile A*"""
+    random.seed(42)
+    graph = create_large_graph(200, 150)
+    goal = graph.goal_node
+    for dx in range(-1, 2):
+        for dy in range(-1, 2):
+            if (dx or dy) and graph.in_bounds(goal.x + dx, goal.y + dy):
+                graph.set_wall(goal.x + dx, goal.y + dy)
+    
+    print("\n" + "="*80)
+    print("ULAŞILAMAYAN HEDEF: BİLEŞEN İNDEKSİ")
+    print("="*80)
+    
+    start_time = time.perf_counter()
+    component_index = ComponentIndex(graph)
+    print(f"Etiketleme: {(time.perf_counter() - start_time) * 1000:.1f} ms, "
+          f"{component_index.component_count()} bileşen")
+    
+    astar = AStar(graph, 'octile')
+    plain_time, (_, _, plain_stats) = time_search(astar, repeats)
+    astar.component_index = component_index
+    indexed_time, (_, _, indexed_stats) = time_search(astar, repeats)
+    print(f"{'Arama':<14} {'Süre (ms)':<12} {'Keşfedilen':<12}")
+    print("-"*80)
+    print(f"{'A*':<14} {plain_time * 1000:<12.3f} {plain_stats['nodes_explored']:<12}")
+    print(f"{'A* + indeks':<14} {indexed_time * 1000:<12.3f} {indexed_stats['nodes_explored']:<12}")
+    component_index.detach()
+
+
+def run_landmark_benchmark(landmark_count=8, repeats=3):
+    """Labirentte octile ile landmark (ALT) heuristic'i"""
+    random.seed(42)
+    graph = create_maze_graph(200, 150)
+    
+    print("\n" + "="*80)
+    print(f"LANDMARK (ALT) HEURISTIC: {landmark_count} landmark, labirent 200x150")
+    print("="*80)
+    
+    start_time = time.perf_counter()
+    landmark = LandmarkHeuristic(graph, landmark_count).register()
+    print(f"Önişleme: {(time.perf_counter() - start_time) * 1000:.0f} ms")
+    
+    print(f"{'Heuristic':<12} {'Süre (ms)':<12} {'Keşfedilen':<12} {'Maliyet':<10}")
+    print("-"*80)
+    for heuristic_name in ('octile', 'landmark'):
+        elapsed, (path, _, stats) = time_search(AStar(graph, heuristic_name), repeats)
+        print(f"{heuristic_name:<12} {elapsed * 1000:<12.2f} {stats['nodes_explored']:<12} "
+              f"{path_cost(path, graph):<10}")
+    landmark.detach()
+
+
+def run_heuristic_scale_benchmark():
+    """Heuristic'ler hücre biriminde (eski) ve maliyet birimine ölçeklenmiş (yeni)"""
+    random.seed(42)
+    graph = create_large_graph(200, 150)
+    selector = HeuristicSelector()
+    
+    print("\n" + "="*80)
+    print("HEURISTIC BİRİMLERİ: HÜCRE BİRİMİ / MALİYET BİRİMİ (10/14)")
+    print("="*80)
+    print(f"{'Heuristic':<20} {'Çarpan':<8} {'Keşfedilen (önce)':<19} {'Keşfedilen (sonra)':<19} "
+          f"{'Maliyet':<8}")
+    print("-"*80)
+    
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)  # weighted_euclidean bilerek aşar
+        # Sadece hazır heuristic'ler; kayıtlı olanlar (örn. landmark) başka
+        # bir grafa ait olabilir ve zaten maliyet biriminde tanımlıdır
+        builtin_names = [name for name in selector.get_all_names()
+                         if name not in REGISTERED_HEURISTICS]
+        for heuristic_name in builtin_names:
+            scaled = AStar(graph, heuristic_name)
+            unscaled = AStar(graph, heuristic_name)
+            unscaled.set_heuristic_functions(selector.get_heuristic(heuristic_name),
+                                             selector.get_batch_heuristic(heuristic_name))
+            unscaled.heuristic_is_integral = selector.is_integral(heuristic_name)
+            
+            _, _, before = unscaled.find_path()
+            path, _, after = scaled.find_path()
+            scale = selector.cost_scale(heuristic_name, graph.straight_cost, graph.diagonal_cost)
+            print(f"{heuristic_name:<20} {scale:<8.3g} {before['nodes_explored']:<19} "
+                  f"{after['nodes_explored']:<19} {path_cost(path, graph):<8}")
+
+
+def run_goal_cache_benchmark(agents=150, goal_count=3):
+    """Birkaç ortak hedefe giden ajanlar: önbelleksiz / h alanı / gerçek mesafe alanı"""
+    random.seed(42)
+    graph = create_maze_graph(200, 150)
+    free = [index for index in range(graph.width * graph.height) if graph.cells[index] != WALL]
+    goals = [graph.node_at(random.choice(free)) for _ in range(goal_count)]
+    starts = [graph.node_at(random.choice(free)) for _ in range(agents)]
+    
+    print("\n" + "="*80)
+    print(f"HEDEF BAŞINA h ALANI ÖNBELLEĞİ: {agents} ajan, {goal_count} hedef, labirent 200x150")
+    print("="*80)
+    print(f"{'Önbellek':<12} {'Süre (ms)':<12} {'Keşfedilen':<12} {'İsabet':<8}")
+    print("-"*80)
+    
+    for label, cache in (('yok', None),
+                         ('h alanı', HeuristicFieldCache(graph)),
+                         ('gerçek', HeuristicFieldCache(graph, exact=True))):
+        astar = AStar(graph, 'octile')
+        astar.heuristic_cache = cache
+        explored = 0
+        start_time = time.perf_counter()
+        for i, start in enumerate(starts):
+            _, _, stats = astar.search(start, goals[i % goal_count])
+            explored += stats['nodes_explored']
+        elapsed = time.perf_counter() - start_time
+        hit_rate = f"{cache.get_stats()['hit_rate']:.2f}" if cache else '-'
+        print(f"{label:<12} {elapsed * 1000:<12.1f} {explored:<12} {hit_rate:<8}")
+        if cache:
+            cache.detach()
+
+
+def run_flow_field_benchmark(units=300):
+    """
+    Tek hedefe giden birimler: birim başına A* / tek akış alanı
+    
+    Akış alanı maliyeti birimlerin step_units ile gerçekten yürüdüğü
+    adımlardan toplanır (distances'tan okunmaz).
+    """
+    random.seed(42)
+    graph = create_maze_graph(200, 150)
+    free = [index for index in range(graph.width * graph.height) if graph.cells[index] != WALL]
+    goal = graph.node_at(random.choice(free))
+    starts = [graph.node_at(random.choice(free)) for _ in range(units)]
+    
+    print("\n" + "="*80)
+    print(f"AKIŞ ALANI: {units} birim, tek hedef, labirent 200x150")
+    print("="*80)
+    print(f"{'Yöntem':<12} {'Süre (ms)':<12} {'Toplam maliyet':<16} {'Ulaşan':<8}")
+    print("-"*80)
+    
+    astar = AStar(graph, 'octile')
+    total = 0
+    arrived = 0
+    start_time = time.perf_counter()
+    for start in starts:
+        path, success, _ = astar.search(start, goal)
+        if success:
+            total += path_cost(path, graph)
+            arrived += 1
+    elapsed = time.perf_counter() - start_time
+    print(f"{'A*':<12} {elapsed * 1000:<12.1f} {total:<16} {arrived:<8}")
+    
+    start_time = time.perf_counter()
+    flow = FlowField(graph, goal)
+    positions = np.array([(start.x, start.y) for start in starts], dtype=np.int64)
+    total = 0
+    for _ in range(graph.width * graph.height):
+        moved = flow.step_units(positions)
+        steps = np.abs(moved - positions)
+        if not steps.any():
+            break
+        diagonal = steps.all(axis=1)
+        straight = steps.any(axis=1) & ~diagonal
+        total += (int(diagonal.sum()) * graph.diagonal_cost +
+                  int(straight.sum()) * graph.straight_cost)
+        positions = moved
+    elapsed = time.perf_counter() - start_time
+    arrived = int(((positions[:, 0] == goal.x) & (positions[:, 1] == goal.y)).sum())
+    print(f"{'Akış alanı':<12} {elapsed * 1000:<12.1f} {total:<16} {arrived:<8}")
+    flow.detach()
+
+
+if __name__ == "__main__":
+    run_open_set_benchmark()
+    run_jps_benchmark()
+    run_bidirectional_benchmark()
+    run_replanning_benchmark()
+    run_hpa_benchmark()
+    run_unreachable_benchmark()
+    run_landmark_benchmark()
+    run_heuristic_scale_benchmark()
+    run_goal_cache_benchmark()
+    run_flow_field_benchmark()
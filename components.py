@@ -0,0 +1,210 @@
+"""
+Bağlı bileşen indeksi - ulaşılamayan hedefleri aramadan reddetmek için
+
+Geçilebilir hücreler 8 yönlü komşulukla bileşenlere ayrılır (çapraz
+hareket her zaman serbest olduğu için bağlantı da 8 yönlüdür). labels[i]
+i. hücrenin bileşen numarası, duvarlarda -1. İki hücre arasında yol ancak
+aynı bileşendeyseler vardır; kontrol O(1)'dir.
+
+Graph.add_listener ile artımlı güncellenir:
+    Hücre açıldığında: komşu bileşenler birleşir (union-find: küçüklerin
+        numarası en büyüğe bağlanır, hücreler yeniden yazılmaz; O(1)),
+        komşu yoksa yeni bileşen açılır
+    Hücre duvar olduğunda: geçilebilir komşuları hücrenin çevresinde
+        birbirine bağlıysa bileşen bölünemez; değilse bileşen bir sonraki
+        sorguda yeniden etiketlenir
+"""
+
+from array import array
+import numpy as np
+from graph import WALL
+
+UNLABELED = -2
+
+
+class ComponentIndex:
+    """
+    Geçilebilir hücrelerin bağlı bileşen etiketleri
+    
+    Kullanım:
+        astar.component_index = ComponentIndex(graph)
+        astar.find_path()  # farklı bileşenlerdeki hedefler aramasız reddedilir
+    """
+    
+    def __init__(self, graph):
+        self.graph = graph
+        self._labels = array('i', [UNLABELED]) * (graph.width * graph.height)
+        self._label_view = np.frombuffer(self._labels, dtype=np.intc)
+        self.sizes = {}  # bileşen numarası (kök) -> hücre sayısı
+        self.parents = {}  # Birleşmiş numara -> katıldığı numara (union-find)
+        self.next_label = 0
+        self.dirty_labels = set()  # Bölünmüş olabilecek bileşenler
+        
+        self.rebuild()
+        graph.add_listener(self._on_cell_changed)
+    
+    def detach(self):
+        """Graf dinleyicisini kaldır"""
+        self.graph.remove_listener(self._on_cell_changed)
+    
+    # Etiketleme
+    
+    def _flood(self, seed, label):
+        """seed'den ulaşılan etiketsiz hücrelere label ver, hücre sayısını döndür"""
+        labels = self._labels
+        neighbor_indices = self.graph.neighbor_indices
+        labels[seed] = label
+        stack = [seed]
+        count = 0
+        while stack:
+            current = stack.pop()
+            count += 1
+            for neighbor, _ in neighbor_indices(current):
+                if labels[neighbor] == UNLABELED:
+                    labels[neighbor] = label
+                    stack.append(neighbor)
+        return count
+    
+    def _label_cells(self, cells):
+        """Etiketsiz hücreleri (verilen sırayla) yeni bileşenlere ayır"""
+        labels = self._labels
+        for index in cells:
+            if labels[index] == UNLABELED:
+                label = self.next_label
+                self.next_label += 1
+                self.sizes[label] = self._flood(index, label)
+    
+    def _find(self, label):
+        """Numaranın bağlı olduğu kök bileşen numarası (yol sıkıştırmalı)"""
+        parents = self.parents
+        if label not in parents:
+            return label
+        root = label
+        while root in parents:
+            root = parents[root]
+        while label != root:
+            parents[label], label = root, parents[label]
+        return root
+    
+    def _flatten(self):
+        """Hücrelerdeki birleşmiş numaraları köklerine çevir (toplu okumalardan önce)"""
+        if not self.parents:
+            return
+        mapping = np.arange(self.next_label, dtype=np.intc)
+        for label in self.parents:
+            mapping[label] = self._find(label)
+        view = self._label_view
+        passable = view >= 0
+        view[passable] = mapping[view[passable]]
+        self.parents.clear()
+    
+    def rebuild(self):
+        """Tüm gridi baştan etiketle"""
+        view = self._label_view
+        view[:] = np.where(self.graph.cells == WALL, -1, UNLABELED)
+        self.sizes = {}
+        self.parents.clear()
+        self.dirty_labels.clear()
+        self._label_cells(np.flatnonzero(view == UNLABELED).tolist())
+    
+    def _refresh(self):
+        """Bölünmüş olabilecek bileşenleri yeniden etiketle"""
+        if not self.dirty_labels:
+            return
+        self._flatten()
+        view = self._label_view
+        for label in self.dirty_labels:
+            cells = np.flatnonzero(view == label)
+            view[cells] = UNLABELED
+            del self.sizes[label]
+            self._label_cells(cells.tolist())
+        self.dirty_labels.clear()
+    
+    def _on_cell_changed(self, index, passable):
+        """Graph dinleyicisi: etiketleri artımlı güncelle"""
+        if index is None:
+            self.rebuild()
+            return
+        
+        labels = self._labels
+        neighbors = [neighbor for neighbor, _ in self.graph.neighbor_indices(index)]
+        
+        if passable:
+            neighbor_labels = {self._find(labels[neighbor]) for neighbor in neighbors}
+            if not neighbor_labels:
+                labels[index] = self.next_label
+                self.sizes[self.next_label] = 1
+                self.next_label += 1
+                return
+            # En büyük bileşen kalır, diğerleri ona bağlanır
+            label = max(neighbor_labels, key=self.sizes.__getitem__)
+            labels[index] = label
+            self.sizes[label] += 1
+            for other in neighbor_labels - {label}:
+                self.parents[other] = label
+                self.sizes[label] += self.sizes.pop(other)
+                if other in self.dirty_labels:
+                    self.dirty_labels.discard(other)
+                    self.dirty_labels.add(label)
+            return
+        
+        label = self._find(labels[index])
+        labels[index] = -1
+        self.sizes[label] -= 1
+        if not self.sizes[label]:
+            del self.sizes[label]
+            self.dirty_labels.discard(label)
+        elif not self._ring_connected(index, neighbors):
+            self.dirty_labels.add(label)
+    
+    def _ring_connected(self, index, neighbors):
+        """
+        index'in geçilebilir komşuları, index kullanılmadan birbirine
+        komşu hücreler üzerinden bağlı mı (öyleyse bileşen bölünmez)
+        """
+        width = self.graph.width
+        y, x = divmod(index, width)
+        offsets = set()
+        for neighbor in neighbors:
+            neighbor_y, neighbor_x = divmod(neighbor, width)
+            offsets.add((neighbor_x - x, neighbor_y - y))
+        
+        stack = [offsets.pop()]
+        while stack:
+            dx, dy = stack.pop()
+            for other in [(ox, oy) for ox, oy in offsets
+                          if abs(ox - dx) <= 1 and abs(oy - dy) <= 1]:
+                offsets.discard(other)
+                stack.append(other)
+        return not offsets
+    
+    # Sorgular
+    
+    @property
+    def labels(self):
+        """Bileşen numaraları (numpy int dizisi, indeks = y * width + x, duvar: -1)"""
+        self._refresh()
+        self._flatten()
+        return self._label_view
+    
+    def component_of(self, x, y):
+        """(x, y) hücresinin bileşen numarası (duvar: -1)"""
+        self._refresh()
+        return self._find(self._labels[y * self.graph.width + x])
+    
+    def connected(self, start, goal):
+        """start ile goal arasında yol var mı (x ve y özellikleri olan nesneler)"""
+        self._refresh()
+        width = self.graph.width
+        label = self._find(self._labels[start.y * width + start.x])
+        return label >= 0 and label == self._find(self._labels[goal.y * width + goal.x])
+    
+    def components_at(self, points):
+        """(n, 2) boyutlu (x, y) dizisindeki hücrelerin bileşen numaraları"""
+        points = np.asarray(points, dtype=np.int64).reshape(-1, 2)
+        return self.labels[points[:, 1] * self.graph.width + points[:, 0]]
+    
+    def component_count(self):
+        """Bileşen sayısı"""
+        self._refresh()
+        return len(self.sizes)
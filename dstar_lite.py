@@ -0,0 +1,220 @@
+"""
+D* Lite - duvar değişikliklerinde artımlı yeniden planlama
+(Koenig & Likhachev, optimize edilmiş sürüm)
+
+Arama hedeften başlangıca doğru yapılır; g ve rhs değerleri çağrılar
+arasında saklanır. Planlayıcı Graph'a dinleyici olarak bağlanır ve
+set_wall / remove_wall ile değişen hücreleri biriktirir. Bir sonraki
+find_path çağrısında sadece bu hücrelerin ve komşularının rhs değerleri
+yeniden hesaplanır; tutarsız hale gelen düğümler genişletilir. Küçük
+değişiklikler yolun sadece etkilenen kısmını onarır.
+
+Başlangıç değiştiğinde (robot ilerlediğinde) km ile anahtarlar
+düzeltilir; hedef değişirse arama baştan kurulur.
+"""
+
+from array import array
+from astar import INFINITY
+from graph import GridPoint, WALL, NEIGHBOR_DIRECTIONS
+from heuristics import HeuristicSelector
+from open_set import LazyHeapOpenSet
+
+
+class DStarLite:
+    """Artımlı planlayıcı - AStar.find_path ile aynı dönüş biçimi"""
+    
+    def __init__(self, graph, heuristic_name='octile'):
+        self.graph = graph
+        self.heuristic_selector = HeuristicSelector(graph)
+        self.heuristic_func = self.heuristic_selector.get_heuristic(
+            heuristic_name, (graph.straight_cost, graph.diagonal_cost))
+        self.heuristic_name = heuristic_name
+        
+        self.g_costs = None
+        self.rhs = None
+        self.open_set = None
+        self.km = 0
+        self.start_index = -1
+        self.goal_index = -1
+        self.needs_reset = True
+        self.changed_cells = set()  # Son planlamadan beri değişen hücreler
+        
+        graph.add_listener(self._on_cell_changed)
+    
+    def detach(self):
+        """Graf dinleyicisini kaldır"""
+        self.graph.remove_listener(self._on_cell_changed)
+    
+    def _on_cell_changed(self, index, passable):
+        if index is None:
+            self.needs_reset = True
+        else:
+            self.changed_cells.add(index)
+    
+    def _heuristic(self, index):
+        """Başlangıçtan index'e heuristic (anahtar hesabı için)"""
+        y, x = divmod(index, self.graph.width)
+        start_y, start_x = divmod(self.start_index, self.graph.width)
+        return self.heuristic_func(GridPoint(start_x, start_y), GridPoint(x, y))
+    
+    def _key(self, index):
+        value = min(self.g_costs[index], self.rhs[index])
+        return value + self._heuristic(index) + self.km, value
+    
+    def _update_vertex(self, index):
+        """index'in open set üyeliğini tutarlılığına göre güncelle"""
+        if self.g_costs[index] != self.rhs[index]:
+            k1, k2 = self._key(index)
+            self.open_set.update(index, k1, k2)
+        else:
+            self.open_set.discard(index)
+    
+    def _best_rhs(self, index):
+        """rhs(s) = min(c(s, s') + g(s')); duvarlar için sonsuz"""
+        if self.graph.cells[index] == WALL:
+            return INFINITY
+        g_costs = self.g_costs
+        best = INFINITY
+        for neighbor, cost in self.graph.neighbor_indices(index):
+            value = cost + g_costs[neighbor]
+            if value < best:
+                best = value
+        return best
+    
+    def _reset(self):
+        """Aramayı hedeften yeniden kur"""
+        size = self.graph.width * self.graph.height
+        self.g_costs = array('d', [INFINITY]) * size
+        self.rhs = array('d', [INFINITY]) * size
+        self.open_set = LazyHeapOpenSet()
+        self.km = 0
+        self.rhs[self.goal_index] = 0
+        self.open_set.update(self.goal_index, self._heuristic(self.goal_index), 0)
+        self.changed_cells.clear()
+        self.needs_reset = False
+    
+    def _apply_changes(self):
+        """Değişen hücrelerin ve komşularının rhs değerlerini yeniden hesapla"""
+        graph = self.graph
+        width = graph.width
+        affected = set()
+        for index in self.changed_cells:
+            affected.add(index)
+            y, x = divmod(index, width)
+            for dx, dy in NEIGHBOR_DIRECTIONS:
+                if graph.in_bounds(x + dx, y + dy):
+                    affected.add(index + dx + dy * width)
+        self.changed_cells.clear()
+        
+        for index in affected:
+            if index != self.goal_index:
+                self.rhs[index] = self._best_rhs(index)
+            self._update_vertex(index)
+        return len(affected)
+    
+    def _compute_shortest_path(self):
+        """Başlangıç tutarlı olana kadar tutarsız düğümleri genişlet"""
+        g_costs = self.g_costs
+        rhs = self.rhs
+        open_set = self.open_set
+        neighbor_indices = self.graph.neighbor_indices
+        start = self.start_index
+        goal = self.goal_index
+        expanded = 0
+        
+        while True:
+            top = open_set.peek()
+            if top is None:
+                break
+            k_old = (top[0], top[1])
+            if k_old >= self._key(start) and rhs[start] == g_costs[start]:
+                break
+            
+            current = top[2]
+            k_new = self._key(current)
+            expanded += 1
+            if k_old < k_new:
+                open_set.update(current, k_new[0], k_new[1])
+            elif g_costs[current] > rhs[current]:
+                # Aşırı tutarlı: g düşer, komşulara yay
+                g_costs[current] = rhs[current]
+                open_set.discard(current)
+                current_g = g_costs[current]
+                for neighbor, cost in neighbor_indices(current):
+                    if neighbor != goal and cost + current_g < rhs[neighbor]:
+                        rhs[neighbor] = cost + current_g
+                        self._update_vertex(neighbor)
+            else:
+                # Eksik tutarlı: g sonsuz olur, bu düğüme bağlı rhs'ler yenilenir
+                old_g = g_costs[current]
+                g_costs[current] = INFINITY
+                for neighbor, cost in neighbor_indices(current) + [(current, 0)]:
+                    if neighbor != goal and rhs[neighbor] == cost + old_g:
+                        rhs[neighbor] = self._best_rhs(neighbor)
+                    self._update_vertex(neighbor)
+        return expanded
+    
+    def _extract_path(self):
+        """Başlangıçtan g değerlerini izleyerek hedefe yürü"""
+        graph = self.graph
+        g_costs = self.g_costs
+        index = self.start_index
+        if g_costs[index] == INFINITY:
+            return []
+        
+        path = [graph.node_at(index)]
+        while index != self.goal_index:
+            best, best_value = -1, INFINITY
+            for neighbor, cost in graph.neighbor_indices(index):
+                value = cost + g_costs[neighbor]
+                if value < best_value:
+                    best, best_value = neighbor, value
+            if best == -1:
+                return []
+            index = best
+            path.append(graph.node_at(index))
+        return path
+    
+    def find_path(self):
+        """
+        graph.start_node -> graph.goal_node yolunu bul ya da onar
+        
+        Returns:
+            tuple: (path, success, stats) - stats['nodes_explored'] bu
+            çağrıda genişletilen düğüm sayısı, 'cells_updated' yeniden
+            hesaplanan rhs sayısı
+        """
+        graph = self.graph
+        if not graph.start_node or not graph.goal_node:
+            return [], False, "Başlangıç veya hedef düğüm belirlenmemiş"
+        
+        width = graph.width
+        start_index = graph.start_node.y * width + graph.start_node.x
+        goal_index = graph.goal_node.y * width + graph.goal_node.x
+        
+        cells_updated = 0
+        if self.needs_reset or goal_index != self.goal_index:
+            self.goal_index = goal_index
+            self.start_index = start_index
+            self._reset()
+        else:
+            if start_index != self.start_index:
+                # Başlangıç kaydı: eski anahtarlar km kadar düzeltilir
+                self.km += self._heuristic(start_index)
+                self.start_index = start_index
+            cells_updated = self._apply_changes()
+        
+        expanded = self._compute_shortest_path()
+        path = self._extract_path()
+        success = bool(path)
+        
+        stats = {
+            'nodes_explored': expanded,
+            'nodes_in_open': len(self.open_set),
+            'path_length': len(path),
+            'heuristic_used': self.heuristic_name,
+            'path_found': success,
+            'total_steps': 0,
+            'cells_updated': cells_updated
+        }
+        return path, success, stats
@@ -0,0 +1,173 @@
+"""
+Akış alanı (flow field) - çok sayıda birimi tek bir hedefe yönlendirmek için
+
+Hedeften bütün gride bir kez ters Dijkstra yapılır (Graph.neighbor_indices
+ile, yani grafın straight_cost / diagonal_cost kenar maliyetleriyle). Sonuç
+numpy dizileridir:
+    distances: (height, width) hedefe en kısa yol maliyeti (duvar ve
+        ulaşılamayan hücrelerde -1)
+    next_indices: her hücreden hedefe doğru bir sonraki hücrenin düz
+        indeksi (hedefte ve ulaşılamayan hücrelerde -1)
+    directions: (height, width, 2) aynı adımın (dx, dy) yönü
+
+Her birim sonraki adımını O(1) okur (next_step, toplu olarak step_units);
+birim başına A* çalıştırmaya gerek kalmaz. Bir sonraki hücre, komşular
+arasında adım maliyeti + mesafesi en küçük olandır; bu yüzden alanı izleyen
+her yol optimaldir.
+
+Alan Graph'a dinleyici olarak bağlanır; geçilebilirlik değişince bayatlar
+ve bir sonraki erişimde yeniden hesaplanır.
+"""
+
+import numpy as np
+from graph import NEIGHBOR_DIRECTIONS
+from landmarks import distance_table, UNREACHED
+
+
+class FlowField:
+    """
+    Tek hedefli mesafe ve yön alanı
+    
+    Kullanım:
+        flow = FlowField(graph)  # hedef: graph.goal_node
+        x, y = flow.next_step(x, y)
+        positions = flow.step_units(positions)  # (n, 2) birim konumları
+    """
+    
+    def __init__(self, graph, goal=None):
+        self.graph = graph
+        goal = goal if goal is not None else graph.goal_node
+        if goal is None:
+            raise ValueError("Hedef düğüm belirlenmemiş")
+        self.goal_index = goal.y * graph.width + goal.x
+        
+        self._distances = None
+        self._next_indices = None
+        self.stale = True
+        graph.add_listener(self._on_cell_changed)
+    
+    def detach(self):
+        """Graf dinleyicisini kaldır"""
+        self.graph.remove_listener(self._on_cell_changed)
+    
+    def _on_cell_changed(self, index, passable):
+        self.stale = True
+    
+    def set_goal(self, x, y):
+        """Hedefi değiştir (alan bir sonraki erişimde yeniden hesaplanır)"""
+        self.goal_index = y * self.graph.width + x
+        self.stale = True
+    
+    @property
+    def goal(self):
+        """Hedef hücre (x, y)"""
+        y, x = divmod(self.goal_index, self.graph.width)
+        return x, y
+    
+    def _refresh(self):
+        if self.stale:
+            self.compute()
+    
+    def compute(self):
+        """Mesafe ve yön alanlarını hedeften yeniden hesapla"""
+        graph = self.graph
+        width, height = graph.width, graph.height
+        
+        table = distance_table(graph, self.goal_index)
+        reached = (table != UNREACHED).reshape(height, width)
+        distances = np.where(reached, table.reshape(height, width).astype(np.int64), -1)
+        
+        # Her yön için komşunun mesafesi + adım maliyeti; en küçüğü seçilir
+        # (adım maliyetleri Dijkstra'nın kullandığı kenar maliyetleriyle aynı)
+        blocked = np.iinfo(np.int64).max // 4
+        padded = np.full((height + 2, width + 2), blocked, dtype=np.int64)
+        padded[1:-1, 1:-1] = np.where(reached, distances, blocked)
+        best = np.full((height, width), blocked, dtype=np.int64)
+        offsets = np.full((height, width), 0, dtype=np.int64)
+        for dx, dy in NEIGHBOR_DIRECTIONS:
+            cost = graph.diagonal_cost if dx and dy else graph.straight_cost
+            candidate = padded[1 + dy:1 + dy + height, 1 + dx:1 + dx + width] + cost
+            better = candidate < best
+            best[better] = candidate[better]
+            offsets[better] = dx + dy * width
+        
+        next_indices = np.arange(width * height, dtype=np.int64) + offsets.reshape(-1)
+        has_next = reached.reshape(-1) & (best.reshape(-1) < blocked)
+        has_next[self.goal_index] = False
+        next_indices[~has_next] = -1
+        
+        self._distances = distances
+        self._next_indices = next_indices
+        self.stale = False
+    
+    @property
+    def distances(self):
+        """(height, width) int64 hedefe maliyet (-1: duvar / ulaşılamaz)"""
+        self._refresh()
+        return self._distances
+    
+    @property
+    def next_indices(self):
+        """(height * width) int64 sonraki hücre indeksi (-1: hedef / ulaşılamaz)"""
+        self._refresh()
+        return self._next_indices
+    
+    @property
+    def directions(self):
+        """(height, width, 2) int8 sonraki adımın (dx, dy) yönü, adım yoksa (0, 0)"""
+        self._refresh()
+        width = self.graph.width
+        indices = np.arange(width * self.graph.height, dtype=np.int64)
+        has_next = self._next_indices >= 0
+        next_y, next_x = np.divmod(np.where(has_next, self._next_indices, indices), width)
+        y, x = np.divmod(indices, width)
+        directions = np.stack([next_x - x, next_y - y], axis=-1).astype(np.int8)
+        return directions.reshape(self.graph.height, width, 2)
+    
+    def distance(self, x, y):
+        """(x, y)'den hedefe maliyet (ulaşılamıyorsa -1)"""
+        return int(self.distances[y, x])
+    
+    def next_step(self, x, y):
+        """(x, y)'den hedefe doğru bir sonraki hücre (x, y); hedefte ya da ulaşılamıyorsa None"""
+        index = int(self.next_indices[y * self.graph.width + x])
+        if index < 0:
+            return None
+        next_y, next_x = divmod(index, self.graph.width)
+        return next_x, next_y
+    
+    def step_units(self, positions):
+        """
+        Birimleri birer adım ilerlet
+        
+        Args:
+            positions: (n, 2) boyutlu (x, y) dizisi
+        
+        Returns:
+            numpy.ndarray: Yeni konumlar (hedefteki ve ulaşamayan birimler yerinde kalır)
+        """
+        positions = np.asarray(positions, dtype=np.int64).reshape(-1, 2)
+        width = self.graph.width
+        indices = positions[:, 1] * width + positions[:, 0]
+        next_indices = self.next_indices[indices]
+        next_indices = np.where(next_indices >= 0, next_indices, indices)
+        next_y, next_x = np.divmod(next_indices, width)
+        return np.stack([next_x, next_y], axis=1)
+    
+    def path_from(self, x, y):
+        """
+        Alanı izleyerek (x, y)'den hedefe yol
+        
+        Returns:
+            list: Node listesi (AStar yolu gibi); ulaşılamıyorsa []
+        """
+        graph = self.graph
+        index = y * graph.width + x
+        if index != self.goal_index and self.next_indices[index] < 0:
+            return []
+        next_indices = self._next_indices
+        path = [graph.node_at(index)]
+        while index != self.goal_index:
+            index = int(next_indices[index])
+            path.append(graph.node_at(index))
+        return path
@@ -0,0 +1,219 @@
+"""
+Görselleştirme için grid renk katmanları ve artımlı (incremental) çizim
+
+Statik katman (boş / duvar / başlangıç / hedef) hücre tiplerinden tek bir
+dizi indekslemesiyle oluşturulur. GridFrameBuffer arama olaylarını
+(StepEvent) kalıcı bir renk tamponuna uygular; her adımda sadece o adımda
+değişen hücreler yazılır. BlitManager ise sadece değişen artist'leri
+kaydedilmiş arka planın üzerine çizer (matplotlib blitting).
+"""
+
+import numpy as np
+from graph import EMPTY, WALL, START, GOAL
+from step_log import BEGIN
+
+
+def build_static_layer(graph, color_values):
+    """Boş / duvar / başlangıç / hedef katmanını hücre tiplerinden oluştur"""
+    lookup = np.zeros(4)
+    lookup[EMPTY] = color_values['empty']
+    lookup[WALL] = color_values['wall']
+    lookup[START] = color_values['start']
+    lookup[GOAL] = color_values['goal']
+    return lookup[graph.grid]
+
+
+def node_indices(graph, nodes):
+    """Düğüm listesini düz hücre indekslerine çevir"""
+    width = graph.width
+    return [node.y * width + node.x for node in nodes]
+
+
+def paint_cells(grid, cells, indices, value):
+    """
+    Düz indeksleri verilen boş hücreleri value ile boya
+    
+    Args:
+        grid: (height, width) renk değeri dizisi (yerinde değişir)
+        cells: Graph.cells düz hücre tipi dizisi
+        indices: Hücre indeksleri (liste, array ya da numpy dizisi)
+        value: Renk değeri
+    """
+    indices = np.asarray(indices, dtype=np.intp)
+    if indices.size:
+        indices = indices[cells[indices] == EMPTY]
+        grid.reshape(-1)[indices] = value
+
+
+class GridFrameBuffer:
+    """
+    Arama olaylarından güncellenen kalıcı renk tamponu
+    
+    İki katman tutulur: persistent (statik katman + keşfedilen / open set)
+    ve frame (persistent + o adıma özel mevcut / değerlendirilen hücreler).
+    Adıma özel hücreler bir sonraki adımda persistent değerlerine döner.
+    Sadece boş hücreler boyanır; başlangıç ve hedef hep görünür kalır.
+    """
+    
+    def __init__(self, graph, color_values, show_considering=False):
+        """
+        Args:
+            graph: Görselleştirilen graf
+            color_values: Renk adı -> colormap değeri
+            show_considering: Bakılan komşular 'considering' rengiyle
+                gösterilsin mi (color_values'da olmalı)
+        """
+        self.graph = graph
+        self.color_values = color_values
+        self.show_considering = show_considering
+        self.reset()
+    
+    def reset(self):
+        """Tamponu statik katmana döndür (graf değiştiyse yeniden oluştur)"""
+        graph = self.graph
+        self.base = build_static_layer(graph, self.color_values)
+        self.persistent = self.base.copy()
+        self.frame = self.base.copy()
+        self._persistent_flat = self.persistent.reshape(-1)
+        self._frame_flat = self.frame.reshape(-1)
+        self._empty = (graph.cells == EMPTY).tolist()
+        
+        self.open_indices = set()
+        self.closed_indices = set()
+        self.step = 0
+        self.transient = []  # Sadece bu adımda boyanan hücreler
+        self.dirty = []  # Son apply çağrısında frame'de değişen hücreler
+    
+    def _set(self, index, value):
+        """Hücrenin kalıcı rengini değiştir"""
+        if self._empty[index]:
+            self._persistent_flat[index] = value
+            self._frame_flat[index] = value
+            self.dirty.append(index)
+    
+    def _mark(self, index, value):
+        """Hücreyi sadece bu adım için boya"""
+        if self._empty[index]:
+            self._frame_flat[index] = value
+            self.transient.append(index)
+            self.dirty.append(index)
+    
+    def apply(self, event):
+        """
+        Olayı tampona uygula
+        
+        Returns:
+            dict: İstatistik gösterimi için hafif adım bilgisi (step,
+            current, g/h/f_cost, action, open_count, closed_count);
+            'begin' olayı için None
+        """
+        color_values = self.color_values
+        
+        if event.action == BEGIN:
+            self.reset()
+            for index in event.pushed:
+                self.open_indices.add(index)
+                self._set(index, color_values['frontier'])
+            return None
+        
+        self.step += 1
+        self.dirty = []
+        
+        # Önceki adımın geçici hücrelerini geri al
+        frame_flat = self._frame_flat
+        persistent_flat = self._persistent_flat
+        for index in self.transient:
+            frame_flat[index] = persistent_flat[index]
+        self.dirty.extend(self.transient)
+        self.transient = []
+        
+        current = event.current
+        self.open_indices.discard(current)
+        if event.closed:
+            self.closed_indices.add(current)
+            self._set(current, color_values['explored'])
+        
+        frontier = color_values['frontier']
+        for index in event.pushed:
+            self.open_indices.add(index)
+            self._set(index, frontier)
+        
+        if self.show_considering:
+            considering = color_values['considering']
+            closed_indices = self.closed_indices
+            for index in event.neighbors:
+                if index not in closed_indices:
+                    self._mark(index, considering)
+        self._mark(current, color_values['current'])
+        
+        return {
+            'step': self.step,
+            'current': self.graph.node_at(current),
+            'g_cost': event.g_cost,
+            'h_cost': event.h_cost,
+            'f_cost': event.g_cost + event.h_cost,
+            'action': event.action,
+            'open_count': len(self.open_indices),
+            'closed_count': len(self.closed_indices)
+        }
+    
+    def show_path(self, path):
+        """Frame'i statik katman + bulunan yol olarak ayarla (son durum)"""
+        self.frame[:] = self.base
+        self.transient = []
+        self.dirty = []
+        paint_cells(self.frame, self.graph.cells, node_indices(self.graph, path),
+                    self.color_values['path'])
+
+
+class BlitManager:
+    """
+    Sadece animasyonlu artist'leri yeniden çizen yardımcı
+    (matplotlib blitting eğitimindeki yapı)
+    
+    Arka plan (eksenler, grid çizgileri, legend) bir kez çizilip saklanır;
+    her karede sadece artist'ler bu arka planın üzerine çizilir. Pencere
+    yeniden çizildiğinde (boyut değişimi vb.) arka plan yenilenir. Blitting
+    desteklemeyen backend'lerde normal çizime döner.
+    """
+    
+    def __init__(self, canvas, artists):
+        self.canvas = canvas
+        self.artists = list(artists)
+        self.background = None
+        for artist in self.artists:
+            artist.set_animated(True)
+        self._draw_callback = canvas.mpl_connect('draw_event', self._on_draw)
+    
+    def _on_draw(self, event):
+        """Canvas tam çizildiğinde arka planı sakla ve artist'leri çiz"""
+        canvas = self.canvas
+        if event is not None and event.canvas != canvas:
+            return
+        if canvas.supports_blit:
+            self.background = canvas.copy_from_bbox(canvas.figure.bbox)
+        self._draw_artists()
+    
+    def _draw_artists(self):
+        figure = self.canvas.figure
+        for artist in self.artists:
+            figure.draw_artist(artist)
+    
+    def update(self):
+        """Artist'leri arka planın üzerine çiz ve ekrana aktar"""
+        canvas = self.canvas
+        if not canvas.supports_blit:
+            canvas.draw_idle()
+        elif self.background is None:
+            canvas.draw()  # _on_draw arka planı saklar
+        else:
+            canvas.restore_region(self.background)
+            self._draw_artists()
+            canvas.blit(canvas.figure.bbox)
+        canvas.flush_events()
+    
+    def close(self):
+        """Artist'leri normal çizime döndür"""
+        self.canvas.mpl_disconnect(self._draw_callback)
+        for artist in self.artists:
+            artist.set_animated(False)
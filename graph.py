@@ -1,21 +1,115 @@
 """
 Graf veri yapısı - A* algoritması için
 Hazır fonksiyon kullanmadan yazılmıştır
+
+Grid, düz bir uint8 hücre dizisinde (indeks = y * width + x) saklanır.
+Node nesneleri sadece istendiğinde (get_node) oluşturulur.
 """
 
+from array import array
+import numpy as np
+
+# Hücre tipleri (Graph.cells dizisindeki değerler)
+EMPTY = 0
+WALL = 1
+START = 2
+GOAL = 3
+
+CELL_TYPE_NAMES = ('empty', 'wall', 'start', 'goal')
+CELL_TYPE_CODES = {name: code for code, name in enumerate(CELL_TYPE_NAMES)}
+
+# 8 yönlü komşuluk (dx, dy)
+NEIGHBOR_DIRECTIONS = (
+    (-1, -1), (-1, 0), (-1, 1),  # Üst
+    (0, -1),           (0, 1),   # Yan
+    (1, -1),  (1, 0),  (1, 1)   # Alt
+)
+
+INFINITY = float('inf')
+
+STRAIGHT_COST = 10
+DIAGONAL_COST = 14  # Yaklaşık sqrt(2) * 10
+
+# Arama sırasında düğüm durumları (SearchScratch.states)
+UNTOUCHED = 0
+OPEN = 1
+CLOSED = 2
+
+
+class GridPoint:
+    """Heuristic fonksiyonları için hafif koordinat nesnesi"""
+    
+    __slots__ = ('x', 'y')
+    
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+
+class SearchScratch:
+    """
+    Bir aramanın kullandığı grid boyutlu diziler
+    
+    Diziler aramalar arasında yeniden kullanılır. Her arama yeni bir nesil
+    (generation) numarası alır; stamps[i] bu nesle eşit değilse i. hücrenin
+    g/parent/state değerleri eski sayılır. Böylece arama başında tüm grid'i
+    sıfırlamak gerekmez, maliyet sadece dokunulan düğüm sayısı kadardır.
+    """
+    
+    __slots__ = ('size', 'generation', 'stamps', 'g_costs', 'parents', 'states')
+    
+    MAX_GENERATION = 0xFFFFFFFF
+    
+    def __init__(self, size):
+        self.size = size
+        self.generation = 0
+        self.stamps = array('I', bytes(4 * size))
+        self.g_costs = array('d', [0.0]) * size
+        self.parents = array('i', [-1]) * size
+        self.states = bytearray(size)
+    
+    def begin(self):
+        """Yeni arama için nesil numarasını artır"""
+        self.generation += 1
+        if self.generation > self.MAX_GENERATION:
+            # Taşma: damgaları bir kez gerçekten sıfırla
+            self.stamps = array('I', bytes(4 * self.size))
+            self.generation = 1
+        return self.generation
+
+
 class Node:
-    """Graf düğümü sınıfı"""
+    """
+    Graf düğümü sınıfı
+    
+    __slots__ ile sözlüksüz tutulur; hücre tipi int olarak (EMPTY, WALL,
+    START, GOAL) saklanır. node_type özelliği eski string arayüzünü sağlar.
+    Koordinatlar değişmediği için hash bir kez hesaplanır.
+    """
+    
+    __slots__ = ('x', 'y', 'cell_type', 'g_cost', 'h_cost', 'f_cost',
+                 'parent', 'visited', 'in_open_set', '_hash')
     
-    def __init__(self, x, y, node_type='empty'):
+    def __init__(self, x, y, node_type=EMPTY):
         self.x = x
         self.y = y
-        self.node_type = node_type  # 'empty', 'wall', 'start', 'goal'
-        self.g_cost = float('inf')  # Başlangıçtan bu düğüme maliyet
+        self.cell_type = CELL_TYPE_CODES[node_type] if isinstance(node_type, str) else int(node_type)
+        self.g_cost = INFINITY  # Başlangıçtan bu düğüme maliyet
         self.h_cost = 0  # Heuristic maliyet (hedefe tahmini)
-        self.f_cost = float('inf')  # g + h
+        self.f_cost = INFINITY  # g + h
         self.parent = None  # Yol takibi için
         self.visited = False
         self.in_open_set = False
+        self._hash = hash((x, y))
+    
+    @property
+    def node_type(self):
+        """Hücre tipi string olarak: 'empty', 'wall', 'start', 'goal'"""
+        return CELL_TYPE_NAMES[self.cell_type]
+    
+    @node_type.setter
+    def node_type(self, value):
+        self.cell_type = CELL_TYPE_CODES[value]
     
     def __lt__(self, other):
         """Priority queue için karşılaştırma"""
@@ -24,16 +118,18 @@ class Node:
         return self.f_cost < other.f_cost
     
     def __eq__(self, other):
+        if self is other:
+            return True
         return self.x == other.x and self.y == other.y
     
     def __hash__(self):
-        return hash((self.x, self.y))
+        return self._hash
     
     def reset(self):
         """Düğümü algoritma için sıfırla"""
-        self.g_cost = float('inf')
+        self.g_cost = INFINITY
         self.h_cost = 0
-        self.f_cost = float('inf')
+        self.f_cost = INFINITY
         self.parent = None
         self.visited = False
         self.in_open_set = False
@@ -42,73 +138,248 @@ class Node:
 class Graph:
     """2D Grid tabanlı graf sınıfı"""
     
+    # Hareket maliyet modeli: kenar maliyetleri buradan okunur, heuristic'ler
+    # bu birime ölçeklenir (bkz. AStar)
+    straight_cost = STRAIGHT_COST
+    diagonal_cost = DIAGONAL_COST
+    integer_costs = True  # Maliyetler tamsayı (bucket open set için)
+    
     def __init__(self, width, height):
         self.width = width
         self.height = height
-        self.nodes = {}
+        self.cells = None  # uint8 hücre tipleri, indeks = y * width + x
+        self.nodes = {}  # Oluşturulmuş Node nesneleri (lazy önbellek)
+        self.version = 0  # Hücreler her değiştiğinde artar (önbellek geçersizleme)
+        self.passability_version = 0  # Sadece duvar eklenince / kalkınca artar
+        self.neighbor_masks = None  # Hücre başına geçilebilir komşu yönleri (bitmask)
         self.start_node = None
         self.goal_node = None
+        self._scratch_pool = []  # Boşta bekleyen SearchScratch nesneleri
+        self._listeners = []  # Geçilebilirlik değişikliği dinleyicileri
+        self._coordinates = None  # coordinate_arrays önbelleği
         self.create_grid()
     
+    @classmethod
+    def from_array(cls, array):
+        """
+        2D diziden graf oluştur (harita yükleme)
+        
+        Args:
+            array: (height, width) boyutlu dizi, sıfırdan farklı değerler duvar
+        """
+        array = np.asarray(array)
+        height, width = array.shape
+        graph = cls(width, height)
+        graph.cells[array.reshape(-1) != 0] = WALL
+        graph._cells_replaced()
+        return graph
+    
+    @classmethod
+    def from_cells(cls, cells, width, height):
+        """
+        Hücre tipi dizisinin kopyasından graf oluştur (başlangıç / hedef dahil)
+        
+        Args:
+            cells: width * height boyutlu düz hücre tipi dizisi (Graph.cells)
+        """
+        graph = cls(width, height)
+        graph.cells[:] = cells
+        graph._cells_replaced()
+        for cell_type, attribute in ((START, 'start_node'), (GOAL, 'goal_node')):
+            found = np.flatnonzero(graph.cells == cell_type)
+            if found.size:
+                setattr(graph, attribute, graph.node_at(int(found[0])))
+        return graph
+    
     def create_grid(self):
         """Grid oluştur"""
-        for x in range(self.width):
-            for y in range(self.height):
-                self.nodes[(x, y)] = Node(x, y)
+        size = self.width * self.height
+        self.cells = np.zeros(size, dtype=np.uint8)
+        self.nodes = {}
+        self._scratch_pool = []
+        
+        # Yön bitmask'i -> (indeks farkı, maliyet) listesi (sınıfın maliyet modeliyle)
+        self._mask_neighbors = []
+        for mask in range(256):
+            entries = []
+            for bit, (dx, dy) in enumerate(NEIGHBOR_DIRECTIONS):
+                if mask & (1 << bit):
+                    cost = self.diagonal_cost if dx and dy else self.straight_cost
+                    entries.append((dx + dy * self.width, cost))
+            self._mask_neighbors.append(tuple(entries))
+        
+        self._cells_replaced()
+    
+    def _cells_replaced(self):
+        """Hücre dizisi toplu değiştiğinde komşuluk maskelerini ve düğümleri yenile"""
+        self.version += 1
+        self.passability_version += 1
+        self.neighbor_masks = self._build_neighbor_masks()
+        for (x, y), node in self.nodes.items():
+            node.cell_type = int(self.cells[y * self.width + x])
+        for listener in self._listeners:
+            listener(None, None)
+    
+    def add_listener(self, listener):
+        """
+        Geçilebilirlik değişikliklerini dinle (önbellekler için)
+        
+        listener(index, passable): index hücresi duvar oldu (passable=False)
+        ya da açıldı (True). Tüm hücreler toplu değiştiğinde (None, None).
+        """
+        self._listeners.append(listener)
+    
+    def remove_listener(self, listener):
+        """add_listener ile eklenen dinleyiciyi kaldır"""
+        self._listeners.remove(listener)
+    
+    def _build_neighbor_masks(self):
+        """
+        Her hücre için geçilebilir komşu yönlerinin bitmask'i
+        (bit k: NEIGHBOR_DIRECTIONS[k] yönündeki komşu grid içinde ve duvar değil)
+        """
+        passable = np.zeros((self.height + 2, self.width + 2), dtype=bool)
+        passable[1:-1, 1:-1] = self.grid != WALL
+        
+        masks = np.zeros((self.height, self.width), dtype=np.uint8)
+        for bit, (dx, dy) in enumerate(NEIGHBOR_DIRECTIONS):
+            shifted = passable[1 + dy:1 + dy + self.height, 1 + dx:1 + dx + self.width]
+            masks |= shifted.astype(np.uint8) << bit
+        return bytearray(masks.tobytes())
+    
+    @property
+    def grid(self):
+        """Hücre dizisinin (height, width) görünümü"""
+        return self.cells.reshape(self.height, self.width)
+    
+    def coordinate_arrays(self):
+        """Tüm hücrelerin (xs, ys) koordinat dizileri, indeks = y * width + x (salt okunur)"""
+        if self._coordinates is None:
+            ys, xs = np.divmod(np.arange(self.width * self.height, dtype=np.int64), self.width)
+            xs.flags.writeable = False
+            ys.flags.writeable = False
+            self._coordinates = (xs, ys)
+        return self._coordinates
+    
+    def in_bounds(self, x, y):
+        """Koordinat grid içinde mi?"""
+        return 0 <= x < self.width and 0 <= y < self.height
+    
+    def index_of(self, x, y):
+        """Koordinatı düz indekse çevir"""
+        return y * self.width + x
+    
+    def coords_of(self, index):
+        """Düz indeksi (x, y) koordinatına çevir"""
+        y, x = divmod(index, self.width)
+        return x, y
+    
+    def cell_type(self, x, y):
+        """Hücre tipini (int) döndür, grid dışı için None"""
+        if not self.in_bounds(x, y):
+            return None
+        return int(self.cells[y * self.width + x])
+    
+    def is_wall(self, x, y):
+        """Hücre duvar mı?"""
+        return self.in_bounds(x, y) and self.cells[y * self.width + x] == WALL
     
     def get_node(self, x, y):
         """Koordinatlara göre düğüm getir"""
-        if (x, y) in self.nodes:
-            return self.nodes[(x, y)]
-        return None
+        if not self.in_bounds(x, y):
+            return None
+        
+        node = self.nodes.get((x, y))
+        if node is None:
+            cell_type = int(self.cells[y * self.width + x])
+            # setdefault: eşzamanlı aramalarda aynı düğüm iki kez oluşturulmasın
+            node = self.nodes.setdefault((x, y), Node(x, y, cell_type))
+        return node
+    
+    def node_at(self, index):
+        """Düz indekse göre düğüm getir"""
+        y, x = divmod(index, self.width)
+        return self.get_node(x, y)
+    
+    def acquire_scratch(self):
+        """
+        Arama için bir SearchScratch al
+        
+        Her eşzamanlı arama kendi scratch nesnesini kullanır; iş bitince
+        release_scratch ile havuza geri verilir (list.pop/append thread-safe).
+        """
+        try:
+            return self._scratch_pool.pop()
+        except IndexError:
+            return SearchScratch(self.width * self.height)
+    
+    def release_scratch(self, scratch):
+        """Scratch nesnesini havuza geri ver"""
+        self._scratch_pool.append(scratch)
+    
+    def _set_cell(self, x, y, cell_type):
+        """Hücre tipini değiştir, oluşturulmuş düğümü de güncelle"""
+        index = y * self.width + x
+        was_passable = self.cells[index] != WALL
+        self.cells[index] = cell_type
+        self.version += 1
+        
+        # Komşuların bu hücreye bakan maske bitlerini güncelle
+        if was_passable != (cell_type != WALL):
+            self.passability_version += 1
+            masks = self.neighbor_masks
+            for bit, (dx, dy) in enumerate(NEIGHBOR_DIRECTIONS):
+                if self.in_bounds(x + dx, y + dy):
+                    # Komşudan bu hücreye yön: ters yön, bit 7 - k
+                    masks[index + dx + dy * self.width] ^= 1 << (7 - bit)
+            
+            for listener in self._listeners:
+                listener(index, cell_type != WALL)
+        
+        node = self.nodes.get((x, y))
+        if node is not None:
+            node.cell_type = cell_type
     
     def set_start(self, x, y):
         """Başlangıç düğümünü ayarla"""
         if self.start_node:
-            self.start_node.node_type = 'empty'
+            self._set_cell(self.start_node.x, self.start_node.y, EMPTY)
         
         node = self.get_node(x, y)
         if node:
-            node.node_type = 'start'
+            self._set_cell(x, y, START)
             self.start_node = node
     
     def set_goal(self, x, y):
         """Hedef düğümünü ayarla"""
         if self.goal_node:
-            self.goal_node.node_type = 'empty'
+            self._set_cell(self.goal_node.x, self.goal_node.y, EMPTY)
         
         node = self.get_node(x, y)
         if node:
-            node.node_type = 'goal'
+            self._set_cell(x, y, GOAL)
             self.goal_node = node
     
     def set_wall(self, x, y):
         """Duvar ekle"""
-        node = self.get_node(x, y)
-        if node and node.node_type == 'empty':
-            node.node_type = 'wall'
+        if self.cell_type(x, y) == EMPTY:
+            self._set_cell(x, y, WALL)
     
     def remove_wall(self, x, y):
         """Duvarı kaldır"""
-        node = self.get_node(x, y)
-        if node and node.node_type == 'wall':
-            node.node_type = 'empty'
+        if self.cell_type(x, y) == WALL:
+            self._set_cell(x, y, EMPTY)
+    
+    def neighbor_indices(self, index):
+        """Düz indeksin geçilebilir komşularını (indeks, maliyet) olarak getir"""
+        return [(index + offset, cost)
+                for offset, cost in self._mask_neighbors[self.neighbor_masks[index]]]
     
     def get_neighbors(self, node):
         """Düğümün komşularını getir (8 yön)"""
         neighbors = []
-        directions = [
-            (-1, -1), (-1, 0), (-1, 1),  # Üst
-            (0, -1),           (0, 1),   # Yan
-            (1, -1),  (1, 0),  (1, 1)   # Alt
-        ]
-        
-        for dx, dy in directions:
-            new_x, new_y = node.x + dx, node.y + dy
-            neighbor = self.get_node(new_x, new_y)
-            
-            if neighbor and neighbor.node_type != 'wall':
-                neighbors.append(neighbor)
+        for neighbor, _ in self.neighbor_indices(node.y * self.width + node.x):
+            neighbors.append(self.node_at(neighbor))
         
         return neighbors
     
@@ -119,12 +390,16 @@ class Graph:
         
         # Çapraz hareket için Euclidean benzeri
         if dx > 0 and dy > 0:
-            return 14  # Yaklaşık sqrt(2) * 10
+            return self.diagonal_cost
         else:
-            return 10  # Düz hareket
+            return self.straight_cost  # Düz hareket
     
     def reset_all_nodes(self):
-        """Tüm düğümleri algoritma için sıfırla"""
+        """
+        Oluşturulmuş düğümlerin arama alanlarını sıfırla
+        (AStar arama durumunu düğümlerde tutmaz, geriye uyumluluk için;
+        arama dizileri SearchScratch nesil damgalarıyla sıfırlanır)
+        """
         for node in self.nodes.values():
             node.reset()
     
@@ -140,32 +415,64 @@ class Graph:
             x = random.randint(0, self.width - 1)
             y = random.randint(0, self.height - 1)
             
-            node = self.get_node(x, y)
-            if node and node.node_type == 'empty':
-                node.node_type = 'wall'
+            index = y * self.width + x
+            if self.cells[index] == EMPTY:
+                self.cells[index] = WALL
                 added_walls += 1
+        
+        self._cells_replaced()
     
     def create_maze_pattern(self):
         """Labirent benzeri desen oluştur"""
-        # Basit labirent pattern
-        for x in range(0, self.width, 4):
-            for y in range(self.height):
-                if y % 4 != 0:
-                    self.set_wall(x, y)
+        # Basit labirent pattern: her 4. sütun ve satır duvar, 4'ün katı
+        # kesişimleri geçit olarak kalır
+        xs = np.arange(self.width)
+        ys = np.arange(self.height)
+        column_walls = (xs[np.newaxis, :] % 4 == 0) & (ys[:, np.newaxis] % 4 != 0)
+        row_walls = (ys[:, np.newaxis] % 4 == 0) & (xs[np.newaxis, :] % 4 != 0)
         
-        for y in range(0, self.height, 4):
-            for x in range(self.width):
-                if x % 4 != 0:
-                    self.set_wall(x, y)
+        grid = self.grid
+        mask = (column_walls | row_walls) & (grid == EMPTY)
+        grid[mask] = WALL
+        self._cells_replaced()
     
     def get_total_nodes(self):
         """Toplam düğüm sayısını döndür"""
-        return len(self.nodes)
+        return self.width * self.height
     
     def get_empty_nodes_count(self):
         """Boş düğüm sayısını döndür"""
-        count = 0
-        for node in self.nodes.values():
-            if node.node_type == 'empty':
-                count += 1
-        return count
\ No newline at end of file
+        return int(np.count_nonzero(self.cells == EMPTY))
+
+
+class ReverseGraphView:
+    """
+    Grafın ters yönlü görünümü (geriye doğru aramalar için)
+    
+    neighbor_indices(i), i'ye gelen kenarları (önceki düğüm, maliyet) olarak
+    döndürür. Grid'de kenarlar simetrik olduğu için bunlar komşuların
+    kendisidir. Başlangıç ve hedef yer değiştirir; diğer her şey asıl
+    grafa yönlendirilir.
+    """
+    
+    def __init__(self, graph):
+        self.graph = graph
+    
+    def __getattr__(self, name):
+        return getattr(self.graph, name)
+    
+    @property
+    def start_node(self):
+        return self.graph.goal_node
+    
+    @property
+    def goal_node(self):
+        return self.graph.start_node
+    
+    def neighbor_indices(self, index):
+        """index'e gelen kenarlar: (önceki düğüm indeksi, maliyet)"""
+        return self.graph.neighbor_indices(index)
+    
+    def get_neighbors(self, node):
+        """Düğüme gelen kenarların başladığı düğümler"""
+        return self.graph.get_neighbors(node)
@@ -0,0 +1,131 @@
+"""
+Hedef başına heuristic alanı önbelleği
+
+Aynı hedefe giden çok sayıda sorguda (örn. bir filodaki ajanlar birkaç
+ortak hedefe gidiyor) h değerleri her sorguda yeniden hesaplanmaz. Hedef
+başına bütün grid için bir h dizisi saklanır ve arama sadece dizi okur.
+
+İki mod vardır:
+    exact=False: AStar'ın heuristic'inin toplu biçimiyle hesaplanan alan
+        (anahtar: hedef, heuristic ismi, maliyet modeli)
+    exact=True: hedeften ters Dijkstra ile gerçek mesafe alanı; A* sadece
+        optimal yol üzerindeki düğümleri genişletir (heuristic ne olursa
+        olsun bu alan kullanılır, ulaşılamayan hücrelerde sonsuz)
+
+Kayıtlar en son kullanılma sırasıyla tutulur ve toplam boyut memory_budget
+baytını aşınca en eskiler atılır (LRU). Önbellek Graph'a dinleyici olarak
+bağlanır: duvar eklemek mesafeleri sadece artırdığı için alanlar alt sınır
+olarak geçerli kalır; bir hücre açıldığında (ya da grid toplu
+değiştiğinde) tüm alanlar silinir.
+"""
+
+from collections import OrderedDict
+from array import array
+import numpy as np
+from landmarks import distance_table, UNREACHED
+
+
+class HeuristicFieldCache:
+    """
+    Hedef başına h dizisi önbelleği (bellek bütçeli LRU)
+    
+    Kullanım:
+        astar.heuristic_cache = HeuristicFieldCache(graph, exact=True)
+        astar.search(start, goal)  # aynı hedefe sonraki aramalar alanı okur
+    """
+    
+    def __init__(self, graph, memory_budget=64 * 1024 * 1024, exact=False):
+        self.graph = graph
+        self.memory_budget = memory_budget
+        self.exact = exact
+        self.fields = OrderedDict()  # anahtar -> h dizisi
+        self.memory_used = 0
+        
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        
+        graph.add_listener(self._on_cell_changed)
+    
+    def detach(self):
+        """Graf dinleyicisini kaldır ve önbelleği boşalt"""
+        self.graph.remove_listener(self._on_cell_changed)
+        self.clear()
+    
+    def make_key(self, astar, goal_index):
+        """Alan anahtarı (exact modda heuristic'ten bağımsız)"""
+        costs = (self.graph.straight_cost, self.graph.diagonal_cost)
+        if self.exact:
+            return (goal_index, None, costs)
+        return (goal_index, astar.heuristic_name, costs)
+    
+    def field(self, astar, goal):
+        """
+        goal için h dizisi (indeks = y * width + x)
+        
+        Returns:
+            array ya da heuristic'in toplu biçimi yoksa None (exact=False)
+        """
+        key = self.make_key(astar, goal.y * self.graph.width + goal.x)
+        values = self.fields.get(key)
+        if values is not None:
+            self.hits += 1
+            self.fields.move_to_end(key)
+            return values
+        
+        self.misses += 1
+        values = self._exact_field(key[0]) if self.exact else astar.heuristic_field(goal)
+        if values is not None:
+            self.store(key, values)
+        return values
+    
+    def _exact_field(self, goal_index):
+        """Hedeften ters Dijkstra mesafeleri (maliyetler simetrik)"""
+        distances = distance_table(self.graph, goal_index).astype(np.float64)
+        distances[distances == UNREACHED] = np.inf
+        return array('d', distances.tobytes())
+    
+    def store(self, key, values):
+        """Alanı ekle, bütçe aşılırsa en eski alanları at"""
+        size = values.itemsize * len(values)
+        if size > self.memory_budget:
+            return
+        if key in self.fields:
+            self._remove(key)
+        self.fields[key] = values
+        self.memory_used += size
+        while self.memory_used > self.memory_budget:
+            self._remove(next(iter(self.fields)))
+            self.evictions += 1
+    
+    def _remove(self, key):
+        values = self.fields.pop(key)
+        self.memory_used -= values.itemsize * len(values)
+    
+    def _on_cell_changed(self, index, passable):
+        """Graph dinleyicisi: açılan hücre kısayol olabilir, alanları sil"""
+        if index is None or passable:
+            self.invalidations += len(self.fields)
+            self.clear()
+    
+    def clear(self):
+        """Tüm alanları sil (sayaçlar korunur)"""
+        self.fields.clear()
+        self.memory_used = 0
+    
+    def get_stats(self):
+        """Önbellek sayaçlarını döndür"""
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self.fields),
+            'memory_used': self.memory_used,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'evictions': self.evictions,
+            'invalidations': self.invalidations
+        }
+    
+    def __len__(self):
+        return len(self.fields)
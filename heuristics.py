@@ -4,6 +4,9 @@ Hazır fonksiyon kullanmadan yazılmıştır
 """
 
 import math
+import warnings
+import numpy as np
+from graph import GridPoint
 
 class Heuristics:
     """Heuristic fonksiyonları sınıfı"""
@@ -111,12 +114,186 @@ class Heuristics:
         dy = abs(node1.y - node2.y)
         
         return (dx ** p + dy ** p) ** (1.0 / p)
+    
+    # Toplu (vektörel) biçimler: xs, ys koordinat dizileri, hedef (goal_x,
+    # goal_y); her hücre için skaler biçimle aynı değeri (kayan noktada son
+    # basamak yuvarlaması dışında) numpy dizisi olarak döndürür. Bütün grid
+    # için h alanı hesaplamakta kullanılır.
+    
+    @staticmethod
+    def manhattan_distance_batch(xs, ys, goal_x, goal_y):
+        """Bkz. manhattan_distance"""
+        return np.abs(xs - goal_x) + np.abs(ys - goal_y)
+    
+    @staticmethod
+    def euclidean_distance_batch(xs, ys, goal_x, goal_y):
+        """Bkz. euclidean_distance"""
+        dx = (xs - goal_x).astype(np.float64)
+        dy = (ys - goal_y).astype(np.float64)
+        return np.sqrt(dx * dx + dy * dy)
+    
+    @staticmethod
+    def chebyshev_distance_batch(xs, ys, goal_x, goal_y):
+        """Bkz. chebyshev_distance"""
+        return np.maximum(np.abs(xs - goal_x), np.abs(ys - goal_y))
+    
+    @staticmethod
+    def octile_distance_batch(xs, ys, goal_x, goal_y):
+        """Bkz. octile_distance"""
+        dx = np.abs(xs - goal_x)
+        dy = np.abs(ys - goal_y)
+        diagonal = np.minimum(dx, dy)
+        return diagonal * 14 + (np.maximum(dx, dy) - diagonal) * 10
+    
+    @staticmethod
+    def hamming_distance_batch(xs, ys, goal_x, goal_y):
+        """Bkz. hamming_distance"""
+        return (xs != goal_x).astype(np.int64) + (ys != goal_y)
+    
+    @staticmethod
+    def weighted_euclidean_batch(xs, ys, goal_x, goal_y, weight=1.0):
+        """Bkz. weighted_euclidean"""
+        return weight * Heuristics.euclidean_distance_batch(xs, ys, goal_x, goal_y)
+    
+    @staticmethod
+    def canberra_distance_batch(xs, ys, goal_x, goal_y):
+        """Bkz. canberra_distance"""
+        result = np.zeros(np.broadcast(xs, ys).shape)
+        for values, goal_value in ((xs, goal_x), (ys, goal_y)):
+            difference = np.abs(values - goal_value).astype(np.float64)
+            total = (np.abs(values) + np.abs(goal_value)).astype(np.float64)
+            result += np.divide(difference, total, out=np.zeros_like(difference), where=total != 0)
+        return result
+    
+    @staticmethod
+    def minkowski_distance_batch(xs, ys, goal_x, goal_y, p=3):
+        """Bkz. minkowski_distance"""
+        dx = np.abs(xs - goal_x)
+        dy = np.abs(ys - goal_y)
+        return (dx ** p + dy ** p) ** (1.0 / p)
+
+
+# Tamsayı koordinatlar için her zaman tamsayı döndüren heuristic'ler
+INTEGER_HEURISTICS = {'manhattan', 'chebyshev', 'octile', 'hamming'}
+
+# Heuristic'lerin kendi birimlerinde bir düz ve bir çapraz adımın değeri
+# (ağırlık hariç). Grafın maliyet modeline ölçekleme bunlardan hesaplanır
+# (bkz. HeuristicSelector.cost_scale). octile zaten maliyet biriminde
+# tanımlıdır, burada olmayan heuristic'ler ölçeklenmez.
+UNIT_STEPS = {
+    'manhattan': (1, 2),
+    'euclidean': (1, math.sqrt(2)),
+    'chebyshev': (1, 1),
+    'hamming': (1, 2),
+    'weighted_euclidean': (1, math.sqrt(2)),
+    'canberra': (1, 2),
+    'minkowski': (1, 2 ** (1 / 3))
+}
+
+# register_heuristic ile eklenen heuristic'ler (her HeuristicSelector'a dahil;
+# bir grafa bağlı olanlar sadece o grafın seçicisine)
+REGISTERED_HEURISTICS = {}
+REGISTERED_BATCH_HEURISTICS = {}
+REGISTERED_GRAPHS = {}  # isim -> heuristic'in ait olduğu graf
+
+# check_admissibility sonuçları: (isim, maliyetler) -> en kötü h / gerçek maliyet oranı
+_ADMISSIBILITY_RATIOS = {}
+
+
+def octile_for_costs(straight_cost, diagonal_cost):
+    """
+    Verilen düz / çapraz adım maliyetleriyle engelsiz griddeki tam mesafe
+    
+    Çapraz adım iki düz adımdan pahalıysa çapraz ilerleme iki düz adımla yapılır.
+    """
+    diagonal_cost = min(diagonal_cost, 2 * straight_cost)
+    
+    def octile(node1, node2):
+        dx = abs(node1.x - node2.x)
+        dy = abs(node1.y - node2.y)
+        diagonal = min(dx, dy)
+        return diagonal * diagonal_cost + (max(dx, dy) - diagonal) * straight_cost
+    return octile
+
+
+def octile_batch_for_costs(straight_cost, diagonal_cost):
+    """octile_for_costs'un toplu biçimi"""
+    diagonal_cost = min(diagonal_cost, 2 * straight_cost)
+    
+    def octile_batch(xs, ys, goal_x, goal_y):
+        dx = np.abs(xs - goal_x)
+        dy = np.abs(ys - goal_y)
+        diagonal = np.minimum(dx, dy)
+        return diagonal * diagonal_cost + (np.maximum(dx, dy) - diagonal) * straight_cost
+    return octile_batch
+
+
+def register_heuristic(name, func, integral=False, info=None, unit_steps=None, batch=None,
+                       graph=None):
+    """
+    Yeni bir heuristic'i isimle kaydet (örn. grafa özel tablolar kullanan
+    landmarks.LandmarkHeuristic); sonra oluşturulan AStar(graph, name) onu kullanır
+    
+    Args:
+        name: Heuristic ismi
+        func: func(node1, node2) -> tahmini maliyet
+        integral: Her zaman tamsayı döndürüyor mu (tamsayı h alanı için)
+        info: HEURISTIC_INFO kaydı
+        unit_steps: (düz adım, çapraz adım) değerleri; None ise func zaten
+            grafın maliyet biriminde değer döndürür ve ölçeklenmez
+        batch: İsteğe bağlı toplu biçim batch(xs, ys, goal_x, goal_y) -> dizi
+        graph: Heuristic sadece bu grafta geçerliyse graf; başka graflardaki
+            aramalarda bu isim octile'a düşer (bkz. HeuristicSelector)
+    """
+    _forget_admissibility(name)
+    REGISTERED_HEURISTICS[name] = func
+    if graph is not None:
+        REGISTERED_GRAPHS[name] = graph
+    else:
+        REGISTERED_GRAPHS.pop(name, None)
+    if batch is not None:
+        REGISTERED_BATCH_HEURISTICS[name] = batch
+    else:
+        REGISTERED_BATCH_HEURISTICS.pop(name, None)
+    if unit_steps is not None:
+        UNIT_STEPS[name] = unit_steps
+    else:
+        UNIT_STEPS.pop(name, None)
+    if integral:
+        INTEGER_HEURISTICS.add(name)
+    else:
+        INTEGER_HEURISTICS.discard(name)
+    if info is not None:
+        HEURISTIC_INFO[name] = info
+
+
+def unregister_heuristic(name):
+    """register_heuristic ile eklenen heuristic'i kaldır (yoksa bir şey yapma)"""
+    if REGISTERED_HEURISTICS.pop(name, None) is None:
+        return
+    REGISTERED_BATCH_HEURISTICS.pop(name, None)
+    REGISTERED_GRAPHS.pop(name, None)
+    UNIT_STEPS.pop(name, None)
+    INTEGER_HEURISTICS.discard(name)
+    HEURISTIC_INFO.pop(name, None)
+    _forget_admissibility(name)
+
+
+def _forget_admissibility(name):
+    """Aynı isimle önceden hesaplanmış admissibility sonuçlarını sil"""
+    for key in [key for key in _ADMISSIBILITY_RATIOS if key[0] == name]:
+        del _ADMISSIBILITY_RATIOS[key]
 
 
 class HeuristicSelector:
-    """Heuristic seçici sınıfı"""
+    """
+    Heuristic seçici sınıfı
+    
+    graph verilirse o grafa bağlı kayıtlı heuristic'ler de dahil edilir;
+    başka bir grafa bağlı bir isim istenirse octile kullanılır.
+    """
     
-    def __init__(self):
+    def __init__(self, graph=None):
         self.heuristics = {
             'manhattan': Heuristics.manhattan_distance,
             'euclidean': Heuristics.euclidean_distance,
@@ -127,21 +304,144 @@ class HeuristicSelector:
             'canberra': Heuristics.canberra_distance,
             'minkowski': lambda n1, n2: Heuristics.minkowski_distance(n1, n2, 3)
         }
+        # Başka bir grafa bağlı kayıtlar (tabloları bu grafa ait değil) dışarıda kalır
+        registered = {name: func for name, func in REGISTERED_HEURISTICS.items()
+                      if REGISTERED_GRAPHS.get(name, graph) is graph}
+        self.heuristics.update(registered)
+        self.batch_heuristics = {
+            'manhattan': Heuristics.manhattan_distance_batch,
+            'euclidean': Heuristics.euclidean_distance_batch,
+            'chebyshev': Heuristics.chebyshev_distance_batch,
+            'octile': Heuristics.octile_distance_batch,
+            'hamming': Heuristics.hamming_distance_batch,
+            'weighted_euclidean': lambda xs, ys, gx, gy: Heuristics.weighted_euclidean_batch(
+                xs, ys, gx, gy, 1.2),
+            'canberra': Heuristics.canberra_distance_batch,
+            'minkowski': lambda xs, ys, gx, gy: Heuristics.minkowski_distance_batch(xs, ys, gx, gy, 3)
+        }
+        for name in registered:
+            # Toplu biçimi verilmemiş kayıtlı heuristic, aynı isimli hazır biçimi gölgeler
+            self.batch_heuristics.pop(name, None)
+            if name in REGISTERED_BATCH_HEURISTICS:
+                self.batch_heuristics[name] = REGISTERED_BATCH_HEURISTICS[name]
+    
+    def resolve(self, name):
+        """
+        Kullanılacak heuristic ismi: bilinmiyorsa euclidean, başka bir grafa
+        bağlı kayıtlı bir heuristic ise octile (onun alt sınırı)
+        """
+        if name in self.heuristics:
+            return name
+        return 'octile' if name in REGISTERED_GRAPHS else 'euclidean'
+    
+    def get_heuristic(self, name, costs=None):
+        """
+        İsme göre heuristic fonksiyonu döndür
+        
+        Args:
+            name: Heuristic ismi (bkz. resolve)
+            costs: (düz, çapraz) adım maliyetleri; verilirse değerler bu
+                maliyet birimine ölçeklenir (bkz. cost_scale)
+        """
+        name = self.resolve(name)
+        func = self.heuristics[name]
+        if costs is None:
+            return func
+        if name == 'octile':
+            return func if tuple(costs) == (10, 14) else octile_for_costs(*costs)
+        
+        scale = self.cost_scale(name, *costs)
+        if scale == 1:
+            return func
+        return lambda node1, node2: scale * func(node1, node2)
+    
+    def get_batch_heuristic(self, name, costs=None):
+        """
+        get_heuristic'in toplu biçimi: f(xs, ys, goal_x, goal_y) -> numpy dizisi
+        
+        Returns:
+            Toplu fonksiyon ya da heuristic'in toplu biçimi yoksa None
+        """
+        name = self.resolve(name)
+        func = self.batch_heuristics.get(name)
+        if func is None or costs is None:
+            return func
+        if name == 'octile':
+            return func if tuple(costs) == (10, 14) else octile_batch_for_costs(*costs)
+        
+        scale = self.cost_scale(name, *costs)
+        if scale == 1:
+            return func
+        return lambda xs, ys, goal_x, goal_y: scale * func(xs, ys, goal_x, goal_y)
+    
+    def cost_scale(self, name, straight_cost, diagonal_cost):
+        """
+        Heuristic'i maliyet birimine çeviren en büyük admissible çarpan
+        
+        Norm benzeri heuristic'lerde (homojen ve dışbükey) en kötü yön düz ya
+        da tam çapraz harekettir; iki oranın küçüğüyle çarpılan heuristic
+        engelsiz gridde hiçbir yönde gerçek maliyeti aşmaz.
+        """
+        steps = UNIT_STEPS.get(name)
+        if steps is None:
+            return 1
+        straight, diagonal = steps
+        scale = min(straight_cost / straight, diagonal_cost / diagonal)
+        return int(scale) if float(scale).is_integer() else scale
+    
+    def is_integral(self, name, costs=None):
+        """Heuristic tamsayı değer mi döndürüyor? (tamsayı h alanı için)"""
+        name = self.resolve(name)
+        if name not in INTEGER_HEURISTICS:
+            return False
+        return costs is None or isinstance(self.cost_scale(name, *costs), int)
+    
+    def check_admissibility(self, name, costs, radius=6):
+        """
+        Ölçeklenmiş heuristic'i engelsiz griddeki gerçek maliyetlerle karşılaştır
+        
+        Birkaç başlangıç noktası etrafında radius içindeki tüm hedefler
+        denenir. Sonuç (isim, maliyetler) başına bir kez hesaplanır.
+        
+        Returns:
+            float: En kötü h / gerçek maliyet oranı (> 1 ise admissible değil)
+        """
+        key = (name, tuple(costs))
+        if key not in _ADMISSIBILITY_RATIOS:
+            func = self.get_heuristic(name, costs)
+            exact = octile_for_costs(*costs)
+            worst = 0.0
+            for origin_x, origin_y in ((0, 0), (radius, radius), (3 * radius, radius + 1)):
+                origin = GridPoint(origin_x, origin_y)
+                for dx in range(-radius, radius + 1):
+                    for dy in range(-radius, radius + 1):
+                        target = GridPoint(origin_x + dx, origin_y + dy)
+                        if (dx or dy) and target.x >= 0 and target.y >= 0:
+                            worst = max(worst, func(origin, target) / exact(origin, target))
+            _ADMISSIBILITY_RATIOS[key] = worst
+        return _ADMISSIBILITY_RATIOS[key]
     
-    def get_heuristic(self, name):
-        """İsme göre heuristic fonksiyonu döndür"""
-        return self.heuristics.get(name, self.heuristics['euclidean'])
+    def warn_if_inadmissible(self, name, costs):
+        """Heuristic bu maliyet modelinde gerçek maliyeti aşıyorsa uyar"""
+        if name != 'octile' and name not in UNIT_STEPS:
+            # Grafa özel (maliyet biriminde kayıtlı) heuristic'ler denetlenmez
+            return
+        ratio = self.check_admissibility(name, costs)
+        if ratio > 1 + 1e-9:
+            warnings.warn(f"'{name}' heuristic'i {tuple(costs)} maliyet modelinde admissible değil "
+                          f"(gerçek maliyetin {ratio:.2f} katına kadar); "
+                          "bulunan yol optimal olmayabilir", RuntimeWarning, stacklevel=3)
     
     def get_all_names(self):
         """Tüm heuristic isimlerini döndür"""
         return list(self.heuristics.keys())
     
-    def compare_heuristics(self, node1, node2):
-        """Tüm heuristic'leri karşılaştır"""
+    def compare_heuristics(self, node1, node2, costs=None):
+        """Tüm heuristic'leri karşılaştır (costs verilirse maliyet biriminde)"""
         results = {}
-        for name, func in self.heuristics.items():
+        for name in self.heuristics:
             try:
-                results[name] = func(node1, node2)
+                results[name] = self.get_heuristic(name, costs)(node1, node2)
             except:
                 results[name] = float('inf')
         return results
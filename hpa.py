@@ -0,0 +1,357 @@
+"""
+Hiyerarşik yol bulma (HPA*) - küme (cluster) soyutlaması
+
+Harita cluster_size x cluster_size boyutlu kümelere bölünür. Komşu iki
+kümenin sınırında, iki taraftaki hücrelerin de geçilebilir olduğu her
+kesintisiz aralık bir girişe (entrance) dönüşür: kısa aralıklarda ortadaki,
+uzun aralıklarda (>= 6) iki uçtaki hücre çifti geçiş noktası olur. Geçiş
+hücreleri soyut grafın düğümleridir:
+    küme içi kenarlar: aynı kümedeki geçiş hücreleri arasındaki, küme
+        dışına çıkmayan en kısa yol maliyeti (önceden hesaplanır)
+    kümeler arası kenarlar: sınırın iki yanındaki hücre çifti (düz adım)
+
+Sorguda başlangıç ve hedef kendi kümelerindeki geçiş hücrelerine bağlanır,
+soyut grafta A* yapılır, sonra her soyut adım küme içinde hücre hücre
+açılır. Sonuç optimale yakındır ama optimal olmayabilir. Sadece köşeden
+çapraz geçişle bağlanan kümeler soyut grafta görünmez; soyut arama
+başarısız olursa düz A*'a dönülür.
+
+Graph.add_listener ile duvar değişiklikleri izlenir: iç hücre değişirse
+sadece o kümenin küme içi kenarları, sınır hücresi değişirse o sınırın
+girişleri ve iki yanındaki kümeler yeniden hesaplanır (bir sonraki
+sorguda).
+"""
+
+import heapq
+from array import array
+from astar import AStar, INFINITY
+from graph import WALL
+from path_cache import octile_cost
+
+
+def trace_path(parents, index):
+    """parents sözlüğünden kökten index'e yol (indeksler)"""
+    path = []
+    while index != -1:
+        path.append(index)
+        index = parents[index]
+    path.reverse()
+    return path
+
+
+class HierarchicalPathfinder:
+    """HPA* - AStar.find_path ile aynı dönüş biçimi"""
+    
+    def __init__(self, graph, cluster_size=16, heuristic_name='octile'):
+        self.graph = graph
+        self.cluster_size = cluster_size
+        self.heuristic_name = heuristic_name
+        self.astar = AStar(graph, heuristic_name)  # Aynı küme / yedek aramalar
+        
+        self.clusters_x = (graph.width + cluster_size - 1) // cluster_size
+        self.clusters_y = (graph.height + cluster_size - 1) // cluster_size
+        
+        self.border_transitions = {}  # (küme_a, küme_b) -> [(hücre_a, hücre_b), ...]
+        self.inter_edges = {}  # hücre -> {komşu küme hücresi: maliyet}
+        self.intra_edges = {}  # küme -> {hücre: {hücre: maliyet}}
+        self.intra_paths = {}  # küme -> {(hücre, hücre): küme içi yol indeksleri}
+        
+        self.dirty_borders = set()
+        self.dirty_clusters = set()
+        self.needs_rebuild = True
+        graph.add_listener(self._on_cell_changed)
+    
+    def detach(self):
+        """Graf dinleyicisini kaldır"""
+        self.graph.remove_listener(self._on_cell_changed)
+    
+    # Küme geometrisi
+    
+    def cluster_of(self, index):
+        """Hücrenin kümesi (küme_x, küme_y)"""
+        y, x = divmod(index, self.graph.width)
+        return x // self.cluster_size, y // self.cluster_size
+    
+    def cluster_bounds(self, cluster):
+        """Kümenin [x0, x1) x [y0, y1) sınırları"""
+        size = self.cluster_size
+        cluster_x, cluster_y = cluster
+        return (cluster_x * size, min((cluster_x + 1) * size, self.graph.width),
+                cluster_y * size, min((cluster_y + 1) * size, self.graph.height))
+    
+    def cluster_borders(self, cluster):
+        """Kümenin komşularıyla olan sınırları ((küme_a, küme_b), küme_a sol / üst)"""
+        cluster_x, cluster_y = cluster
+        borders = []
+        if cluster_x > 0:
+            borders.append(((cluster_x - 1, cluster_y), cluster))
+        if cluster_x + 1 < self.clusters_x:
+            borders.append((cluster, (cluster_x + 1, cluster_y)))
+        if cluster_y > 0:
+            borders.append(((cluster_x, cluster_y - 1), cluster))
+        if cluster_y + 1 < self.clusters_y:
+            borders.append((cluster, (cluster_x, cluster_y + 1)))
+        return borders
+    
+    # Soyut graf oluşturma
+    
+    def _on_cell_changed(self, index, passable):
+        if index is None:
+            self.needs_rebuild = True
+            return
+        size = self.cluster_size
+        y, x = divmod(index, self.graph.width)
+        cluster = (x // size, y // size)
+        self.dirty_clusters.add(cluster)
+        # Sınır hücresi ise o sınırın girişleri değişebilir
+        for border in self.cluster_borders(cluster):
+            (ax, ay), (bx, by) = border
+            if ax != bx and x in ((bx * size) - 1, bx * size):
+                self.dirty_borders.add(border)
+            elif ay != by and y in ((by * size) - 1, by * size):
+                self.dirty_borders.add(border)
+    
+    def _build_border(self, border):
+        """Sınırdaki girişleri bul, kümeler arası kenarları güncelle"""
+        cells = self.graph.cells
+        width = self.graph.width
+        (ax, ay), (bx, by) = border
+        
+        for cell_a, cell_b in self.border_transitions.get(border, ()):
+            self.inter_edges.get(cell_a, {}).pop(cell_b, None)
+            self.inter_edges.get(cell_b, {}).pop(cell_a, None)
+        
+        # Sınır boyunca karşılıklı hücre çiftleri
+        if ax != bx:
+            x_a = bx * self.cluster_size - 1
+            _, _, y0, y1 = self.cluster_bounds((bx, by))
+            pairs = [(y * width + x_a, y * width + x_a + 1) for y in range(y0, y1)]
+        else:
+            y_a = by * self.cluster_size - 1
+            x0, x1, _, _ = self.cluster_bounds((bx, by))
+            pairs = [(y_a * width + x, (y_a + 1) * width + x) for x in range(x0, x1)]
+        
+        transitions = []
+        run = []
+        for cell_a, cell_b in pairs + [(-1, -1)]:
+            if cell_a >= 0 and cells[cell_a] != WALL and cells[cell_b] != WALL:
+                run.append((cell_a, cell_b))
+                continue
+            if run:
+                if len(run) < 6:
+                    transitions.append(run[len(run) // 2])
+                else:
+                    transitions.extend((run[0], run[-1]))
+                run = []
+        
+        self.border_transitions[border] = transitions
+        straight_cost = self.graph.straight_cost
+        for cell_a, cell_b in transitions:
+            self.inter_edges.setdefault(cell_a, {})[cell_b] = straight_cost
+            self.inter_edges.setdefault(cell_b, {})[cell_a] = straight_cost
+    
+    def _cluster_nodes(self, cluster):
+        """Kümenin geçiş hücreleri"""
+        nodes = set()
+        for border in self.cluster_borders(cluster):
+            side = 0 if border[0] == cluster else 1
+            for transition in self.border_transitions.get(border, ()):
+                nodes.add(transition[side])
+        return nodes
+    
+    def _build_cluster(self, cluster):
+        """Küme içi kenarları (geçiş hücreleri arası mesafeler) hesapla"""
+        nodes = sorted(self._cluster_nodes(cluster))
+        edges = {node: {} for node in nodes}
+        paths = {}
+        # Mesafeler simetrik: her çift bir kez, küçük indeksten aranır
+        for i, node in enumerate(nodes[:-1]):
+            targets = nodes[i + 1:]
+            distances, parents = self.cluster_search(cluster, node, targets)
+            for other in targets:
+                if other in distances:
+                    edges[node][other] = edges[other][node] = distances[other]
+                    path = array('i', trace_path(parents, other))
+                    paths[node, other] = path
+                    paths[other, node] = path[::-1]
+        self.intra_edges[cluster] = edges
+        self.intra_paths[cluster] = paths
+    
+    def rebuild(self):
+        """Soyut grafı baştan oluştur"""
+        self.border_transitions = {}
+        self.inter_edges = {}
+        self.intra_edges = {}
+        self.intra_paths = {}
+        clusters = [(cluster_x, cluster_y) for cluster_y in range(self.clusters_y)
+                    for cluster_x in range(self.clusters_x)]
+        for cluster in clusters:
+            for border in self.cluster_borders(cluster):
+                if border[0] == cluster:
+                    self._build_border(border)
+        for cluster in clusters:
+            self._build_cluster(cluster)
+        self.dirty_borders.clear()
+        self.dirty_clusters.clear()
+        self.needs_rebuild = False
+    
+    def update(self):
+        """
+        Bekleyen değişiklikleri uygula
+        
+        Returns:
+            int: Küme içi kenarları yeniden hesaplanan küme sayısı
+        """
+        if self.needs_rebuild:
+            self.rebuild()
+            return self.clusters_x * self.clusters_y
+        
+        clusters = set(self.dirty_clusters)
+        for border in self.dirty_borders:
+            self._build_border(border)
+            clusters.update(border)
+        for cluster in clusters:
+            self._build_cluster(cluster)
+        self.dirty_borders.clear()
+        self.dirty_clusters.clear()
+        return len(clusters)
+    
+    # Arama
+    
+    def cluster_search(self, cluster, source, targets=()):
+        """
+        Küme dışına çıkmadan source'tan Dijkstra
+        
+        Args:
+            targets: Hepsi bulununca arama durur (boşsa tüm küme)
+        
+        Returns:
+            tuple: (mesafeler, parent'lar) sözlükleri
+        """
+        neighbor_indices = self.graph.neighbor_indices
+        width = self.graph.width
+        x0, x1, y0, y1 = self.cluster_bounds(cluster)
+        first, last = y0 * width, y1 * width
+        remaining = set(targets)
+        remaining.discard(source)
+        
+        distances = {source: 0}
+        parents = {source: -1}
+        heap = [(0, source)]
+        while heap and (remaining or not targets):
+            distance, current = heapq.heappop(heap)
+            if distance > distances[current]:
+                continue
+            remaining.discard(current)
+            for neighbor, cost in neighbor_indices(current):
+                if not first <= neighbor < last or not x0 <= neighbor % width < x1:
+                    continue
+                new_distance = distance + cost
+                if new_distance < distances.get(neighbor, INFINITY):
+                    distances[neighbor] = new_distance
+                    parents[neighbor] = current
+                    heapq.heappush(heap, (new_distance, neighbor))
+        return distances, parents
+    
+    def _abstract_search(self, start, goal, start_edges, goal_edges):
+        """Soyut grafta A*; soyut düğüm listesi ya da None"""
+        width = self.graph.width
+        size = self.cluster_size
+        intra_edges = self.intra_edges
+        inter_edges = self.inter_edges
+        goal_y, goal_x = divmod(goal, width)
+        costs = (self.graph.straight_cost, self.graph.diagonal_cost)
+        no_edges = {}
+        
+        g_costs = {start: 0}
+        parents = {start: -1}
+        closed = set()
+        heap = [(0, 0, start)]
+        expanded = 0
+        while heap:
+            _, current_g, current = heapq.heappop(heap)
+            if current in closed:
+                continue
+            if current == goal:
+                return trace_path(parents, current), expanded
+            closed.add(current)
+            expanded += 1
+            
+            # Başlangıç bir geçiş hücresi de olabilir: kendi soyut kenarları da açılır
+            y, x = divmod(current, width)
+            cluster_edges = intra_edges.get((x // size, y // size), no_edges)
+            neighbors = list(cluster_edges.get(current, no_edges).items())
+            neighbors.extend(inter_edges.get(current, no_edges).items())
+            if current == start:
+                neighbors.extend(start_edges.items())
+            if current in goal_edges:
+                neighbors.append((goal, goal_edges[current]))
+            
+            for neighbor, cost in neighbors:
+                new_g = current_g + cost
+                if neighbor not in closed and new_g < g_costs.get(neighbor, INFINITY):
+                    g_costs[neighbor] = new_g
+                    parents[neighbor] = current
+                    y, x = divmod(neighbor, width)
+                    heapq.heappush(heap, (new_g + octile_cost(x, y, goal_x, goal_y, *costs), new_g, neighbor))
+        return None, expanded
+    
+    def search(self, start, goal):
+        """
+        start -> goal arası yol ara (bkz. AStar.search)
+        
+        Returns:
+            tuple: (path, success, stats)
+        """
+        self.update()
+        graph = self.graph
+        width = graph.width
+        start_index = start.y * width + start.x
+        goal_index = goal.y * width + goal.x
+        start_cluster = self.cluster_of(start_index)
+        goal_cluster = self.cluster_of(goal_index)
+        
+        if start_cluster == goal_cluster:
+            # Yakın sorgu: düz A* zaten küçük bir bölgeyi arar
+            return self.astar.search(start, goal)
+        
+        # Başlangıç / hedefi kendi kümelerinin geçiş hücrelerine bağla
+        start_nodes = self._cluster_nodes(start_cluster)
+        goal_nodes = self._cluster_nodes(goal_cluster)
+        start_distances, start_parents = self.cluster_search(start_cluster, start_index, start_nodes)
+        goal_distances, goal_parents = self.cluster_search(goal_cluster, goal_index, goal_nodes)
+        start_edges = {node: start_distances[node] for node in start_nodes if node in start_distances}
+        goal_edges = {node: goal_distances[node] for node in goal_nodes if node in goal_distances}
+        
+        abstract_path, expanded = self._abstract_search(start_index, goal_index,
+                                                        start_edges, goal_edges)
+        if abstract_path is None:
+            # Soyut grafta görünmeyen (köşe) geçişler için düz A*
+            path, success, stats = self.astar.search(start, goal)
+            stats['abstract_nodes_explored'] = expanded
+            return path, success, stats
+        
+        # Soyut yolu hücre yoluna aç: uç parçalar bağlama aramalarından,
+        # küme içi parçalar kayıtlı yollardan, kümeler arası adımlar tek hücre
+        indices = [start_index]
+        for previous, current in zip(abstract_path, abstract_path[1:]):
+            cluster = self.cluster_of(previous)
+            if cluster != self.cluster_of(current):
+                indices.append(current)
+            elif previous == start_index:
+                indices.extend(trace_path(start_parents, current)[1:])
+            elif current == goal_index:
+                indices.extend(reversed(trace_path(goal_parents, previous)[:-1]))
+            else:
+                indices.extend(self.intra_paths[cluster][previous, current][1:])
+        
+        path = [graph.node_at(index) for index in indices]
+        stats = self.astar._make_stats(expanded, 0, len(path), True, 0)
+        stats['abstract_path_length'] = len(abstract_path)
+        return path, True, stats
+    
+    def find_path(self):
+        """graph.start_node -> graph.goal_node (bkz. AStar.find_path)"""
+        if not self.graph.start_node or not self.graph.goal_node:
+            return [], False, "Başlangıç veya hedef düğüm belirlenmemiş"
+        return self.search(self.graph.start_node, self.graph.goal_node)
@@ -0,0 +1,326 @@
+"""
+Jump Point Search (JPS / JPS+)
+Eşit maliyetli 8 yönlü grid'ler için A* hızlandırması
+
+Düz ve çapraz (Graph.straight_cost / diagonal_cost) hareketlerde simetrik yolların çoğu budanır; sadece
+"atlama noktaları" (jump point) open set'e girer. Çapraz hareket her zaman
+serbest olduğu için (Graph.get_neighbors ile aynı kurallar) PathFinding.js
+"always move diagonal" budama kuralları kullanılır.
+
+JPS+ modunda (use_jump_table=True) 4 düz yön için bir sonraki atlama
+noktasına / duvara olan uzaklıklar önceden hesaplanır; düz atlamalar tek
+bir tablo okumasına iner. Tablo geçilebilirlik değiştiğinde
+(Graph.passability_version) yeniden oluşturulur; başlangıç / hedef
+taşımak tabloyu bozmaz.
+"""
+
+from array import array
+import numpy as np
+from astar import AStar, INFINITY
+from graph import GridPoint, SearchScratch, WALL, UNTOUCHED, OPEN, CLOSED
+from open_set import create_open_set
+from step_log import StepEvent, BEGIN
+
+
+def _sign(value):
+    return (value > 0) - (value < 0)
+
+
+class JumpPointSearch(AStar):
+    """Jump Point Search - AStar ile aynı arayüz"""
+    
+    def __init__(self, graph, heuristic_name='octile', open_set='auto', use_jump_table=True):
+        # Budama kuralları çapraz adımın düz adımdan ucuz, iki düz adımdan
+        # pahalı olmadığını varsayar
+        if not graph.straight_cost <= graph.diagonal_cost <= 2 * graph.straight_cost:
+            raise ValueError(f"JPS bu maliyet modelini desteklemiyor: "
+                             f"({graph.straight_cost}, {graph.diagonal_cost})")
+        super().__init__(graph, heuristic_name, open_set)
+        self.use_jump_table = use_jump_table
+        
+        # Kenarları duvarla çevrili (width + 2) x (height + 2) geçilebilirlik
+        # dizisi; sınır kontrolü yapmadan komşulara bakmak için
+        self._grid_version = None
+        self._passable = None
+        self._row = 0
+        self._jump_table = None
+        self._scratch_pool = []
+    
+    def _prepare(self):
+        """Geçilebilirlik dizisini ve atlama tablosunu güncel tut"""
+        graph = self.graph
+        if self._grid_version == graph.passability_version:
+            return
+        
+        padded = np.zeros((graph.height + 2, graph.width + 2), dtype=np.uint8)
+        padded[1:-1, 1:-1] = graph.grid != WALL
+        
+        jump_table = None
+        if self.use_jump_table:
+            jump_table = build_jump_table(padded.astype(bool))
+        
+        if self._passable is None or padded.size != len(self._passable):
+            self._scratch_pool = []
+        self._passable = bytearray(padded.tobytes())
+        self._row = graph.width + 2
+        self._jump_table = jump_table
+        self._grid_version = graph.passability_version
+    
+    def _iter_search(self, start, goal, step_by_step):
+        """start -> goal arası JPS ile yol ara (bkz. AStar._iter_search)"""
+        self._prepare()
+        try:
+            scratch = self._scratch_pool.pop()
+        except IndexError:
+            scratch = SearchScratch(len(self._passable))
+        try:
+            return (yield from self._search(scratch, start, goal, step_by_step))
+        finally:
+            self._scratch_pool.append(scratch)
+    
+    def _search(self, scratch, start, goal, step_by_step):
+        graph = self.graph
+        passable = self._passable
+        row = self._row
+        jump_table = self._jump_table
+        heuristic = self.heuristic_func
+        width = graph.width
+        straight_cost, diagonal_cost = graph.straight_cost, graph.diagonal_cost
+        
+        start_index = (start.y + 1) * row + start.x + 1
+        goal_index = (goal.y + 1) * row + goal.x + 1
+        goal_x, goal_y = goal.x + 1, goal.y + 1
+        if step_by_step:
+            yield StepEvent(-1, 0, 0, BEGIN, (), [start.y * width + start.x], False, None)
+        
+        def jump_straight(index, dx, dy):
+            """index'ten (dx, dy) yönünde düz atla, atlama noktası ya da -1"""
+            step = dx + dy * row
+            
+            if jump_table is not None:
+                distance = jump_table[(dx, dy)][index]
+                # Hedef bu ışın üzerinde mi?
+                if dx:
+                    on_ray = goal_y == index // row
+                    offset = (goal_x - index % row) * dx
+                else:
+                    on_ray = goal_x == index % row
+                    offset = (goal_y - index // row) * dy
+                if on_ray and 0 < offset <= abs(distance):
+                    return goal_index
+                return index + distance * step if distance > 0 else -1
+            
+            side = row if dx else 1
+            while True:
+                index += step
+                if not passable[index]:
+                    return -1
+                if index == goal_index:
+                    return index
+                if ((passable[index + step + side] and not passable[index + side]) or
+                        (passable[index + step - side] and not passable[index - side])):
+                    return index
+        
+        def jump(index, dx, dy):
+            """index'ten (dx, dy) yönünde atla, atlama noktası ya da -1"""
+            if not (dx and dy):
+                return jump_straight(index, dx, dy)
+            
+            step = dx + dy * row
+            vertical = dy * row
+            while True:
+                index += step
+                if not passable[index]:
+                    return -1
+                if index == goal_index:
+                    return index
+                # Zorunlu komşu var mı?
+                if ((passable[index - dx + vertical] and not passable[index - dx]) or
+                        (passable[index + dx - vertical] and not passable[index - vertical])):
+                    return index
+                # Yatay / dikey atlama noktası var mı?
+                if jump_straight(index, dx, 0) != -1 or jump_straight(index, 0, dy) != -1:
+                    return index
+        
+        def directions(index, parent):
+            """Budanmış arama yönleri"""
+            if parent == -1:
+                return ((-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1))
+            
+            dx = _sign(index % row - parent % row)
+            dy = _sign(index // row - parent // row)
+            result = []
+            if dx and dy:
+                if passable[index + dy * row]:
+                    result.append((0, dy))
+                if passable[index + dx]:
+                    result.append((dx, 0))
+                if passable[index + dx + dy * row]:
+                    result.append((dx, dy))
+                if not passable[index - dx]:
+                    result.append((-dx, dy))
+                if not passable[index - dy * row]:
+                    result.append((dx, -dy))
+            elif dx:
+                if passable[index + dx]:
+                    result.append((dx, 0))
+                if not passable[index + row]:
+                    result.append((dx, 1))
+                if not passable[index - row]:
+                    result.append((dx, -1))
+            else:
+                if passable[index + dy * row]:
+                    result.append((0, dy))
+                if not passable[index + 1]:
+                    result.append((1, dy))
+                if not passable[index - 1]:
+                    result.append((-1, dy))
+            return result
+        
+        def node(index):
+            return graph.get_node(index % row - 1, index // row - 1)
+        
+        def unpadded(index):
+            """Kenarlı dizi indeksini graf indeksine çevir (adım kaydı için)"""
+            return (index // row - 1) * width + index % row - 1
+        
+        generation = scratch.begin()
+        stamps = scratch.stamps
+        g_costs = scratch.g_costs
+        parents = scratch.parents
+        states = scratch.states
+        
+        stamps[start_index] = generation
+        g_costs[start_index] = 0
+        parents[start_index] = -1
+        states[start_index] = OPEN
+        
+        start_h = heuristic(start, goal)
+        open_set = create_open_set(self.resolve_open_set_type())
+        open_set.push(start_index, start_h, start_h)
+        
+        nodes_explored = 0
+        nodes_in_open = 0
+        step_count = 0
+        pushed = None
+        
+        while open_set:
+            f_cost, h_cost, current = open_set.pop()
+            
+            if current == goal_index:
+                path = self._expand_path(parents, goal_index, node)
+                if step_by_step:
+                    step_count += 1
+                    yield StepEvent(unpadded(current), g_costs[current], h_cost, 'goal_reached',
+                                    (), (), False, path)
+                stats = self._make_stats(nodes_explored, nodes_in_open, len(path), True, step_count)
+                return path, True, stats
+            
+            states[current] = CLOSED
+            nodes_explored += 1
+            current_g = g_costs[current]
+            current_x, current_y = current % row, current // row
+            if step_by_step:
+                pushed = []
+            
+            successors = []
+            for dx, dy in directions(current, parents[current]):
+                successor = jump(current, dx, dy)
+                if successor == -1:
+                    continue
+                successors.append(successor)
+                
+                if stamps[successor] != generation:
+                    stamps[successor] = generation
+                    g_costs[successor] = INFINITY
+                    states[successor] = UNTOUCHED
+                elif states[successor] == CLOSED:
+                    continue
+                
+                # Atlama doğrusal olduğu için maliyet octile mesafesidir
+                distance_x = abs(successor % row - current_x)
+                distance_y = abs(successor // row - current_y)
+                diagonal = min(distance_x, distance_y)
+                cost = diagonal * diagonal_cost + (max(distance_x, distance_y) - diagonal) * straight_cost
+                
+                tentative_g_cost = current_g + cost
+                if tentative_g_cost < g_costs[successor]:
+                    parents[successor] = current
+                    g_costs[successor] = tentative_g_cost
+                    successor_h = heuristic(GridPoint(successor % row - 1, successor // row - 1), goal)
+                    open_set.push(successor, tentative_g_cost + successor_h, successor_h)
+                    if states[successor] != OPEN:
+                        states[successor] = OPEN
+                        nodes_in_open += 1
+                    if pushed is not None:
+                        pushed.append(unpadded(successor))
+            
+            if step_by_step:
+                step_count += 1
+                yield StepEvent(unpadded(current), current_g, h_cost, 'exploring',
+                                [unpadded(i) for i in successors], pushed, True, None)
+        
+        return [], False, self._make_stats(nodes_explored, nodes_in_open, 0, False, step_count)
+    
+    def _expand_path(self, parents, goal_index, node):
+        """Atlama noktalarını hücre hücre tam yola aç"""
+        row = self._row
+        jump_points = []
+        index = goal_index
+        while index != -1:
+            jump_points.append(index)
+            index = parents[index]
+        jump_points.reverse()
+        
+        path = [node(jump_points[0])]
+        for previous, target in zip(jump_points, jump_points[1:]):
+            step = (_sign(target % row - previous % row) +
+                    _sign(target // row - previous // row) * row)
+            index = previous
+            while index != target:
+                index += step
+                path.append(node(index))
+        return path
+
+
+def build_jump_table(passable):
+    """
+    JPS+ düz atlama tablosu
+    
+    Args:
+        passable: Kenarları duvar olan (height + 2, width + 2) bool dizi
+    
+    Returns:
+        dict: (dx, dy) -> array('i'); düz indeks i için değer k > 0 ise
+        i + k adımdaki hücre ilk atlama noktasıdır, k <= 0 ise atlama
+        noktası yoktur ve duvardan önce -k hücre geçilebilir
+    """
+    def east(grid):
+        height, width = grid.shape
+        # Doğuya giderken zorunlu komşusu olan hücreler
+        forced = np.zeros_like(grid)
+        forced[1:-1, 1:-1] = grid[1:-1, 1:-1] & (
+            (grid[2:, 2:] & ~grid[2:, 1:-1]) | (grid[:-2, 2:] & ~grid[:-2, 1:-1]))
+        event = ~grid | forced
+        
+        # Her hücre için sağındaki ilk olay (duvar ya da atlama noktası)
+        columns = np.broadcast_to(np.arange(width), grid.shape)
+        positions = np.where(event, columns, width)
+        next_at_or_after = np.minimum.accumulate(positions[:, ::-1], axis=1)[:, ::-1]
+        next_event = np.full(grid.shape, width)
+        next_event[:, :-1] = next_at_or_after[:, 1:]
+        
+        valid = next_event < width
+        safe = np.where(valid, next_event, 0)
+        is_jump_point = valid & np.take_along_axis(forced, safe, axis=1)
+        distance = next_event - columns
+        return np.where(is_jump_point, distance, -(distance - 1)).astype(np.int32)
+    
+    tables = {
+        (1, 0): east(passable),
+        (-1, 0): east(passable[:, ::-1])[:, ::-1],
+        (0, 1): east(passable.T).T,
+        (0, -1): east(passable.T[:, ::-1])[:, ::-1].T,
+    }
+    return {direction: array('i', np.ascontiguousarray(table).tobytes())
+            for direction, table in tables.items()}
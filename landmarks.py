@@ -0,0 +1,266 @@
+"""
+Landmark (ALT) heuristic - duvarları hesaba katan önişlemeli heuristic
+
+K landmark hücresi seçilir ve her birinden tam bir Dijkstra ile tüm
+hücrelere gerçek en kısa yol maliyeti hesaplanır. Üçgen eşitsizliğinden
+her landmark L için:
+    d(n, goal) >= |d(L, goal) - d(L, n)|
+Heuristic bu alt sınırların ve octile mesafesinin en büyüğüdür; tutarlı
+heuristic'lerin maksimumu olduğu için A* optimal kalır. Labirent gibi
+haritalarda octile'dan çok daha güçlüdür.
+
+Landmark'lar en uzak nokta yöntemiyle seçilir: her yeni landmark, seçilmiş
+olanlara en kısa mesafesi en büyük olan ulaşılabilir hücredir.
+
+Duvar eklemek mesafeleri sadece artırır, tablolar alt sınır olarak geçerli
+kalır. Bir hücre açıldığında (ya da grid toplu değiştiğinde) tablolar
+bayatlar ve rebuild() çağrılana kadar sadece octile kullanılır.
+
+Kayıt grafa bağlıdır: başka bir graftaki AStar(other, 'landmark') bu
+tabloları değil octile'ı kullanır; detach() kaydı da kaldırır.
+
+Kullanım:
+    landmark = LandmarkHeuristic(graph, landmark_count=8)
+    landmark.register()  # 'landmark' ismiyle HeuristicSelector'a eklenir
+    AStar(graph, 'landmark').find_path()
+    landmark.save('harita.landmarks.npz')  # haritanın yanına
+"""
+
+import hashlib
+from array import array
+import numpy as np
+from graph import WALL, OPEN, CLOSED
+from components import ComponentIndex
+from heuristics import (register_heuristic, unregister_heuristic, octile_for_costs,
+                        octile_batch_for_costs, REGISTERED_HEURISTICS)
+from open_set import create_open_set
+
+UNREACHED = 0xFFFFFFFF  # Landmark'tan ulaşılamayan hücrelerin tablo değeri
+GOAL_TERMS_LIMIT = 4096  # Önbellekte tutulan en fazla hedef sayısı
+
+
+def distance_table(graph, source):
+    """
+    source'tan tüm hücrelere Dijkstra en kısa yol maliyetleri
+    
+    Returns:
+        numpy.ndarray: uint32 mesafeler (ulaşılamayan hücreler UNREACHED)
+    """
+    neighbor_indices = graph.neighbor_indices
+    scratch = graph.acquire_scratch()
+    try:
+        generation = scratch.begin()
+        stamps = scratch.stamps
+        g_costs = scratch.g_costs
+        states = scratch.states
+        
+        stamps[source] = generation
+        g_costs[source] = 0
+        states[source] = OPEN
+        
+        open_set = create_open_set('bucket' if graph.integer_costs else 'lazy')
+        open_set.push(source, 0, 0)
+        
+        while open_set:
+            current_g, _, current = open_set.pop()
+            states[current] = CLOSED
+            for neighbor, cost in neighbor_indices(current):
+                if stamps[neighbor] != generation:
+                    stamps[neighbor] = generation
+                    g_costs[neighbor] = current_g + cost
+                    states[neighbor] = OPEN
+                    open_set.push(neighbor, current_g + cost, 0)
+                elif states[neighbor] != CLOSED and current_g + cost < g_costs[neighbor]:
+                    g_costs[neighbor] = current_g + cost
+                    open_set.push(neighbor, current_g + cost, 0)
+        
+        reached = np.frombuffer(scratch.stamps, dtype=np.uint32) == generation
+        distances = np.full(scratch.size, UNREACHED, dtype=np.uint32)
+        distances[reached] = np.frombuffer(scratch.g_costs, dtype=np.float64)[reached]
+    finally:
+        graph.release_scratch(scratch)
+    return distances
+
+
+def wall_fingerprint(graph):
+    """Duvar yerleşiminin özeti (kayıtlı tabloların hangi haritaya ait olduğu)"""
+    walls = np.ascontiguousarray(graph.cells == WALL)
+    digest = hashlib.sha1(walls.tobytes())
+    digest.update(f"{graph.width}x{graph.height}".encode())
+    return digest.hexdigest()
+
+
+class LandmarkHeuristic:
+    """
+    Grafa özel ALT heuristic'i - func(node, goal) olarak çağrılır
+    
+    Tablolar hücre başına K değer olacak şekilde (indeks * K + k) tek bir
+    uint32 dizisinde tutulur; diskte en küçük yeten tamsayı tipiyle saklanır.
+    
+    Eşzamanlı aramalar aynı nesneyi paylaşabilir: hedef başına terimler
+    değişmez bir tuple olarak hedef indeksine göre saklanır ve her çağrı
+    kendi hedefinin tuple'ını okur.
+    """
+    
+    def __init__(self, graph, landmark_count=8, landmarks=None, tables=None):
+        self.graph = graph
+        self.landmark_count = landmark_count
+        self.landmarks = []
+        self.tables = array('I')
+        self.stale = True
+        self.registered_name = None
+        
+        # Alt sınır olarak grafın maliyet modelindeki octile mesafesi
+        self._octile = octile_for_costs(graph.straight_cost, graph.diagonal_cost)
+        self._octile_batch = octile_batch_for_costs(graph.straight_cost, graph.diagonal_cost)
+        # hedef indeksi -> ((k, d(L_k, goal)), ...) - hedeften ulaşılan landmark'lar
+        self._goal_terms = {}
+        
+        if tables is not None:
+            self._set_tables(list(landmarks), tables)
+        else:
+            self.rebuild()
+        graph.add_listener(self._on_cell_changed)
+    
+    def detach(self):
+        """Graf dinleyicisini ve (register ile eklendiyse) heuristic kaydını kaldır"""
+        self.graph.remove_listener(self._on_cell_changed)
+        if REGISTERED_HEURISTICS.get(self.registered_name) is self:
+            unregister_heuristic(self.registered_name)
+        self.registered_name = None
+    
+    def _on_cell_changed(self, index, passable):
+        # Duvar eklemek alt sınırları bozmaz; açılan hücre kısayol olabilir
+        if index is None or passable:
+            self.stale = True
+    
+    def rebuild(self):
+        """Landmark'ları seç ve mesafe tablolarını yeniden hesapla"""
+        graph = self.graph
+        components = ComponentIndex(graph)
+        components.detach()
+        if not components.sizes:
+            self._set_tables([], [])
+            return
+        
+        # İlk landmark: en büyük bileşendeki bir hücreden en uzak hücre
+        largest = max(components.sizes, key=components.sizes.get)
+        seed = int(np.argmax(components.labels == largest))
+        nearest = distance_table(graph, seed).astype(np.int64)
+        landmarks = []
+        rows = []
+        for _ in range(self.landmark_count):
+            candidates = np.where(nearest == UNREACHED, -1, nearest)
+            landmark = int(np.argmax(candidates))
+            if candidates[landmark] <= 0 and landmarks:
+                break
+            row = distance_table(graph, landmark)
+            landmarks.append(landmark)
+            rows.append(row)
+            nearest = row.astype(np.int64) if len(landmarks) == 1 else np.minimum(nearest, row)
+        self._set_tables(landmarks, np.vstack(rows))
+    
+    def _set_tables(self, landmarks, tables):
+        """(K, hücre sayısı) boyutlu tabloyu hücre sıralı düz diziye yerleştir"""
+        size = self.graph.width * self.graph.height
+        tables = np.asarray(tables, dtype=np.uint32).reshape(len(landmarks), size)
+        self.landmarks = landmarks
+        self.landmark_count = len(landmarks)
+        self.tables = array('I', np.ascontiguousarray(tables.T).tobytes())
+        self._goal_terms = {}
+        self.stale = False
+    
+    def table(self):
+        """Tabloları (K, hücre sayısı) boyutlu numpy dizisi olarak döndür"""
+        count = self.landmark_count
+        flat = np.frombuffer(self.tables, dtype=np.uint32)
+        if not count:
+            return flat.reshape(0, self.graph.width * self.graph.height)
+        return flat.reshape(-1, count).T
+    
+    def goal_terms(self, goal_index):
+        """Hedefin (k, d(L_k, goal)) terimleri (önbellekli, değişmez tuple)"""
+        goal_terms = self._goal_terms
+        terms = goal_terms.get(goal_index)
+        if terms is None:
+            count = self.landmark_count
+            row = self.tables[goal_index * count:(goal_index + 1) * count]
+            terms = tuple((k, distance) for k, distance in enumerate(row) if distance != UNREACHED)
+            if len(goal_terms) >= GOAL_TERMS_LIMIT:
+                goal_terms.clear()
+            goal_terms[goal_index] = terms
+        return terms
+    
+    def __call__(self, node, goal):
+        estimate = self._octile(node, goal)
+        if self.stale:
+            return estimate
+        
+        width = self.graph.width
+        # Hedefin bileşenindeki landmark'lar; düğüm o bileşende değilse
+        # (UNREACHED) gerçek mesafe zaten sonsuzdur
+        base = (node.y * width + node.x) * self.landmark_count
+        tables = self.tables
+        for k, goal_distance in self.goal_terms(goal.y * width + goal.x):
+            difference = tables[base + k] - goal_distance
+            if difference < 0:
+                difference = -difference
+            if difference > estimate:
+                estimate = difference
+        return estimate
+    
+    def batch(self, xs, ys, goal_x, goal_y):
+        """Toplu biçim: batch(xs, ys, goal_x, goal_y) -> numpy dizisi"""
+        estimate = self._octile_batch(xs, ys, goal_x, goal_y)
+        if self.stale:
+            return estimate
+        
+        width = self.graph.width
+        table = self.table()
+        indices = ys * width + xs
+        for k, goal_distance in self.goal_terms(goal_y * width + goal_x):
+            difference = np.abs(table[k, indices].astype(np.int64) - goal_distance)
+            estimate = np.maximum(estimate, difference)
+        return estimate
+    
+    def register(self, name='landmark'):
+        """Bu heuristic'i bu grafa bağlı olarak isimle HeuristicSelector'a ekle"""
+        if self.registered_name is not None and self.registered_name != name:
+            if REGISTERED_HEURISTICS.get(self.registered_name) is self:
+                unregister_heuristic(self.registered_name)
+        self.registered_name = name
+        register_heuristic(name, self, integral=True, batch=self.batch, graph=self.graph, info={
+            'name': 'Landmark (ALT)',
+            'description': f'{self.landmark_count} landmark ile üçgen eşitsizliği alt sınırı. '
+                           'Duvarları hesaba katar.',
+            'admissible': True,
+            'consistent': True,
+            'best_for': 'Labirent, sabit harita üzerinde çok sorgu'
+        })
+        return self
+    
+    def save(self, filename):
+        """Tabloları diske yaz (numpy .npz, en küçük yeten tamsayı tipiyle)"""
+        table = self.table()
+        finite = table[table != UNREACHED]
+        limit = int(finite.max()) if finite.size else 0
+        if limit < 0xFFFF:
+            table = np.where(table == UNREACHED, 0xFFFF, table).astype(np.uint16)
+        np.savez_compressed(filename, landmarks=np.asarray(self.landmarks, dtype=np.int64),
+                            tables=table, fingerprint=wall_fingerprint(self.graph))
+    
+    @classmethod
+    def load(cls, filename, graph):
+        """
+        save() ile yazılmış tabloları yükle
+        
+        Raises:
+            ValueError: Tablolar bu grafın duvar yerleşimine ait değilse
+        """
+        with np.load(filename) as data:
+            if str(data['fingerprint']) != wall_fingerprint(graph):
+                raise ValueError("Landmark tabloları bu haritaya ait değil")
+            tables = data['tables']
+            if tables.dtype == np.uint16:
+                tables = np.where(tables == 0xFFFF, UNREACHED, tables.astype(np.uint32))
+            return cls(graph, landmarks=data['landmarks'].tolist(), tables=tables)
@@ -12,7 +12,8 @@ import time
 import random
 from graph import Graph, Node
 from astar import AStar, AStarVariant, path_cost, smooth_path
-from heuristics import HeuristicSelector, HEURISTIC_INFO
+from heuristics import HeuristicSelector, HEURISTIC_INFO, REGISTERED_HEURISTICS
+from parallel_compare import compare_heuristics_parallel
 from visualizer import AStarVisualizer, StatisticsVisualizer
 from realtime_visualizer import RealtimeAStarVisualizer, StepByStepVisualizer
 import matplotlib.pyplot as plt
@@ -214,28 +215,18 @@ def compare_all_heuristics(graph):
     print("TÜM HEURİSTİC'LERİ KARŞILAŞTIRMA")
     print(f"{'='*60}")
     
+    # register_heuristic ile eklenenler işçi süreçlerde bulunmaz
     heuristic_selector = HeuristicSelector()
-    heuristics = heuristic_selector.get_all_names()
+    heuristics = [name for name in heuristic_selector.get_all_names()
+                  if name not in REGISTERED_HEURISTICS]
     
-    results = {}
+    # Heuristic'ler paralel süreçlerde çalışır (bkz. parallel_compare.py)
+    print(f"\n{len(heuristics)} heuristic paralel test ediliyor...")
+    results = compare_heuristics_parallel(graph, heuristics)
     
-    for heuristic in heuristics:
-        print(f"\n{heuristic} test ediliyor...")
-        
-        astar = AStar(graph, heuristic)
-        start_time = time.time()
-        path, success, stats = astar.find_path(step_by_step=False)
-        end_time = time.time()
-        
-        results[heuristic] = {
-            'path': path,
-            'success': success,
-            'stats': stats,
-            'execution_time': end_time - start_time
-        }
-        
-        status = "✓" if success else "✗"
-        print(f"  {status} {heuristic}: {stats['nodes_explored']} düğüm keşfedildi")
+    for heuristic, result in results.items():
+        status = "✓" if result['success'] else "✗"
+        print(f"  {status} {heuristic}: {result['stats']['nodes_explored']} düğüm keşfedildi")
     
     StatisticsVisualizer.create_performance_table(results)
     return results
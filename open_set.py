@@ -0,0 +1,308 @@
+"""
+A* için open set (öncelik kuyruğu) yapıları
+Hazır fonksiyon kullanmadan yazılmıştır
+
+Tüm yapılar aynı arayüzü sunar:
+    push(index, f_cost, h_cost): Ekle ya da önceliği düşür (decrease-key)
+    pop(): En küçük (f, h) değerli girdiyi (f, h, index) olarak çıkar
+    peek_priority(): En küçük f değeri (alt sınır), boşsa sonsuz
+    indices(): Open set'teki düğüm indeksleri (adım kaydı için)
+    len(open_set), bool(open_set)
+
+Eşit f değerinde küçük h değerli (hedefe yakın) düğüm önce çıkar.
+"""
+
+import heapq
+
+
+INFINITY = float('inf')
+
+
+class OpenSet:
+    """Open set arayüzü"""
+    
+    def push(self, index, f_cost, h_cost):
+        """Düğümü ekle ya da daha küçük bir öncelikle güncelle"""
+        raise NotImplementedError
+    
+    def pop(self):
+        """En küçük öncelikli düğümü (f, h, index) olarak çıkar"""
+        raise NotImplementedError
+    
+    def peek_priority(self):
+        """En küçük f değerini döndür (bir alt sınır), boşsa sonsuz"""
+        raise NotImplementedError
+    
+    def indices(self):
+        """Open set'teki düğüm indekslerini döndür"""
+        raise NotImplementedError
+    
+    def __len__(self):
+        raise NotImplementedError
+    
+    def __bool__(self):
+        return len(self) > 0
+
+
+class LazyHeapOpenSet(OpenSet):
+    """
+    Tembel silmeli (lazy deletion) binary heap
+    
+    Öncelik düştüğünde eski girdi heap'te bırakılır ve yenisi eklenir.
+    pop() sırasında güncel önceliğe uymayan (bayat) girdiler atlanır.
+    """
+    
+    def __init__(self):
+        self.heap = []
+        self.entries = {}  # index -> güncel (f, h)
+    
+    def push(self, index, f_cost, h_cost):
+        current = self.entries.get(index)
+        if current is not None and current <= (f_cost, h_cost):
+            return
+        self.entries[index] = (f_cost, h_cost)
+        heapq.heappush(self.heap, (f_cost, h_cost, index))
+    
+    def pop(self):
+        heap = self.heap
+        entries = self.entries
+        while heap:
+            f_cost, h_cost, index = heapq.heappop(heap)
+            if entries.get(index) == (f_cost, h_cost):
+                del entries[index]
+                return f_cost, h_cost, index
+        raise IndexError('pop from empty open set')
+    
+    def peek_priority(self):
+        heap = self.heap
+        entries = self.entries
+        # Tepedeki bayat girdileri temizle
+        while heap and entries.get(heap[0][2]) != (heap[0][0], heap[0][1]):
+            heapq.heappop(heap)
+        return heap[0][0] if heap else INFINITY
+    
+    def indices(self):
+        return list(self.entries)
+    
+    def update(self, index, f_cost, h_cost):
+        """Önceliği koşulsuz değiştir (artırma dahil; D* Lite için)"""
+        if self.entries.get(index) == (f_cost, h_cost):
+            return
+        self.entries[index] = (f_cost, h_cost)
+        heapq.heappush(self.heap, (f_cost, h_cost, index))
+    
+    def discard(self, index):
+        """Düğümü open set'ten çıkar (yoksa bir şey yapma)"""
+        self.entries.pop(index, None)
+    
+    def peek(self):
+        """En küçük girdiyi (f, h, index) çıkarmadan döndür, boşsa None"""
+        heap = self.heap
+        entries = self.entries
+        while heap and entries.get(heap[0][2]) != (heap[0][0], heap[0][1]):
+            heapq.heappop(heap)
+        return heap[0] if heap else None
+    
+    def __contains__(self, index):
+        return index in self.entries
+    
+    def __len__(self):
+        return len(self.entries)
+
+
+class IndexedHeapOpenSet(OpenSet):
+    """
+    İndeksli binary heap (gerçek decrease-key)
+    
+    Her düğümün heap içindeki konumu tutulur; öncelik düştüğünde düğüm
+    yerinde yukarı kaydırılır. Heap'te bayat girdi bulunmaz.
+    """
+    
+    def __init__(self):
+        self.heap = []  # [f, h, index] listeleri
+        self.positions = {}  # index -> heap konumu
+    
+    def push(self, index, f_cost, h_cost):
+        position = self.positions.get(index)
+        if position is None:
+            self.heap.append([f_cost, h_cost, index])
+            position = len(self.heap) - 1
+            self.positions[index] = position
+        else:
+            entry = self.heap[position]
+            if (entry[0], entry[1]) <= (f_cost, h_cost):
+                return
+            entry[0] = f_cost
+            entry[1] = h_cost
+        self._sift_up(position)
+    
+    def pop(self):
+        heap = self.heap
+        if not heap:
+            raise IndexError('pop from empty open set')
+        
+        top = heap[0]
+        last = heap.pop()
+        del self.positions[top[2]]
+        if heap:
+            heap[0] = last
+            self.positions[last[2]] = 0
+            self._sift_down(0)
+        return top[0], top[1], top[2]
+    
+    def _sift_up(self, position):
+        heap = self.heap
+        positions = self.positions
+        entry = heap[position]
+        while position > 0:
+            parent = (position - 1) >> 1
+            parent_entry = heap[parent]
+            if entry < parent_entry:
+                heap[position] = parent_entry
+                positions[parent_entry[2]] = position
+                position = parent
+            else:
+                break
+        heap[position] = entry
+        positions[entry[2]] = position
+    
+    def _sift_down(self, position):
+        heap = self.heap
+        positions = self.positions
+        size = len(heap)
+        entry = heap[position]
+        while True:
+            child = 2 * position + 1
+            if child >= size:
+                break
+            if child + 1 < size and heap[child + 1] < heap[child]:
+                child += 1
+            if heap[child] < entry:
+                heap[position] = heap[child]
+                positions[heap[position][2]] = position
+                position = child
+            else:
+                break
+        heap[position] = entry
+        positions[entry[2]] = position
+    
+    def peek_priority(self):
+        return self.heap[0][0] if self.heap else INFINITY
+    
+    def indices(self):
+        return list(self.positions)
+    
+    def __len__(self):
+        return len(self.heap)
+
+
+class LegacyHeapOpenSet(OpenSet):
+    """
+    Eski davranış (sadece karşılaştırma / benchmark için)
+    
+    Open set'teki bir düğümün önceliği düştüğünde heap güncellenmez,
+    düğüm eski önceliğiyle çıkar. Bu yüzden yol optimal olmayabilir.
+    """
+    
+    def __init__(self):
+        self.heap = []
+        self.members = set()
+    
+    def push(self, index, f_cost, h_cost):
+        if index in self.members:
+            return
+        self.members.add(index)
+        heapq.heappush(self.heap, (f_cost, h_cost, index))
+    
+    def pop(self):
+        f_cost, h_cost, index = heapq.heappop(self.heap)
+        self.members.discard(index)
+        return f_cost, h_cost, index
+    
+    def peek_priority(self):
+        return self.heap[0][0] if self.heap else INFINITY
+    
+    def indices(self):
+        return [index for _, _, index in self.heap]
+    
+    def __len__(self):
+        return len(self.heap)
+
+
+class BucketOpenSet(OpenSet):
+    """
+    Tamsayı öncelikler için bucket kuyruğu
+    
+    Her f değeri için bir bucket tutulur; farklı f değerleri küçük bir
+    heap'te saklanır. Bucket'lar (h, index) heap'leridir: aynı f değerinde
+    küçük h önce çıkar (arayüz sözleşmesi, heap tabanlı yapılarla aynı
+    sıra). Heuristic tutarsız olsa bile (f azalırsa) doğru çalışır.
+    
+    Octile gibi tutarlı heuristic'lerde aramadaki farklı f değeri sayısı
+    çok azdır (400x300 haritada ~13000 pop için 24 değer); bucket'lar
+    büyüdüğü için iç heap'ler tek bir heap kadar pahalıdır ve lazy heap'e
+    göre ölçülebilir bir kazanç yoktur. Bu yüzden AStar 'auto' modunda bu
+    yapıyı seçmez; sadece açıkça istendiğinde kullanılır.
+    """
+    
+    def __init__(self):
+        self.buckets = {}  # f -> (h, index) heap'i
+        self.keys = []  # Boş olmayan bucket'ların f değerleri (heap)
+        self.entries = {}  # index -> güncel (f, h)
+    
+    def push(self, index, f_cost, h_cost):
+        current = self.entries.get(index)
+        if current is not None and current <= (f_cost, h_cost):
+            return
+        self.entries[index] = (f_cost, h_cost)
+        
+        bucket = self.buckets.get(f_cost)
+        if bucket is None:
+            bucket = self.buckets[f_cost] = []
+            heapq.heappush(self.keys, f_cost)
+        heapq.heappush(bucket, (h_cost, index))
+    
+    def pop(self):
+        buckets = self.buckets
+        keys = self.keys
+        entries = self.entries
+        while keys:
+            f_cost = keys[0]
+            bucket = buckets[f_cost]
+            while bucket:
+                h_cost, index = heapq.heappop(bucket)
+                if entries.get(index) == (f_cost, h_cost):
+                    del entries[index]
+                    if not bucket:
+                        del buckets[f_cost]
+                        heapq.heappop(keys)
+                    return f_cost, h_cost, index
+            del buckets[f_cost]
+            heapq.heappop(keys)
+        raise IndexError('pop from empty open set')
+    
+    def peek_priority(self):
+        # Bucket'lar bayat girdi içerebilir; en küçük anahtar yine de alt sınırdır
+        return self.keys[0] if self.entries else INFINITY
+    
+    def indices(self):
+        return list(self.entries)
+    
+    def __len__(self):
+        return len(self.entries)
+
+
+OPEN_SET_TYPES = {
+    'lazy': LazyHeapOpenSet,
+    'indexed': IndexedHeapOpenSet,
+    'bucket': BucketOpenSet,
+    'legacy': LegacyHeapOpenSet
+}
+
+
+def create_open_set(name):
+    """İsme göre boş bir open set oluştur"""
+    if name not in OPEN_SET_TYPES:
+        raise ValueError(f"Bilinmeyen open set tipi: {name} "
+                         f"(seçenekler: {', '.join(OPEN_SET_TYPES)})")
+    return OPEN_SET_TYPES[name]()
@@ -0,0 +1,137 @@
+"""
+Heuristic'lerin paralel karşılaştırılması
+Kullanım: python parallel_compare.py
+
+Graf hücreleri bir kez paylaşılan belleğe (multiprocessing.shared_memory)
+yazılır; her işçi süreç başlarken grafı oradan bir kez kurar. Sonra her
+heuristic ayrı bir süreçte kendi AStar nesnesiyle çalışır, ana süreçteki
+graf ve AStar nesneleri değiştirilmez.
+"""
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from multiprocessing import shared_memory
+import numpy as np
+from graph import Graph
+from heuristics import HeuristicSelector, REGISTERED_HEURISTICS
+
+
+# İşçi sürecin grafı (_init_worker ile bir kez kurulur)
+_worker_graph = None
+
+
+def _init_worker(shm_name, width, height):
+    """İşçi süreç başlangıcı: grafı paylaşılan bellekteki hücrelerden kur"""
+    global _worker_graph
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        cells = np.ndarray(width * height, dtype=np.uint8, buffer=shm.buf)
+        _worker_graph = Graph.from_cells(cells, width, height)
+    finally:
+        shm.close()
+
+
+def worker_graph():
+    """İşçi süreçteki graf (graph_worker_pool ile başlatılan süreçlerde)"""
+    return _worker_graph
+
+
+@contextmanager
+def graph_worker_pool(graph, max_workers=None):
+    """
+    Her işçisi graph'ın bir kopyasına sahip ProcessPoolExecutor
+    
+    Hücreler paylaşılan belleğe bir kez yazılır, işçiler grafı başlarken
+    oradan kurar; gönderilen görevler worker_graph() ile grafa erişir.
+    """
+    shm = shared_memory.SharedMemory(create=True, size=max(1, graph.cells.nbytes))
+    try:
+        np.ndarray(graph.cells.shape, dtype=np.uint8, buffer=shm.buf)[:] = graph.cells
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker,
+                                 initargs=(shm.name, graph.width, graph.height)) as executor:
+            yield executor
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def _run_heuristic(search_class, heuristic_name, open_set, repeats, weight):
+    """
+    Bir heuristic'i işçi süreçte çalıştır, en iyi süreyi döndür
+    
+    Raises:
+        ValueError: heuristic işçi süreçte tanımlı değilse (register_heuristic
+            ile ana süreçte eklenenler işçilere aktarılmaz)
+    """
+    if heuristic_name not in HeuristicSelector(_worker_graph).heuristics:
+        raise ValueError(f"'{heuristic_name}' heuristic'i işçi süreçte tanımlı değil "
+                         "(register_heuristic ile eklenen heuristic'ler paralel "
+                         "karşılaştırmada kullanılamaz)")
+    astar = search_class(_worker_graph, heuristic_name, open_set)
+    if weight != 1:
+        from astar import AStarVariant
+        AStarVariant.apply_weight(astar, weight)
+    best_time = float('inf')
+    for _ in range(repeats):
+        start_time = time.perf_counter()
+        path, success, stats = astar.find_path(step_by_step=False)
+        best_time = min(best_time, time.perf_counter() - start_time)
+    # Node nesneleri yerine koordinatlar gönderilir
+    return [(node.x, node.y) for node in path], success, astar.get_stats(), best_time
+
+
+def compare_heuristics_parallel(graph, heuristic_names=None, search_class=None,
+                                open_set='auto', repeats=1, max_workers=None, weight=1):
+    """
+    Heuristic'leri aynı graf üzerinde paralel süreçlerde çalıştır
+    
+    Args:
+        graph: Başlangıç ve hedefi belirlenmiş graf
+        heuristic_names: Karşılaştırılacak heuristic'ler (None: tüm hazır
+            heuristic'ler; register_heuristic ile eklenenler desteklenmez)
+        search_class: AStar ya da alt sınıfı (None: AStar)
+        open_set: AStar open set tipi
+        repeats: Her heuristic kaç kez çalıştırılsın (en iyi süre alınır)
+        max_workers: İşçi süreç sayısı (None: heuristic ve CPU sayısının küçüğü)
+        weight: Heuristic ağırlığı (bkz. AStarVariant.apply_weight,
+            AStar.heuristic_weight)
+    
+    Returns:
+        dict: heuristic -> {'path', 'success', 'stats', 'execution_time'}
+        (compare_all_heuristics ile aynı biçim, heuristic_names sırasıyla)
+    """
+    if search_class is None:
+        from astar import AStar
+        search_class = AStar
+    if heuristic_names is None:
+        heuristic_names = [name for name in HeuristicSelector().get_all_names()
+                           if name not in REGISTERED_HEURISTICS]
+    if max_workers is None:
+        max_workers = min(len(heuristic_names), os.cpu_count() or 1)
+    
+    with graph_worker_pool(graph, max_workers) as executor:
+        futures = [executor.submit(_run_heuristic, search_class, name, open_set, repeats, weight)
+                   for name in heuristic_names]
+        outcomes = [future.result() for future in futures]
+    
+    results = {}
+    for heuristic_name, (coordinates, success, stats, execution_time) in zip(heuristic_names, outcomes):
+        results[heuristic_name] = {
+            'path': [graph.get_node(x, y) for x, y in coordinates],
+            'success': success,
+            'stats': stats,
+            'execution_time': execution_time
+        }
+    return results
+
+
+if __name__ == "__main__":
+    import random
+    from main_realtime import create_large_graph
+    from visualizer import StatisticsVisualizer
+    
+    random.seed(42)
+    StatisticsVisualizer.create_performance_table(
+        compare_heuristics_parallel(create_large_graph(200, 150), repeats=3))
@@ -0,0 +1,158 @@
+"""
+Tekrarlanan sorgular için yol önbelleği
+
+Anahtar: (başlangıç, hedef, arama sınıfı, heuristic, maliyet modeli).
+En son kullanılan max_entries kayıt tutulur (LRU). Önbellek Graph'a
+dinleyici olarak bağlanır ve sadece etkilenen kayıtları siler:
+    Hücre duvar olduğunda: yolu o hücreden geçen kayıtlar
+    Hücre açıldığında: yolu bulunamamış kayıtlar ve o hücreden geçen bir
+        yolun alt sınırı (octile(start, c) + octile(c, goal)) kayıtlı
+        maliyetten küçük olan, yani kısalabilecek kayıtlar
+"""
+
+from collections import OrderedDict
+from array import array
+from astar import path_cost, INFINITY
+from graph import STRAIGHT_COST, DIAGONAL_COST
+
+
+def octile_cost(x1, y1, x2, y2, straight_cost=STRAIGHT_COST, diagonal_cost=DIAGONAL_COST):
+    """Engelsiz 8 yönlü gridde iki hücre arası en kısa yol maliyeti (alt sınır)"""
+    diagonal_cost = min(diagonal_cost, 2 * straight_cost)
+    dx = abs(x1 - x2)
+    dy = abs(y1 - y2)
+    diagonal = min(dx, dy)
+    return diagonal * diagonal_cost + (max(dx, dy) - diagonal) * straight_cost
+
+
+class PathCache:
+    """
+    Graf değişikliklerinde hassas şekilde geçersizlenen LRU yol önbelleği
+    
+    Kullanım:
+        astar.path_cache = PathCache(graph)
+        astar.find_path()  # adım kaydı olmayan aramalar önbellekten cevaplanır
+    """
+    
+    def __init__(self, graph, max_entries=10000):
+        self.graph = graph
+        self.max_entries = max_entries
+        self.entries = OrderedDict()  # anahtar -> (yol indeksleri, maliyet, stats)
+        self.cell_keys = {}  # hücre indeksi -> yolu o hücreden geçen anahtarlar
+        
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        
+        graph.add_listener(self._on_cell_changed)
+    
+    def detach(self):
+        """Graf dinleyicisini kaldır ve önbelleği boşalt"""
+        self.graph.remove_listener(self._on_cell_changed)
+        self.clear()
+    
+    def make_key(self, astar, start_index, goal_index):
+        """Sorgu anahtarı (maliyet modeli: grafın hareket maliyetleri)"""
+        costs = (self.graph.straight_cost, self.graph.diagonal_cost)
+        return (start_index, goal_index, type(astar).__name__, astar.heuristic_name, costs)
+    
+    def search(self, astar, start, goal):
+        """
+        astar.search(start, goal) sonucunu önbellekten ya da aramayla döndür
+        
+        Returns:
+            tuple: (path, success, stats)
+        """
+        graph = self.graph
+        width = graph.width
+        key = self.make_key(astar, start.y * width + start.x, goal.y * width + goal.x)
+        
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            path_indices, _, stats = entry
+            node_at = graph.node_at
+            return [node_at(index) for index in path_indices], bool(path_indices), dict(stats)
+        
+        self.misses += 1
+        path, success, stats = astar.search(start, goal)
+        self.store(key, path, success, stats)
+        return path, success, stats
+    
+    def store(self, key, path, success, stats):
+        """Arama sonucunu önbelleğe ekle"""
+        if key in self.entries:
+            self._remove(key)
+        width = self.graph.width
+        path_indices = array('i', (node.y * width + node.x for node in path))
+        cost = path_cost(path, self.graph) if success else INFINITY
+        self.entries[key] = (path_indices, cost, dict(stats))
+        for index in path_indices:
+            self.cell_keys.setdefault(index, set()).add(key)
+        
+        while len(self.entries) > self.max_entries:
+            self._remove(next(iter(self.entries)))
+            self.evictions += 1
+    
+    def _remove(self, key):
+        """Kaydı ve hücre indeksindeki referanslarını sil"""
+        path_indices, _, _ = self.entries.pop(key)
+        cell_keys = self.cell_keys
+        for index in path_indices:
+            keys = cell_keys.get(index)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del cell_keys[index]
+    
+    def _on_cell_changed(self, index, passable):
+        """Graph dinleyicisi: etkilenen kayıtları sil"""
+        if index is None:
+            self.invalidations += len(self.entries)
+            self.clear()
+            return
+        
+        if not passable:
+            # Sadece bu hücreden geçen yollar bozulur
+            stale = list(self.cell_keys.get(index, ()))
+        else:
+            # Açılan hücre daha kısa bir yol ya da yeni bir bağlantı sağlayabilir
+            width = self.graph.width
+            costs = (self.graph.straight_cost, self.graph.diagonal_cost)
+            y, x = divmod(index, width)
+            stale = []
+            for key, (_, cost, _) in self.entries.items():
+                if cost == INFINITY:
+                    stale.append(key)
+                    continue
+                start_y, start_x = divmod(key[0], width)
+                goal_y, goal_x = divmod(key[1], width)
+                if (octile_cost(start_x, start_y, x, y, *costs) +
+                        octile_cost(x, y, goal_x, goal_y, *costs) < cost):
+                    stale.append(key)
+        
+        for key in stale:
+            self._remove(key)
+        self.invalidations += len(stale)
+    
+    def clear(self):
+        """Tüm kayıtları sil (sayaçlar korunur)"""
+        self.entries.clear()
+        self.cell_keys.clear()
+    
+    def get_stats(self):
+        """Önbellek sayaçlarını döndür"""
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self.entries),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'evictions': self.evictions,
+            'invalidations': self.invalidations
+        }
+    
+    def __len__(self):
+        return len(self.entries)
@@ -7,6 +7,7 @@ import matplotlib.pyplot as plt
 import matplotlib.animation as animation
 import numpy as np
 from matplotlib.colors import ListedColormap
+from frame_buffer import BlitManager, GridFrameBuffer, build_static_layer, node_indices, paint_cells
 import time
 import threading
 from queue import Queue
@@ -28,6 +29,10 @@ class RealtimeAStarVisualizer:
         self.is_running = False
         self.pause_between_steps = 0.1  # Saniye
         
+        # Statik katman önbelleği (bkz. static_layer)
+        self._static_grid = None
+        self._static_version = None
+        
         # Renkler - daha canlı tonlar
         self.colors = {
             'empty': (0.95, 0.95, 0.95, 1.0),    # Açık gri
@@ -113,69 +118,47 @@ KONTROLLER:
         plt.tight_layout()
         return self.fig, self.ax
     
+    def static_layer(self):
+        """Statik katman (bkz. AStarVisualizer.static_layer)"""
+        if self._static_version != self.graph.version:
+            self._static_grid = build_static_layer(self.graph, self.color_values)
+            self._static_version = self.graph.version
+        return self._static_grid
+    
     def create_grid_array(self):
-        """Grid array oluştur"""
-        grid = np.zeros((self.graph.height, self.graph.width))
-        
-        for x in range(self.graph.width):
-            for y in range(self.graph.height):
-                node = self.graph.get_node(x, y)
-                if node:
-                    if node.node_type == 'wall':
-                        grid[y, x] = self.color_values['wall']
-                    elif node.node_type == 'start':
-                        grid[y, x] = self.color_values['start']
-                    elif node.node_type == 'goal':
-                        grid[y, x] = self.color_values['goal']
-                    else:
-                        grid[y, x] = self.color_values['empty']
-        
-        return grid
+        """Grid array oluştur (statik katmanın kopyası)"""
+        return self.static_layer().copy()
     
     def update_grid_realtime(self, step_info, path=None):
         """Grid'i real-time güncelle"""
         grid = self.create_grid_array()
+        cells = self.graph.cells
         
         if step_info:
             # Closed set (keşfedilen)
-            if 'closed_set' in step_info:
-                for node in step_info['closed_set']:
-                    if node.node_type == 'empty':
-                        grid[node.y, node.x] = self.color_values['explored']
+            closed_indices = np.asarray(step_info.get('closed_indices', ()), dtype=np.intp)
+            paint_cells(grid, cells, closed_indices, self.color_values['explored'])
             
             # Open set (frontier)
-            if 'open_set' in step_info:
-                for node in step_info['open_set']:
-                    if node.node_type == 'empty':
-                        grid[node.y, node.x] = self.color_values['frontier']
+            paint_cells(grid, cells, step_info.get('open_indices', ()),
+                        self.color_values['frontier'])
             
             # Considering neighbors (anlık olarak değerlendirilen)
-            if 'neighbors' in step_info:
-                for neighbor in step_info['neighbors']:
-                    if neighbor.node_type == 'empty' and not neighbor.visited:
-                        grid[neighbor.y, neighbor.x] = self.color_values['considering']
+            if 'neighbor_indices' in step_info:
+                neighbors = np.asarray(step_info['neighbor_indices'], dtype=np.intp)
+                neighbors = neighbors[~np.isin(neighbors, closed_indices)]
+                paint_cells(grid, cells, neighbors, self.color_values['considering'])
             
             # Current node (şu anki)
             if 'current' in step_info:
-                current = step_info['current']
-                if current.node_type == 'empty':
-                    grid[current.y, current.x] = self.color_values['current']
+                paint_cells(grid, cells, node_indices(self.graph, [step_info['current']]),
+                            self.color_values['current'])
         
         # Path (bulunan yol)
         if path:
-            for node in path:
-                if node.node_type == 'empty':
-                    grid[node.y, node.x] = self.color_values['path']
-        
-        # Start ve goal'ı her zaman göster
-        if self.graph.start_node:
-            start = self.graph.start_node
-            grid[start.y, start.x] = self.color_values['start']
-        
-        if self.graph.goal_node:
-            goal = self.graph.goal_node
-            grid[goal.y, goal.x] = self.color_values['goal']
+            paint_cells(grid, cells, node_indices(self.graph, path), self.color_values['path'])
         
+        # Start ve goal statik katmanda; sadece boş hücreler boyanır
         return grid
     
     def update_stats_display(self, step_info, is_finished=False, final_stats=None):
@@ -194,12 +177,12 @@ Heuristic: {final_stats["heuristic_used"]}
             stats_text = f"""
 🔄 Çalışıyor... Adım: {step_info["step"]}
 Mevcut Düğüm: ({current.x}, {current.y})
-G-cost: {current.g_cost:.1f}
-H-cost: {current.h_cost:.1f}
-F-cost: {current.f_cost:.1f}
+G-cost: {step_info["g_cost"]:.1f}
+H-cost: {step_info["h_cost"]:.1f}
+F-cost: {step_info["f_cost"]:.1f}
 
-Open Set: {len(step_info.get("open_set", []))} düğüm
-Closed Set: {len(step_info.get("closed_set", []))} düğüm
+Open Set: {step_info["open_count"]} düğüm
+Closed Set: {step_info["closed_count"]} düğüm
 İşlem: {step_info.get("action", "Keşfediyor")}
             """
         else:
@@ -236,48 +219,59 @@ Closed Set: {len(step_info.get("closed_set", []))} düğüm
         if interactive_mode:
             print("🎮 İnteraktif mod: ENTER ile adım adım ilerleyin")
         
-        # Algoritma adımlarını hesapla
-        path, success, final_stats = self.astar.find_path(step_by_step=True)
-        algorithm_steps = self.astar.algorithm_steps
-        
-        if not algorithm_steps:
-            print("❌ Algoritma adımları bulunamadı!")
-            return None
+        # Adımlar arama ilerledikçe üretilir; hiçbiri saklanmaz
+        events = self.astar.iter_steps()
+        frame_buffer = GridFrameBuffer(self.graph, self.color_values, show_considering=True)
+        self.grid_display.set_data(frame_buffer.frame)
         
-        print(f"📊 Toplam {len(algorithm_steps)} adım bulundu")
+        # Eksenler, legend vb. bir kez çizilir; her adımda sadece grid,
+        # istatistik kutusu ve başlık yeniden çizilir (blitting)
+        blit_manager = BlitManager(self.fig.canvas,
+                                   [self.grid_display, self.stats_text, self.ax.title])
+        plt.pause(0.001)
         
         try:
-            # Her adımı göster
-            for i, step_info in enumerate(algorithm_steps):
-                # Grid'i güncelle
-                grid = self.update_grid_realtime(step_info)
-                self.grid_display.set_array(grid)
-                
-                # İstatistikleri güncelle
-                self.update_stats_display(step_info)
-                
-                # Başlığı güncelle
-                progress = (i + 1) / len(algorithm_steps) * 100
-                self.ax.set_title(
-                    f'A* Real-time - {self.astar.heuristic_name} | '
-                    f'Adım {i+1}/{len(algorithm_steps)} (%{progress:.1f})',
-                    fontsize=16, fontweight='bold'
-                )
-                
-                # Çiz ve bekle
-                plt.draw()
-                plt.pause(0.001)  # Minimal pause for drawing
-                
-                if interactive_mode:
-                    input(f"Adım {i+1} - Devam etmek için ENTER'a basın...")
-                else:
-                    time.sleep(self.pause_between_steps)
+            # Hata ya da kesinti olsa da artist'ler normal çizime döner
+            try:
+                # Her adımı göster (sadece adımda değişen hücreler güncellenir)
+                for event in events:
+                    step_info = frame_buffer.apply(event)
+                    if step_info is None:
+                        continue
+                    step_count = step_info['step']
+                    
+                    # Grid'i güncelle
+                    self.grid_display.set_data(frame_buffer.frame)
+                    
+                    # İstatistikleri güncelle
+                    self.update_stats_display(step_info)
+                    
+                    # Başlığı güncelle
+                    self.ax.set_title(
+                        f'A* Real-time - {self.astar.heuristic_name} | Adım {step_count}',
+                        fontsize=16, fontweight='bold'
+                    )
+                    
+                    # Çiz ve bekle
+                    blit_manager.update()
+                    
+                    if interactive_mode:
+                        input(f"Adım {step_count} - Devam etmek için ENTER'a basın...")
+                    else:
+                        time.sleep(self.pause_between_steps)
+            finally:
+                blit_manager.close()
+            
+            path, success, final_stats = self.astar.last_result
+            if not isinstance(final_stats, dict):
+                print(f"❌ {final_stats}")
+                return None
             
             # Son durumu göster - bulunan yol
             if success:
                 print("✅ Yol bulundu! Son durumu gösteriliyor...")
-                final_grid = self.update_grid_realtime(None, path)
-                self.grid_display.set_array(final_grid)
+                frame_buffer.show_path(path)
+                self.grid_display.set_data(frame_buffer.frame)
                 self.update_stats_display(None, True, final_stats)
                 
                 self.ax.set_title(
@@ -298,7 +292,7 @@ Closed Set: {len(step_info.get("closed_set", []))} düğüm
             print(f"   • Başarı: {'Evet' if success else 'Hayır'}")
             print(f"   • Keşfedilen düğüm: {final_stats['nodes_explored']}")
             print(f"   • Yol uzunluğu: {final_stats['path_length']}")
-            print(f"   • Toplam adım: {len(algorithm_steps)}")
+            print(f"   • Toplam adım: {final_stats['total_steps']}")
             
             return self.fig, path, success, final_stats
             
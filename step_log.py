@@ -0,0 +1,283 @@
+"""
+Adım adım mod için kompakt adım kaydı (delta log)
+
+Her adımda open / closed set'in tamamı kopyalanmaz; sadece o adımda
+değişen düğüm indeksleri saklanır:
+    current: Open set'ten çıkarılan (pop) düğüm
+    closed: current closed set'e girdi mi
+    pushed: Open set'e eklenen ya da önceliği düşürülen düğümler
+    neighbors: Bakılan komşular (görselleştirme için)
+
+Herhangi bir adımın open / closed set'i, en yakın ara kopyadan (snapshot)
+başlayarak delta'lar tekrar uygulanıp (replay) istendiğinde oluşturulur.
+Bellek kullanımı adım sayısıyla doğrusal büyür.
+
+Arama sırasında adımlar StepEvent olarak üretilir (bkz. AStar.iter_steps).
+İlk olay her zaman 'begin' olayıdır; pushed alanı başlangıçtaki open set'i
+içerir ve bir adım sayılmaz. StepLog olayları saklar, StepTracker ise
+saklamadan sadece güncel open / closed set'i tutar (sabit bellek).
+"""
+
+from array import array
+from collections import namedtuple
+
+
+# Adım tipleri (bytearray içinde kodları saklanır)
+ACTIONS = ('exploring', 'goal_reached', 'exploring_forward', 'exploring_backward')
+ACTION_CODES = {name: code for code, name in enumerate(ACTIONS)}
+
+# Arama başlangıcı olayı (pushed: başlangıçtaki open set)
+BEGIN = 'begin'
+
+# Tek bir arama adımı; alanlar StepLog.record argümanlarıyla aynı sırada
+StepEvent = namedtuple('StepEvent', ('current', 'g_cost', 'h_cost', 'action', 'neighbors',
+                                     'pushed', 'closed', 'path'))
+
+
+def apply_event(event, open_indices, closed_indices):
+    """Olayın delta'sını open / closed set'lere uygula"""
+    open_indices.discard(event.current)
+    if event.closed:
+        closed_indices.add(event.current)
+    open_indices.update(event.pushed)
+
+
+def make_step_info(graph, step, event, open_indices, closed_indices):
+    """Adım sözlüğünü oluştur (düğüm nesneleriyle)"""
+    node_at = graph.node_at
+    step_info = {
+        'step': step,
+        'current': node_at(event.current),
+        'g_cost': event.g_cost,
+        'h_cost': event.h_cost,
+        'f_cost': event.g_cost + event.h_cost,
+        'action': event.action,
+        'open_set': [node_at(i) for i in open_indices],
+        'closed_set': {node_at(i) for i in closed_indices},
+        'open_count': len(open_indices),
+        'closed_count': len(closed_indices),
+        # Düz hücre indeksleri (görselleştirmede dizi indekslemesi için)
+        'open_indices': array('i', open_indices),
+        'closed_indices': array('i', closed_indices)
+    }
+    if event.action == 'goal_reached':
+        step_info['path'] = event.path
+    else:
+        step_info['neighbors'] = [node_at(i) for i in event.neighbors]
+        step_info['neighbor_indices'] = array('i', event.neighbors)
+    return step_info
+
+
+class StepLog:
+    """
+    Bir aramanın adım kaydı
+    
+    Liste gibi kullanılabilir: len(log), log[i], log[-1] ve for döngüsü
+    eski adım sözlükleriyle aynı anahtarları içeren sözlükler döndürür.
+    """
+    
+    def __init__(self, graph, snapshot_interval=1000):
+        """
+        Args:
+            graph: Düğüm nesneleri için graf
+            snapshot_interval: Kaç adımda bir open / closed set'in tam kopyası
+                tutulacağı (None ya da 0: hiç tutma, replay hep baştan yapılır)
+        """
+        self.graph = graph
+        self.snapshot_interval = snapshot_interval or 0
+        self.begin(())
+    
+    def begin(self, initial_open):
+        """Kaydı sıfırla; initial_open arama başındaki open set indeksleri"""
+        self.initial_open = array('i', initial_open)
+        self.currents = array('i')
+        self.g_costs = array('d')
+        self.h_costs = array('d')
+        self.actions = bytearray()
+        self.closes = bytearray()
+        self.pushed = array('i')
+        self.pushed_offsets = array('I', [0])
+        self.neighbors = array('i')
+        self.neighbor_offsets = array('I', [0])
+        self.path = None
+        self.snapshots = {}  # adım indeksi -> (open indeksleri, closed indeksleri)
+        
+        # Kayıt sırasındaki güncel durum (sadece snapshot almak için)
+        self._open = set(self.initial_open) if self.snapshot_interval else None
+        self._closed = set() if self.snapshot_interval else None
+        # Son replay sonucu; sıralı erişimde kaldığı yerden devam edilir
+        self._cursor = None
+    
+    def add(self, event):
+        """Arama olayını (StepEvent) kaydet"""
+        if event.action == BEGIN:
+            self.begin(event.pushed)
+        else:
+            self.record(*event)
+    
+    def record(self, current, g_cost, h_cost, action, neighbors=(), pushed=(),
+               closed=True, path=None):
+        """
+        Bir adım ekle
+        
+        Args:
+            current: Open set'ten çıkarılan düğümün indeksi
+            g_cost, h_cost: current'ın maliyetleri
+            action: ACTIONS içindeki adım tipi
+            neighbors: Bakılan komşu indeksleri
+            pushed: Open set'e eklenen / güncellenen indeksler
+            closed: current closed set'e eklendi mi
+            path: Hedefe ulaşıldıysa bulunan yol
+        """
+        self.currents.append(current)
+        self.g_costs.append(g_cost)
+        self.h_costs.append(h_cost)
+        self.actions.append(ACTION_CODES[action])
+        self.closes.append(1 if closed else 0)
+        self.pushed.extend(pushed)
+        self.pushed_offsets.append(len(self.pushed))
+        self.neighbors.extend(neighbors)
+        self.neighbor_offsets.append(len(self.neighbors))
+        if path is not None:
+            self.path = path
+        
+        if self.snapshot_interval:
+            step_index = len(self.currents) - 1
+            self._apply(step_index, self._open, self._closed)
+            if (step_index + 1) % self.snapshot_interval == 0:
+                self.snapshots[step_index] = (array('i', self._open), array('i', self._closed))
+    
+    def event(self, step_index):
+        """step_index adımını StepEvent olarak döndür"""
+        action = ACTIONS[self.actions[step_index]]
+        return StepEvent(
+            self.currents[step_index],
+            self.g_costs[step_index],
+            self.h_costs[step_index],
+            action,
+            self.neighbors[self.neighbor_offsets[step_index]:self.neighbor_offsets[step_index + 1]],
+            self.pushed[self.pushed_offsets[step_index]:self.pushed_offsets[step_index + 1]],
+            bool(self.closes[step_index]),
+            self.path if action == 'goal_reached' else None
+        )
+    
+    def _apply(self, step_index, open_indices, closed_indices):
+        """step_index adımının delta'sını open / closed set'lere uygula"""
+        current = self.currents[step_index]
+        open_indices.discard(current)
+        if self.closes[step_index]:
+            closed_indices.add(current)
+        open_indices.update(self.pushed[self.pushed_offsets[step_index]:
+                                        self.pushed_offsets[step_index + 1]])
+    
+    def replay(self, step_index):
+        """
+        step_index adımından sonraki open / closed set'leri oluştur
+        
+        Returns:
+            tuple: (open indeksleri, closed indeksleri) kümeleri. Kümeler
+            sonraki replay çağrılarında kullanılır, değiştirilmemeli ve
+            saklanmamalıdır.
+        """
+        if step_index < 0:
+            step_index += len(self)
+        if not 0 <= step_index < len(self):
+            raise IndexError('step index out of range')
+        
+        # En yakın snapshot (yoksa arama başı)
+        base = -1
+        if self.snapshot_interval:
+            base = (step_index + 1) // self.snapshot_interval * self.snapshot_interval - 1
+        
+        cursor = self._cursor
+        if cursor is not None and base <= cursor[0] <= step_index:
+            start, open_indices, closed_indices = cursor
+        elif base >= 0:
+            snapshot_open, snapshot_closed = self.snapshots[base]
+            start, open_indices, closed_indices = base, set(snapshot_open), set(snapshot_closed)
+        else:
+            start, open_indices, closed_indices = -1, set(self.initial_open), set()
+        
+        for index in range(start + 1, step_index + 1):
+            self._apply(index, open_indices, closed_indices)
+        
+        self._cursor = (step_index, open_indices, closed_indices)
+        return open_indices, closed_indices
+    
+    def get_step_info(self, step_index):
+        """Adımın bilgisini sözlük olarak döndür (replay ile)"""
+        if step_index < 0:
+            step_index += len(self)
+        open_indices, closed_indices = self.replay(step_index)
+        return self._make_step_info(step_index, open_indices, closed_indices)
+    
+    def _make_step_info(self, step_index, open_indices, closed_indices):
+        """Adım sözlüğünü oluştur (düğüm nesneleriyle)"""
+        return make_step_info(self.graph, step_index + 1, self.event(step_index),
+                              open_indices, closed_indices)
+    
+    def memory_usage(self):
+        """Kaydın dizilerinin yaklaşık bellek kullanımı (byte)"""
+        arrays = (self.currents, self.g_costs, self.h_costs, self.actions, self.closes,
+                  self.pushed, self.pushed_offsets, self.neighbors, self.neighbor_offsets)
+        total = sum(len(data) * data.itemsize if isinstance(data, array) else len(data)
+                    for data in arrays)
+        for snapshot_open, snapshot_closed in self.snapshots.values():
+            total += (len(snapshot_open) + len(snapshot_closed)) * snapshot_open.itemsize
+        return total
+    
+    def __len__(self):
+        return len(self.currents)
+    
+    def __bool__(self):
+        return len(self.currents) > 0
+    
+    def __getitem__(self, step_index):
+        return self.get_step_info(step_index)
+    
+    def __iter__(self):
+        """Adımları sırayla döndür (tek geçişte, kendi open / closed set'leriyle)"""
+        open_indices = set(self.initial_open)
+        closed_indices = set()
+        for step_index in range(len(self)):
+            self._apply(step_index, open_indices, closed_indices)
+            yield self._make_step_info(step_index, open_indices, closed_indices)
+
+
+class StepTracker:
+    """
+    Akış halindeki arama olaylarından adım sözlükleri oluşturur
+    
+    Olaylar saklanmaz; sadece güncel open / closed set tutulur. Bu yüzden
+    sadece sıradaki adıma ilerlenebilir (geri sarma için StepLog kullanın).
+    """
+    
+    def __init__(self, graph):
+        self.graph = graph
+        self.step = 0
+        self.open_indices = set()
+        self.closed_indices = set()
+    
+    def update(self, event):
+        """
+        Olayı uygula
+        
+        Returns:
+            dict: Adım sözlüğü ('begin' olayı için None)
+        """
+        if event.action == BEGIN:
+            self.step = 0
+            self.open_indices = set(event.pushed)
+            self.closed_indices = set()
+            return None
+        self.step += 1
+        apply_event(event, self.open_indices, self.closed_indices)
+        return make_step_info(self.graph, self.step, event,
+                              self.open_indices, self.closed_indices)
+    
+    def iter_step_infos(self, events):
+        """Olay akışındaki her adım için adım sözlüğü üret"""
+        for event in events:
+            step_info = self.update(event)
+            if step_info is not None:
+                yield step_info
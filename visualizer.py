@@ -7,6 +7,8 @@ import matplotlib.pyplot as plt
 import matplotlib.animation as animation
 import numpy as np
 from matplotlib.colors import ListedColormap
+from graph import WALL
+from frame_buffer import GridFrameBuffer, build_static_layer, node_indices, paint_cells
 import time
 
 
@@ -21,6 +23,10 @@ class AStarVisualizer:
         self.grid_display = None
         self.animation = None
         
+        # Statik katman önbelleği (bkz. static_layer)
+        self._static_grid = None
+        self._static_version = None
+        
         # Renkler
         self.colors = {
             'empty': (1.0, 1.0, 1.0, 1.0),      # Beyaz
@@ -56,65 +62,45 @@ class AStarVisualizer:
             'path': 7
         }
     
+    def static_layer(self):
+        """
+        Statik katman (önbellekli, graf değişince yeniden oluşturulur)
+        
+        Döndürülen dizi paylaşılır; değiştirmeden önce kopyalanmalıdır.
+        """
+        if self._static_version != self.graph.version:
+            self._static_grid = build_static_layer(self.graph, self.color_values)
+            self._static_version = self.graph.version
+        return self._static_grid
+    
     def create_grid_array(self):
-        """Graf durumunu numpy array'e çevir"""
-        grid = np.zeros((self.graph.height, self.graph.width))
-        
-        for x in range(self.graph.width):
-            for y in range(self.graph.height):
-                node = self.graph.get_node(x, y)
-                if node:
-                    if node.node_type == 'wall':
-                        grid[y, x] = self.color_values['wall']
-                    elif node.node_type == 'start':
-                        grid[y, x] = self.color_values['start']
-                    elif node.node_type == 'goal':
-                        grid[y, x] = self.color_values['goal']
-                    else:
-                        grid[y, x] = self.color_values['empty']
-        
-        return grid
+        """Graf durumunu numpy array'e çevir (statik katmanın kopyası)"""
+        return self.static_layer().copy()
     
     def update_grid_with_algorithm_state(self, grid, step_info=None, path=None):
         """Grid'i algoritma durumuna göre güncelle"""
         # Önce temiz grid'i al
         updated_grid = self.create_grid_array()
+        cells = self.graph.cells
         
         if step_info:
-            # Keşfedilen düğümleri işaretle
-            if 'closed_set' in step_info:
-                for node in step_info['closed_set']:
-                    if node.node_type == 'empty':
-                        updated_grid[node.y, node.x] = self.color_values['explored']
-            
-            # Frontier (open set) düğümlerini işaretle
-            if 'open_set' in step_info:
-                for node in step_info['open_set']:
-                    if node.node_type == 'empty':
-                        updated_grid[node.y, node.x] = self.color_values['frontier']
-            
-            # Mevcut düğümü işaretle
+            # Keşfedilen, frontier (open set) ve mevcut düğümleri işaretle
+            paint_cells(updated_grid, cells, step_info.get('closed_indices', ()),
+                        self.color_values['explored'])
+            paint_cells(updated_grid, cells, step_info.get('open_indices', ()),
+                        self.color_values['frontier'])
             if 'current' in step_info:
-                current = step_info['current']
-                if current.node_type == 'empty':
-                    updated_grid[current.y, current.x] = self.color_values['current']
+                paint_cells(updated_grid, cells, node_indices(self.graph, [step_info['current']]),
+                            self.color_values['current'])
         
         # Yolu çiz
         if path:
-            for node in path:
-                if node.node_type == 'empty':
-                    updated_grid[node.y, node.x] = self.color_values['path']
-        
-        # Başlangıç ve hedefi her zaman göster
-        if self.graph.start_node:
-            start = self.graph.start_node
-            updated_grid[start.y, start.x] = self.color_values['start']
-        
-        if self.graph.goal_node:
-            goal = self.graph.goal_node
-            updated_grid[goal.y, goal.x] = self.color_values['goal']
+            paint_cells(updated_grid, cells, node_indices(self.graph, path),
+                        self.color_values['path'])
         
+        # Başlangıç ve hedef statik katmanda; sadece boş hücreler boyanır
         return updated_grid
+    
     def setup_plot(self):
         """Plot'u kurulum"""
         self.fig, self.ax = plt.subplots(figsize=(12, 10))
@@ -169,12 +155,15 @@ class AStarVisualizer:
         self.ax.legend(handles=legend_elements, loc='center left', bbox_to_anchor=(1, 0.5))
     
     def animate_algorithm(self, interval=200, save_gif=False, filename='astar_animation.gif'):
-        """A* algoritmasını animasyonlu olarak çalıştır"""
-        # Önce algoritma adımlarını hesapla
-        path, success, stats = self.astar.find_path(step_by_step=True)
-        
-        if not self.astar.algorithm_steps:
-            print("Algoritma adımları bulunamadı!")
+        """
+        A* algoritmasını animasyonlu olarak çalıştır
+        
+        Arama animasyonla birlikte ilerler (AStar.iter_steps); adımlar
+        saklanmadığı için bellek kullanımı adım sayısından bağımsızdır. Her
+        karede sadece değişen hücreler güncellenir ve blitting kullanılır.
+        """
+        if not self.graph.start_node or not self.graph.goal_node:
+            print("Başlangıç veya hedef düğüm belirlenmemiş!")
             return None
         
         # Plot'u kur
@@ -185,14 +174,25 @@ class AStarVisualizer:
                                  fontsize=10, verticalalignment='top',
                                  bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.8))
         
-        def animate(frame):
-            if frame >= len(self.astar.algorithm_steps):
-                # Son frame - yolu göster
+        frame_buffer = GridFrameBuffer(self.graph, self.color_values)
+        self.grid_display.set_data(frame_buffer.frame)
+        
+        def frames():
+            """Her adım için olay, ardından son durum için 10 kez None"""
+            yield from self.astar.iter_steps()
+            for _ in range(10):  # Son durumu göstermek için ekstra frame
+                yield None
+        
+        def init():
+            stats_text.set_text('')
+            return [self.grid_display, stats_text]
+        
+        def animate(event):
+            if event is None:
+                # Son frame - yolu göster (yol yoksa son adım kalır)
+                path, success, stats = self.astar.last_result
                 if success:
-                    grid = self.update_grid_with_algorithm_state(None, None, path)
-                else:
-                    grid = self.update_grid_with_algorithm_state(None, 
-                                                               self.astar.algorithm_steps[-1], None)
+                    frame_buffer.show_path(path)
                 
                 stats_text.set_text(f'Tamamlandı!\n'
                                    f'Yol Bulundu: {"Evet" if success else "Hayır"}\n'
@@ -200,25 +200,22 @@ class AStarVisualizer:
                                    f'Yol Uzunluğu: {stats["path_length"]}\n'
                                    f'Toplam Adım: {stats["total_steps"]}')
             else:
-                # Normal frame
-                step_info = self.astar.algorithm_steps[frame]
-                grid = self.update_grid_with_algorithm_state(None, step_info, None)
-                
-                # İstatistikleri güncelle
-                stats_text.set_text(f'Adım: {step_info["step"]}\n'
-                                   f'Mevcut: ({step_info["current"].x}, {step_info["current"].y})\n'
-                                   f'Open Set: {len(step_info.get("open_set", []))}\n'
-                                   f'Closed Set: {len(step_info.get("closed_set", []))}\n'
-                                   f'İşlem: {step_info.get("action", "Bilinmiyor")}')
+                # Normal frame - sadece bu adımda değişen hücreler yazılır
+                step_info = frame_buffer.apply(event)
+                if step_info is not None:
+                    stats_text.set_text(f'Adım: {step_info["step"]}\n'
+                                       f'Mevcut: ({step_info["current"].x}, {step_info["current"].y})\n'
+                                       f'Open Set: {step_info["open_count"]}\n'
+                                       f'Closed Set: {step_info["closed_count"]}\n'
+                                       f'İşlem: {step_info.get("action", "Bilinmiyor")}')
             
-            self.grid_display.set_array(grid)
+            self.grid_display.set_data(frame_buffer.frame)
             return [self.grid_display, stats_text]
         
-        # Animasyonu oluştur
-        total_frames = len(self.astar.algorithm_steps) + 10  # Son durumu göstermek için ekstra frame
+        # Animasyonu oluştur; kare sayısı önceden bilinmez, kareler saklanmaz
         self.animation = animation.FuncAnimation(
-            self.fig, animate, frames=total_frames, interval=interval, 
-            blit=False, repeat=True
+            self.fig, animate, frames=frames, init_func=init, interval=interval, 
+            blit=True, repeat=True, cache_frame_data=False
         )
         
         # GIF olarak kaydet
@@ -229,6 +226,16 @@ class AStarVisualizer:
         
         return self.animation
     
+    def export_animation(self, filename, **options):
+        """
+        Aramayı figür çizmeden doğrudan dosyaya aktar (ekransız, CI için)
+        
+        Bkz. animation_export.export_search_animation (fps, duration,
+        frame_skip, cell_size, ...).
+        """
+        from animation_export import export_search_animation
+        return export_search_animation(self.astar, filename, **options)
+    
     def show_final_result(self, path=None, stats=None):
         """Son sonucu statik olarak göster"""
         self.setup_plot()
@@ -258,18 +265,56 @@ class AStarVisualizer:
         plt.tight_layout()
         return self.fig
     
+    def show_flow_field(self, flow_field, show_arrows=True, arrow_step=None):
+        """
+        Akış alanını (bkz. flow_field.py) ısı haritası olarak göster
+        
+        Args:
+            flow_field: FlowField nesnesi
+            show_arrows: Her hücrenin sonraki adım yönü ok olarak çizilsin mi
+            arrow_step: Ok seyreltme aralığı (None: en fazla ~40 ok/eksen)
+        """
+        self.fig, self.ax = plt.subplots(figsize=(12, 10))
+        width, height = self.graph.width, self.graph.height
+        
+        # Ulaşılamayan hücreler maskelenir; duvarlar koyu gri katmanda
+        distances = np.ma.masked_less(flow_field.distances, 0)
+        walls = np.ma.masked_where(self.graph.grid != WALL, np.ones((height, width)))
+        heatmap = self.ax.imshow(distances, cmap='viridis', interpolation='nearest')
+        self.ax.imshow(walls, cmap=ListedColormap([self.colors['wall']]),
+                       interpolation='nearest', vmin=0, vmax=1)
+        self.fig.colorbar(heatmap, ax=self.ax, label='Hedefe maliyet')
+        
+        if show_arrows:
+            step = arrow_step or max(1, max(width, height) // 40)
+            directions = flow_field.directions[::step, ::step]
+            ys, xs = np.mgrid[0:height:step, 0:width:step]
+            moving = directions.any(axis=-1)
+            self.ax.quiver(xs[moving], ys[moving],
+                           directions[..., 0][moving], directions[..., 1][moving],
+                           angles='xy', scale_units='xy', scale=1.5 / step,
+                           color='white', alpha=0.8)
+        
+        goal_x, goal_y = flow_field.goal
+        self.ax.plot(goal_x, goal_y, marker='*', markersize=15,
+                     color=self.colors['goal'], markeredgecolor='black')
+        
+        self.ax.set_xlim(-0.5, width - 0.5)
+        self.ax.set_ylim(-0.5, height - 0.5)
+        self.ax.set_aspect('equal')
+        self.ax.set_title('Akış Alanı - Hedefe Mesafe ve Yön', fontsize=14, fontweight='bold')
+        self.ax.set_xlabel('X Koordinatı')
+        self.ax.set_ylabel('Y Koordinatı')
+        
+        plt.tight_layout()
+        return self.fig
+    
     def compare_heuristics_visualization(self, heuristic_list):
-        """Farklı heuristic'leri karşılaştır"""
-        results = {}
-        
-        for heuristic_name in heuristic_list:
-            self.astar.change_heuristic(heuristic_name)
-            path, success, stats = self.astar.find_path(step_by_step=False)
-            results[heuristic_name] = {
-                'path': path,
-                'success': success,
-                'stats': stats
-            }
+        """Farklı heuristic'leri karşılaştır (paralel süreçlerde, bkz. parallel_compare.py)"""
+        from parallel_compare import compare_heuristics_parallel
+        results = compare_heuristics_parallel(self.graph, heuristic_list, type(self.astar),
+                                              self.astar.open_set_type,
+                                              weight=self.astar.heuristic_weight)
         
         # Karşılaştırma grafiği
         fig, axes = plt.subplots(2, len(heuristic_list)//2 + len(heuristic_list)%2, 
@@ -356,7 +401,7 @@ class StatisticsVisualizer:
         print("\n" + "="*80)
         print("HEURİSTİC PERFORMANS KARŞILAŞTIRMASI")
         print("="*80)
-        print(f"{'Heuristic':<20} {'Başarılı':<10} {'Keşfedilen':<12} {'Yol Uzunluğu':<15} {'Adım':<8}")
+        print(f"{'Heuristic':<20} {'Başarılı':<10} {'Keşfedilen':<12} {'Yol Uzunluğu':<15} {'Adım':<8} {'Süre (ms)':<10}")
         print("-"*80)
         
         for heuristic, result in results_dict.items():
@@ -364,7 +409,9 @@ class StatisticsVisualizer:
             explored = result['stats']['nodes_explored']
             path_len = result['stats']['path_length'] if result['success'] else 0
             steps = result['stats']['total_steps']
+            execution_time = result.get('execution_time')
+            elapsed = f"{execution_time * 1000:.2f}" if execution_time is not None else '-'
             
-            print(f"{heuristic:<20} {success:<10} {explored:<12} {path_len:<15} {steps:<8}")
+            print(f"{heuristic:<20} {success:<10} {explored:<12} {path_len:<15} {steps:<8} {elapsed:<10}")
         
         print("="*80)
\ No newline at end of file